@@ -1,16 +1,25 @@
 """
     Array-based implementation of SortedList ADT.
     Items to store should be of time ListItem.
+    Positions are found with bisect on the keys, and items are moved along the array in blocks (slices).
 """
 
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
 from referential_array import ArrayR
 from sorted_list import *
 
 __author__ = 'Maria Garcia de la Banda and Brendon Taylor. Modified by Alexey Ignatiev and Graeme Gange'
 __docformat__ = 'reStructuredText'
 
+KEY = attrgetter("key")    # key of a ListItem, for bisect
+
+
 class ArraySortedList(SortedList[T]):
-    """ SortedList ADT implemented with arrays. """
+    """ SortedList ADT implemented with arrays. Items of equal keys are kept in the order they were added. """
     MIN_CAPACITY = 1
 
     def __init__(self, max_capacity: int) -> None:
@@ -27,6 +36,20 @@ class ArraySortedList(SortedList[T]):
         size = max(self.MIN_CAPACITY, max_capacity)
         self.array = ArrayR(size)
 
+    @classmethod
+    def from_items(cls, items) -> ArraySortedList:
+        """ 
+        Build a sorted list of items (ListItem), sorting them once rather than adding them one at a time.
+        Items of equal keys keep their order in items.
+        :complexity: Best O(N), where N is the number of items, when they are already sorted
+                     Worst O(N log N), where N is the number of items
+        """
+        items = sorted(items, key=KEY)
+        sorted_list = cls(len(items))
+        sorted_list.array[:len(items)] = items
+        sorted_list.length = len(items)
+        return sorted_list
+
     def reset(self):
         """ 
         Reset the list.
@@ -65,14 +88,24 @@ class ArraySortedList(SortedList[T]):
 
     def __contains__(self, item: ListItem):
         """ 
-        Checks if value is in the list. 
-        :complexity: Best O(N*comp), where N is length of the array and comp is the cost of comparison      
-                     Worst O(N*comp), where N is length of the array and comp is the cost of comparison      
+        Checks if value is in the list, among the items of the same key. 
+        :complexity: Best O(log N + comp), where N is length of the list and comp is the cost of comparison, when the key is unique
+                     Worst O(log N + K*comp), where N is length of the list, K the number of items of the same key and comp is the cost of comparison
+        """
+        return self._find(item) >= 0
+
+    def _find(self, item: ListItem) -> int:
+        """ 
+        Position of item among the items of the same key, or -1.
+        :complexity: Best O(log N + comp), where N is length of the list and comp is the cost of comparison, when the key is unique
+                     Worst O(log N + K*comp), where N is length of the list, K the number of items of the same key and comp is the cost of comparison
         """
-        for i in range(len(self)):
+        low = bisect_left(self.array, item.key, 0, len(self), key=KEY)
+        high = bisect_right(self.array, item.key, low, len(self), key=KEY)
+        for i in range(low, high):
             if self.array[i] == item:
-                return True
-        return False
+                return i
+        return -1
 
     def _shuffle_right(self, index: int) -> None:
         """ 
@@ -80,8 +113,7 @@ class ArraySortedList(SortedList[T]):
         :complexity: Best O(N), where N is length of the array    
                      Worst O(N), where N is length of the array                    
         """
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
+        self.array[index + 1:len(self) + 1] = self.array[index:len(self)]
 
     def _shuffle_left(self, index: int) -> None:
         """ 
@@ -89,8 +121,7 @@ class ArraySortedList(SortedList[T]):
         :complexity: Best O(N), where N is length of the array    
                      Worst O(N), where N is length of the array  
         """
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i + 1]
+        self.array[index:len(self)] = self.array[index + 1:len(self) + 1]
 
     def _resize(self) -> None:
         """ 
@@ -102,8 +133,7 @@ class ArraySortedList(SortedList[T]):
         new_array = ArrayR(2 * len(self.array))
 
         # copying the contents
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+        new_array[:self.length] = self.array[:self.length]
 
         # referring to the new array
         self.array = new_array
@@ -124,12 +154,11 @@ class ArraySortedList(SortedList[T]):
     def index(self, item: ListItem) -> int:
         """ 
         Find the position of a given item in the list. 
-        :complexity:Best O(comp), when comp is the cost of comparison
-                    Worst O(log N + comp), where N is the length of the array, when index to add is not within the searching list, 
-                    comp is the cost of comparison     
+        :complexity:Best O(log N + comp), where N is the length of the list and comp is the cost of comparison, when the key is unique
+                    Worst O(log N + K*comp), where N is the length of the list, K the number of items of the same key and comp is the cost of comparison
         """
-        pos = self._index_to_add(item)
-        if pos < len(self) and self[pos] == item:
+        pos = self._find(item)
+        if pos >= 0:
             return pos
         raise ValueError('item not in list')
 
@@ -143,35 +172,23 @@ class ArraySortedList(SortedList[T]):
 
     def add(self, item: ListItem) -> None:
         """ 
-        Add new element to the list. 
-        :complexity: Best O(1), when index to add is directly at centre and no need to resize
-                     Worst O(N), where N is length of the array, when need to resize       
+        Add new element to the list, after the elements of the same key. 
+        :complexity: Best O(log N), where N is length of the list, when the item goes at the end and no need to resize
+                     Worst O(N), where N is length of the array, to move the elements after it or when need to resize
         """
         if self.is_full():
             self._resize()
 
-        # find where to place it
+        # find where to place it, the order is known to be right so the item is placed without checking it
         position = self._index_to_add(item)
-
-        self[position] = item
+        self._shuffle_right(position)
+        self.array[position] = item
         self.length += 1
 
     def _index_to_add(self, item: ListItem) -> int:
         """ 
-        Find the position where the new item should be placed. 
-        :complexity:Best O(1), when the index to add is directly at the centre.
-                    Worst O(log N), where N is the length of the array in ArraySortedList object, when index to add is not within the searching list.        
-        """
-        low = 0
-        high = len(self) - 1
-
-        while low <= high:
-            mid = (low + high) // 2
-            if self[mid].key < item.key:
-                low = mid + 1
-            elif self[mid].key > item.key:
-                high = mid - 1
-            else:
-                return mid
-
-        return low
+        Find the position where the new item should be placed, after the items of the same key. 
+        :complexity:Best O(log N), where N is the length of the list
+                    Worst O(log N), where N is the length of the list
+        """
+        return bisect_right(self.array, item.key, 0, len(self), key=KEY)
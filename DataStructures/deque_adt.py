@@ -0,0 +1,91 @@
+""" Deque ADT with a circular array implementation.
+
+Extends the circular queue with the operations at the other ends, so items can be
+added and removed at both the front and the rear in constant time.
+"""
+__docformat__ = 'reStructuredText'
+
+from queue_adt import CircularQueue
+from referential_array import T
+
+class CircularDeque(CircularQueue[T]):
+    """ Circular implementation of a double-ended queue with arrays.
+
+    append adds to the rear and serve removes from the front (inherited from CircularQueue),
+    push_front adds to the front and pop_back removes from the rear.
+
+    Attributes:
+         length (int): number of elements in the deque (inherited)
+         front (int): index of the element at the front of the deque (inherited)
+         rear (int): index of the first empty space at the back of the deque (inherited)
+         array (ArrayR[T]): array storing the elements of the deque (inherited)
+    """
+
+    def push_front(self, item: T) -> None:
+        """ Adds an element to the front of the deque.
+        :pre: deque is not full
+        :raises Exception: if the deque is full
+        :complexity:  Best O(1)
+                     Worst O(1)
+        """
+        if self.is_full():
+            raise Exception("Deque is full")
+
+        self.front = (self.front - 1) % len(self.array)
+        self.array[self.front] = item
+        self.length += 1
+
+    def pop_back(self) -> T:
+        """ Deletes and returns the element at the deque's rear.
+        :pre: deque is not empty
+        :raises Exception: if the deque is empty
+        :complexity:  Best O(1)
+                     Worst O(1)
+        """
+        if self.is_empty():
+            raise Exception("Deque is empty")
+
+        self.length -= 1
+        self.rear = (self.rear - 1) % len(self.array)
+        return self.array[self.rear]
+
+    def peek_front(self) -> T:
+        """ Returns the element at the deque's front without removing it.
+        :pre: deque is not empty
+        :raises Exception: if the deque is empty
+        :complexity:  Best O(1)
+                     Worst O(1)
+        """
+        if self.is_empty():
+            raise Exception("Deque is empty")
+        return self.array[self.front]
+
+    def peek_back(self) -> T:
+        """ Returns the element at the deque's rear without removing it.
+        :pre: deque is not empty
+        :raises Exception: if the deque is empty
+        :complexity:  Best O(1)
+                     Worst O(1)
+        """
+        if self.is_empty():
+            raise Exception("Deque is empty")
+        return self.array[(self.rear - 1) % len(self.array)]
+
+    def rotate(self, k: int = 1) -> None:
+        """ Moves the first k elements to the rear, in order (the last -k elements to the front if k is negative).
+        When the deque is full the elements are contiguous around the circle, so only front and rear move.
+        :complexity:  Best O(1), when the deque is full or empty
+                     Worst O(min(k, N - k)), where N is the length of the deque
+        """
+        n = len(self)
+        if n == 0:
+            return
+        k %= n
+        if self.is_full():
+            self.front = self.rear = (self.front + k) % len(self.array)
+        elif k <= n - k:
+            for _ in range(k):
+                self.append(self.serve())
+        else:
+            for _ in range(n - k):
+                self.push_front(self.pop_back())
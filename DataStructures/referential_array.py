@@ -12,16 +12,27 @@ space to hold the references.
 Note that while I do check the precondition in __init__ (noone else
 would), I do not check that of getitem or setitem, since that is already
 checked by self.array[index].
+
+ListArrayR is an alternative backend with the same interface: a list
+preallocated with None, whose indexing is done by the list itself
+rather than by Python methods around a ctypes array, so every read and
+write of the ADTs built on ArrayR is much cheaper. The backend is chosen
+when this module is first imported, by the environment variable
+ARRAYR_BACKEND: "ctypes" (the default) or "list".
+
+Both backends also read and write slices (a slice is written with a
+list of the same length), which the ADTs use to move blocks of items.
 """
 __author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for the rest"
 __docformat__ = 'reStructuredText'
 
+import os
 from ctypes import py_object
 from typing import TypeVar, Generic
 
 T = TypeVar('T')
 
-class ArrayR(Generic[T]):
+class CtypesArrayR(Generic[T]):
     def __init__(self, length: int) -> None:
         """ Creates an array of references to objects of the given length
         :complexity: O(length) for best/worst case to initialise to None
@@ -30,7 +41,7 @@ class ArrayR(Generic[T]):
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
         self.array = (length * py_object)() # initialises the space
-        self.array[:] =  [None for _ in range(length)]
+        self.array[:] = [None] * length
 
     def __len__(self) -> int:
         """ Returns the length of the array
@@ -51,3 +62,28 @@ class ArrayR(Generic[T]):
         :pre: index in between 0 and length - self.array[] checks it
         """
         self.array[index] = value
+
+
+class ListArrayR(list, Generic[T]):
+    """ Array of references of a fixed length, stored in a list.
+    __len__, __getitem__ and __setitem__ are those of list, O(1), and
+    check the index the same way as the ctypes array.
+    """
+    __slots__ = ()
+
+    def __init__(self, length: int) -> None:
+        """ Creates an array of references to objects of the given length
+        :complexity: O(length) for best/worst case to initialise to None
+        :pre: length > 0
+        """
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        list.__init__(self, [None] * length)
+
+
+BACKENDS = {"ctypes": CtypesArrayR, "list": ListArrayR}
+
+BACKEND = os.environ.get("ARRAYR_BACKEND", "ctypes")
+if BACKEND not in BACKENDS:
+    raise ValueError(f"ARRAYR_BACKEND must be one of {', '.join(BACKENDS)}, not {BACKEND!r}")
+ArrayR = BACKENDS[BACKEND]
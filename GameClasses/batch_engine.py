@@ -0,0 +1,299 @@
+from __future__ import annotations
+"""
+Struct-of-arrays battle engine for vectorised simulation of many battles at once (requires numpy).
+
+Every battle is a lane, and the state of the two pokemon on the field of every lane is stored in parallel arrays
+of shape (2, lanes) (species, level, hp, current hp, attack, speed, current speed, defence, status code, paralysed flag),
+row 0 for team 1 and row 1 for team 2. BatchBattle.step plays one round of every unfinished battle with numpy,
+following the rules of Battle.battle and the parameters of every species in the species registry (species.py),
+and every lane draws from its own LCG stream, so that a lane seeded with seed gives the same battle as
+Battle(rng=RandomGen(seed)).
+
+Only teams with the ALWAYS_ATTACK AI are supported: they never swap, heal or use special, so the pokemon of a team
+come out in the fixed order of its roster, and every pokemon waiting in the roster is untouched.
+Unittests (Test cases) for the module will be located under tests\test_batch_engine.py
+
+"""
+
+import numpy as np
+
+from poke_team import PokeTeam
+from pokemon_base import TYPE_EFFECTIVENESS_FLAT, TYPE_ID as TYPE_ID_OF, Status, STATUS_EFFECTS
+from species import SPECIES_TABLE
+from random_gen import RandomGen
+
+# species ids are pokedex - 1
+SPECIES_ID = {species.name: species.pokedex - 1 for species in SPECIES_TABLE}
+FREE, PARALYSIS = int(Status.FREE), int(Status.PARALYSIS)
+MAX_TEAM = PokeTeam.MAX_TEAM_SIZE
+
+def _column(values, dtype=np.int64) -> np.ndarray:
+    """ Array of the values of a field of the species registry, by species id """
+    return np.array(list(values), dtype=dtype)
+
+_TABLE = sorted(SPECIES_TABLE, key=lambda species: species.pokedex)
+
+# base stats, types and evolutions
+BASE_LEVEL = _column(s.level for s in _TABLE)
+BASE_HP = _column(s.hp for s in _TABLE)
+BASE_ATTACK = _column(s.attack for s in _TABLE)
+BASE_SPEED = _column(s.speed for s in _TABLE)
+BASE_DEFENCE = _column(s.defence for s in _TABLE)
+INFLICTS = _column(Status.of(s.status_inflicted) for s in _TABLE)
+TYPE_ID = _column(TYPE_ID_OF[s.poke_type] for s in _TABLE)
+TYPE_MULTIPLIER = np.frombuffer(TYPE_EFFECTIVENESS_FLAT).reshape(5, 5)[TYPE_ID[:, None], TYPE_ID[None, :]]   # by species
+EVOLVE_LEVEL = _column(s.evolve_level if s.can_evolve() else 0 for s in _TABLE)   # 0 if it cannot evolve
+EVOLVES_TO = _column(SPECIES_ID[s.evolves_to] if s.can_evolve() else i for i, s in enumerate(_TABLE))
+
+# effects of the statuses, by status code (see pokemon_base.STATUS_EFFECTS)
+ATTACK_MULTIPLIER = _column((effect.attack_multiplier for effect in STATUS_EFFECTS), np.float64)
+SELF_DAMAGE = _column(effect.self_damage for effect in STATUS_EFFECTS)
+CONFUSED = _column((effect.confused for effect in STATUS_EFFECTS), bool)
+HALVES_SPEED = _column((effect.halves_speed for effect in STATUS_EFFECTS), bool)
+
+# defend(damage): hp lost is damage * ABOVE_MUL if damage > DEF_MUL * defence + DEF_ADD (>= if not STRICT),
+# else damage // BELOW_DIV (no hp lost if BELOW_DIV is 0)
+DEF_MUL = _column(s.defend.mul for s in _TABLE)
+DEF_ADD = _column(s.defend.add for s in _TABLE)
+STRICT = _column((s.defend.strict for s in _TABLE), bool)
+ABOVE_MUL = _column(s.defend.above_mul for s in _TABLE)
+BELOW_DIV = _column(s.defend.below_div for s in _TABLE)
+
+# level_up(): every stat becomes KEEP * stat + ADD + HALF * (new level // 2), current hp changes as much as hp,
+# and speed follows the paralysis-aware rule of level_up only for species with SPEED_RULE
+HP_KEEP, HP_ADD, HP_HALF = (_column(g) for g in zip(*(s.hp_growth for s in _TABLE)))
+ATTACK_KEEP, ATTACK_ADD, ATTACK_HALF = (_column(g) for g in zip(*(s.attack_growth for s in _TABLE)))
+SPEED_RULE = _column((s.speed_growth is not None for s in _TABLE), bool)
+SPEED_KEEP, SPEED_ADD, SPEED_HALF = (_column(g) for g in zip(*(s.speed_growth or (1, 0, 0) for s in _TABLE)))
+DEFENCE_KEEP, DEFENCE_ADD, DEFENCE_HALF = (_column(g) for g in zip(*(s.defence_growth for s in _TABLE)))
+del _TABLE
+
+MASK = np.uint64(RandomGen.MOD - 1)
+LCG_A = np.uint64(RandomGen.A)
+LCG_C = np.uint64(RandomGen.C)
+
+
+def roster(team: PokeTeam) -> list[int]:
+    """
+    Species ids of the pokemon of team in the order they are retrieved. The team is regenerated afterwards.
+
+    :complexity: Best O(N*R), where N is the size of the team and R the complexity of retrieve_pokemon
+                 Worst O(N*R), where N is the size of the team and R the complexity of retrieve_pokemon
+    """
+    ids = []
+    poke = team.retrieve_pokemon()
+    while poke is not None:
+        ids.append(poke.pokedex - 1)
+        poke = team.retrieve_pokemon()
+    team.regenerate_team()
+    return ids
+
+
+class BatchBattle:
+    """
+    Many battles between teams with the ALWAYS_ATTACK AI, played round by round with numpy.
+
+    :complexity: step is O(L), where L is the number of lanes
+    """
+
+    def __init__(self, rosters1: list[list[int]], rosters2: list[list[int]], seeds: list[int]) -> None:
+        """
+        :param arg1: rosters1 (list[list[int]]) - species ids of team 1 of every battle, in retrieval order (see roster)
+        :param arg2: rosters2 (list[list[int]]) - species ids of team 2 of every battle, in retrieval order
+        :param arg3: seeds (list[int])          - seed of the random stream of every battle
+
+        :pre: the three lists have the same length, and every roster has 1 to MAX_TEAM_SIZE species ids
+
+        :complexity: Best O(L), where L is the number of lanes
+                     Worst O(L), where L is the number of lanes
+        """
+        try:
+            assert len(rosters1) == len(rosters2) == len(seeds), "There must be one roster of each team and one seed per battle"
+            assert all(0 < len(r) <= MAX_TEAM for r in list(rosters1) + list(rosters2)), "Rosters must have 1 to 6 pokemon"
+        except AssertionError as e:
+            raise ValueError(e)
+
+        lanes = len(seeds)
+        self.lanes = lanes
+        self.roster = np.full((2, lanes, MAX_TEAM), -1, dtype=np.int64)
+        self.size = np.zeros((2, lanes), dtype=np.int64)
+        for t, rosters in enumerate((rosters1, rosters2)):
+            for lane, r in enumerate(rosters):
+                self.roster[t, lane, :len(r)] = r
+                self.size[t, lane] = len(r)
+        self.position = np.zeros((2, lanes), dtype=np.int64)      # index in the roster of the pokemon on the field
+        self.rng = np.array([seed % RandomGen.MOD for seed in seeds], dtype=np.uint64)
+
+        self.species = np.zeros((2, lanes), dtype=np.int64)
+        self.level = np.zeros((2, lanes), dtype=np.int64)
+        self.hp = np.zeros((2, lanes), dtype=np.int64)
+        self.current_hp = np.zeros((2, lanes), dtype=np.int64)
+        self.attack_stat = np.zeros((2, lanes), dtype=np.int64)
+        self.speed = np.zeros((2, lanes), dtype=np.int64)
+        self.current_speed = np.zeros((2, lanes), dtype=np.int64)
+        self.defence = np.zeros((2, lanes), dtype=np.int64)
+        self.status = np.zeros((2, lanes), dtype=np.int64)
+        self.paralysed = np.zeros((2, lanes), dtype=bool)
+
+        self.active = np.ones(lanes, dtype=bool)
+        self.empty = np.zeros((2, lanes), dtype=bool)
+        self.rounds = np.zeros(lanes, dtype=np.int64)
+        self.result = np.full(lanes, -1, dtype=np.int64)
+
+        every = np.arange(lanes)
+        self._send_out(0, every)
+        self._send_out(1, every)
+
+    def _send_out(self, t: int, idx: np.ndarray) -> None:
+        """ Put the pokemon at the current roster position of team t on the field of the lanes idx, untouched """
+        sp = self.roster[t, idx, self.position[t, idx]]
+        self.species[t, idx] = sp
+        self.level[t, idx] = BASE_LEVEL[sp]
+        self.hp[t, idx] = self.current_hp[t, idx] = BASE_HP[sp]
+        self.attack_stat[t, idx] = BASE_ATTACK[sp]
+        self.speed[t, idx] = self.current_speed[t, idx] = BASE_SPEED[sp]
+        self.defence[t, idx] = BASE_DEFENCE[sp]
+        self.status[t, idx] = FREE
+        self.paralysed[t, idx] = False
+
+    def _chance(self, idx: np.ndarray, ratio: float) -> np.ndarray:
+        """ RandomGen.random_chance(ratio) on the streams of the lanes idx """
+        state = (self.rng[idx] * LCG_A + LCG_C) & MASK
+        self.rng[idx] = state
+        return (state >> np.uint64(16)).astype(np.float64) / (1 << 32) < ratio
+
+    def _paralysis(self, idx: np.ndarray) -> None:
+        """ PokemonBase.paralysis of both pokemon on the field of the lanes idx """
+        status = self.status[:, idx]
+        paralysed = self.paralysed[:, idx]
+        speed = self.speed[:, idx]
+        halves_speed = HALVES_SPEED[status]
+        halve = halves_speed & ~paralysed
+        restore = ~halves_speed & paralysed
+        self.current_speed[:, idx] = np.where(halve, speed // 2, np.where(restore, speed, self.current_speed[:, idx]))
+        self.paralysed[:, idx] = (paralysed | halve) & ~restore
+
+    def _attack(self, idx: np.ndarray, a: np.ndarray) -> None:
+        """ Battle.attack of the pokemon of team a[i] on the other pokemon, in the lanes idx[i] """
+        self._paralysis(idx)
+        d = 1 - a
+        attacker = self.species[a, idx]
+        status = self.status[a, idx]
+
+        # confused pokemon attack themselves half of the time
+        target = d.copy()
+        confused = CONFUSED[status]
+        if confused.any():
+            target[confused] = np.where(self._chance(idx[confused], 0.5), a[confused], d[confused])
+
+        defender = self.species[target, idx]
+        damage = (self.attack_stat[a, idx] * ATTACK_MULTIPLIER[status] * TYPE_MULTIPLIER[attacker, defender]).astype(np.int64)
+        threshold = DEF_MUL[defender] * self.defence[target, idx] + DEF_ADD[defender]
+        above = np.where(STRICT[defender], damage > threshold, damage >= threshold)
+        below = np.where(BELOW_DIV[defender] > 0, damage // np.maximum(BELOW_DIV[defender], 1), 0)
+        self.current_hp[target, idx] -= np.where(above, damage * ABOVE_MUL[defender], below)
+
+        # hp lost to own status
+        self.current_hp[a, idx] -= SELF_DAMAGE[status]
+
+        # 20% chance to inflict status, unless paralysing a paralysed pokemon
+        inflicted = INFLICTS[attacker]
+        hit = self._chance(idx, 0.2) & ~((inflicted == PARALYSIS) & self.paralysed[target, idx])
+        self.status[target[hit], idx[hit]] = inflicted[hit]
+
+    def _level_up(self, t: int, idx: np.ndarray) -> None:
+        """ level_up of the pokemon of team t on the field of the lanes idx """
+        sp = self.species[t, idx]
+        level = self.level[t, idx] + 1
+        half = level // 2
+        self.level[t, idx] = level
+        hp = self.hp[t, idx]
+        new_hp = HP_KEEP[sp] * hp + HP_ADD[sp] + HP_HALF[sp] * half
+        self.current_hp[t, idx] += new_hp - hp
+        self.hp[t, idx] = new_hp
+        self.attack_stat[t, idx] = ATTACK_KEEP[sp] * self.attack_stat[t, idx] + ATTACK_ADD[sp] + ATTACK_HALF[sp] * half
+        self.defence[t, idx] = DEFENCE_KEEP[sp] * self.defence[t, idx] + DEFENCE_ADD[sp] + DEFENCE_HALF[sp] * half
+
+        rule = SPEED_RULE[sp]
+        speed = self.speed[t, idx]
+        new_speed = np.where(rule, SPEED_KEEP[sp] * speed + SPEED_ADD[sp] + SPEED_HALF[sp] * half, speed)
+        unchanged = self.current_speed[t, idx] == speed
+        self.current_speed[t, idx] = np.where(rule & unchanged, new_speed, self.current_speed[t, idx])
+        self.paralysed[t, idx] &= ~rule | unchanged
+        self.speed[t, idx] = new_speed
+
+    def _evolve(self, t: int, idx: np.ndarray) -> None:
+        """ Replace the pokemon of team t on the field of the lanes idx by their evolved version """
+        sp = EVOLVES_TO[self.species[t, idx]]
+        difference = self.hp[t, idx] - self.current_hp[t, idx]
+        self.species[t, idx] = sp
+        self.level[t, idx] = BASE_LEVEL[sp]
+        self.hp[t, idx] = BASE_HP[sp]
+        self.current_hp[t, idx] = BASE_HP[sp] - difference
+        self.attack_stat[t, idx] = BASE_ATTACK[sp]
+        self.speed[t, idx] = self.current_speed[t, idx] = BASE_SPEED[sp]
+        self.defence[t, idx] = BASE_DEFENCE[sp]
+        self.paralysed[t, idx] = False
+
+    def step(self) -> int:
+        """
+        Play one round of every battle which has not ended.
+
+        :return: number of battles still going on
+
+        :complexity: Best O(L), where L is the number of lanes
+                     Worst O(L), where L is the number of lanes
+        """
+        idx = np.flatnonzero(self.active)
+        if len(idx) == 0:
+            return 0
+        self.rounds[idx] += 1
+
+        # both attack, the faster first (team 1 first on equal speed, and then both attack regardless of fainting)
+        self._paralysis(idx)
+        speed1, speed2 = self.current_speed[0, idx], self.current_speed[1, idx]
+        first = np.where(speed1 >= speed2, 0, 1)
+        self._attack(idx, first)
+        second = 1 - first
+        again = (speed1 == speed2) | (self.current_hp[second, idx] > 0)
+        self._attack(idx[again], second[again])
+
+        # both lose 1 hp if both are still alive
+        alive = self.current_hp[:, idx] > 0
+        both = idx[alive[0] & alive[1]]
+        self.current_hp[:, both] -= 1
+
+        # level up the survivor of a faint, then evolve
+        alive = self.current_hp[:, idx] > 0
+        self._level_up(0, idx[alive[0] & ~alive[1]])
+        self._level_up(1, idx[alive[1] & ~alive[0]])
+        for t in (0, 1):
+            sp = self.species[t, idx]
+            alive_t = self.current_hp[t, idx] > 0
+            self._evolve(t, idx[alive_t & (EVOLVE_LEVEL[sp] > 0) & (self.level[t, idx] >= EVOLVE_LEVEL[sp])])
+
+        # replace fainted pokemon by the next one of the roster
+        for t in (0, 1):
+            fainted = idx[self.current_hp[t, idx] <= 0]
+            self.position[t, fainted] += 1
+            left = self.position[t, fainted] < self.size[t, fainted]
+            self._send_out(t, fainted[left])
+            self.empty[t, fainted[~left]] = True
+
+        ended = idx[self.empty[0, idx] | self.empty[1, idx]]
+        self.active[ended] = False
+        self.result[ended] = np.where(self.empty[0, ended], np.where(self.empty[1, ended], 0, 2), 1)
+        return int(self.active.sum())
+
+    def run(self) -> np.ndarray:
+        """
+        Play every battle to the end.
+
+        :return: result of every battle, 0 for a draw, 1 or 2 for the winning team
+
+        :complexity: Best O(R*L), where R is the length of the longest battle and L the number of lanes
+                     Worst O(R*L), where R is the length of the longest battle and L the number of lanes
+        """
+        while self.step() > 0:
+            pass
+        return self.result
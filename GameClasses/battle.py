@@ -9,23 +9,58 @@ __author__ = "Scaffold by Jackson Goerner, Code by Lim Yi Xuan, Tee Zhi Hui, Kho
 
 from pokemon_base import PokemonBase
 from poke_team import Action, PokeTeam
-from print_screen import print_game_screen
+from random_gen import RandomGen
+from battle_cache import CachedBattle
+from battle_events import ConsoleLog, PokeState, BattleStart, Choices, Swap, Special, Heal, Speeds, AttackStart, \
+                          AttackResult, RoundDamage, LevelUp, Evolve, Faint, BattleEnd
 
 class Battle:
     """Battle logics and battle mechanics are implemented in this class for each battle object"""
-    def __init__(self, verbosity=0) -> None:
+
+    QUIET = 0       # verbosity level: no output at all, no screen rendering or log formatting
+    LOG = 1         # verbosity level: print the battle log (a ConsoleLog event sink)
+    SCREEN = 2      # verbosity level: print the battle log and render the game screen every round
+
+    def __init__(self, verbosity=0, rng=None, cache=None, store=None, metadata=None, renderer=None, recorder=None) -> None:
         """  
         This method is invoked automatically to set a newly created battle object's attributes to their initial states.
+        Events of the battle (see battle_events) are sent to the sinks subscribed with subscribe().
 
         :param: verbosity (int) - optional switch to enable more printing/logging, defaults to 0
-
-        :pre: None
+                                  0 (QUIET) prints nothing, 1 (LOG) prints the battle log,
+                                  2 (SCREEN) prints the battle log and the game screen every round
+        :param: rng (RandomGen) - random stream used by the battles, defaults to the default stream of RandomGen
+        :param: cache (BattleCache) - cache of the results of battles between fresh teams which are regenerated after the battle
+                                      (battle(..., regenerate=True)), defaults to None (no cache)
+        :param: store (ResultStore) - store every battle is recorded in, defaults to None (battles are not recorded)
+        :param: metadata (dict) - JSON serialisable details recorded with every battle in the store, defaults to None
+        :param: renderer (FrameRenderer) - renderer of the game screen at verbosity 2, defaults to full frames on stdout
+                                           (screen_renderer.terminal_renderer() only redraws what changed on a terminal)
+        :param: recorder (BattleRecorder) - recorder of every round of the battles (see replay), defaults to None
+
+        :pre: verbosity must be an integer greater or equal to 0, rng must be RandomGen (class or instance) or None
 
         :return: None
 
         :complexity: Best O(1), this function only assign values to variables
                      Worst O(1), this function only assign values to variables
         """
+        try:
+            assert isinstance(verbosity, int) and verbosity >= 0, "Verbosity must be an integer greater or equal to 0"
+            assert rng is None or rng is RandomGen or isinstance(rng, RandomGen), "rng must be RandomGen or an instance of RandomGen"
+        except AssertionError as e:
+            raise ValueError(e)
+
+        self.verbosity = verbosity
+        self.rng = RandomGen if rng is None else rng
+        self.cache = cache
+        self.store = store
+        self.metadata = {} if metadata is None else metadata
+        self.recorder = recorder
+        self.renderer = renderer     # made by the first frame when None, so a battle which does not render imports nothing for it
+        self.sinks = []
+        self.sink = None        # the callable events are emitted to, None when nobody is subscribed
+        self.rounds = 0
         self.result = None
         self.team1 = None
         self.team2 = None
@@ -33,6 +68,64 @@ class Battle:
         self.team2_poke = None
         self.choice1 = None
         self.choice2 = None
+        if verbosity >= Battle.LOG:
+            self.subscribe(ConsoleLog())
+
+    def subscribe(self, sink) -> None:
+        """
+        Send all future events of this battle to sink.
+
+        :param: sink (callable) - called with every event (see battle_events)
+
+        :pre: None
+
+        :return: None
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        self.sinks.append(sink)
+        self._update_sink()
+
+    def unsubscribe(self, sink) -> None:
+        """
+        Stop sending events to sink.
+
+        :param: sink (callable) - a sink previously subscribed
+
+        :pre: sink is subscribed to this battle
+
+        :return: None
+
+        :complexity: Best O(S), where S is the number of sinks subscribed
+                     Worst O(S), where S is the number of sinks subscribed
+        """
+        self.sinks.remove(sink)
+        self._update_sink()
+
+    def _update_sink(self) -> None:
+        """
+        Point self.sink to the single subscribed sink, to a broadcast to all of them, or None.
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        if len(self.sinks) == 0:
+            self.sink = None
+        elif len(self.sinks) == 1:
+            self.sink = self.sinks[0]
+        else:
+            self.sink = self._broadcast
+
+    def _broadcast(self, event) -> None:
+        """
+        Send event to every subscribed sink.
+
+        :complexity: Best O(S), where S is the number of sinks subscribed
+                     Worst O(S), where S is the number of sinks subscribed
+        """
+        for sink in self.sinks:
+            sink(event)
 
     def print_screen(self) -> None:
         """ 
@@ -47,16 +140,19 @@ class Battle:
         :complexity: Best O(N*M), where N is length of lines(height) for pokemon sprite, M is length of characters in line (width)for sprite
                      Worst O(N*M), where N is length of lines(height) for pokemon sprite, M is length of characters in line (width)for sprite
         """
+        from print_screen import render_game_window
+        from screen_renderer import FrameRenderer
+
+        if self.renderer is None:
+            self.renderer = FrameRenderer()
         # get the remaining number of pokemon in the teams
         remaining_team1_poke = len(self.team1.pokeTeamMembers) + 1
         remaining_team2_poke = len(self.team2.pokeTeamMembers) + 1
-        # print the game screen
-        print_game_screen(  self.team1_poke.poke_name, self.team2_poke.poke_name, self.team1_poke.get_hp(), self.team1_poke.hp,\
-                            self.team2_poke.get_hp(), self.team2_poke.hp, self.team1_poke.get_level(), self.team2_poke.get_level(),\
-                            self.team1_poke.status, self.team2_poke.status, remaining_team1_poke, remaining_team2_poke)
-        # display the current state of both teams
-        print(self.team1)
-        print(self.team2)
+        # draw the game screen, followed by the current state of both teams
+        window = render_game_window(self.team1_poke.poke_name, self.team2_poke.poke_name, self.team1_poke.get_hp(), self.team1_poke.hp,\
+                                    self.team2_poke.get_hp(), self.team2_poke.hp, self.team1_poke.get_level(), self.team2_poke.get_level(),\
+                                    self.team1_poke.status, self.team2_poke.status, remaining_team1_poke, remaining_team2_poke)
+        self.renderer.draw(window, [str(self.team1), str(self.team2)])
 
     def swap(self, team: PokeTeam, poke: PokemonBase) -> None:
         """  
@@ -72,13 +168,14 @@ class Battle:
         :complexity: Best O(N), where N is the length of pokeTeamMembers
                      Worst O(N^2), where N is the length of pokeTeamMembers
         """
-        print(f"{team.team_name} swapped out {poke} and got ", end = "")
+        old = PokeState.of(poke) if self.sink is not None else None
         # return current pokemon back to its team
         team.return_pokemon(poke)
         # retrieve a pokemon from the team again
         poke = team.retrieve_pokemon()
-        # display the pokemon retrieved
-        print(poke)
+        # emit the pokemon retrieved
+        if self.sink is not None:
+            self.sink(Swap(team.team_name, old, PokeState.of(poke)))
         # set pokemon retrieved as team1_poke or team2_poke depending on its team
         if team == self.team1:
             self.team1_poke = poke
@@ -98,15 +195,16 @@ class Battle:
         :complexity: Best O(N) where N is length of pokeTeamMembers
                      Worst O(N^2), where N is length of pokeTeamMembers
         """
-        print(f"{team.team_name} used special with {poke} and got ", end = "")
+        old = PokeState.of(poke) if self.sink is not None else None
         # returns current pokemon to its team
         team.return_pokemon(poke)
         # perform special action on team
         team.special()
         # retrieve a pokemon from the team
         poke = team.retrieve_pokemon()
-        # display pokemon retrieved
-        print(poke)
+        # emit pokemon retrieved
+        if self.sink is not None:
+            self.sink(Special(team.team_name, old, PokeState.of(poke)))
         # set pokemon retrieved as team1_poke or team2_poke depending on its team
         if team == self.team1:
             self.team1_poke = poke
@@ -133,7 +231,8 @@ class Battle:
         if team.heal_times <= 3:
             # heal the pokemon
             pokemon.heal()
-            print(f"{team.team_name} healed {pokemon}")
+            if self.sink is not None:
+                self.sink(Heal(team.team_name, PokeState.of(pokemon)))
 
     def attack(self, attacking_poke: PokemonBase, defending_poke: PokemonBase) -> None:
         """ 
@@ -150,12 +249,15 @@ class Battle:
                      Worst O(comp), where comp is the complexity of status comparison
         """
         # call paralysis() to check if the speed stat is halved when there is paralysis effect on either pokemon
-        attacking_poke.paralysis()
-        defending_poke.paralysis()
-        print(f"{attacking_poke} attacks {defending_poke}.")
+        sink = self.sink
+        attacking_poke.paralysis(sink)
+        defending_poke.paralysis(sink)
+        if sink is not None:
+            sink(AttackStart(PokeState.of(attacking_poke), PokeState.of(defending_poke)))
         # attacking pokemon attacks defending pokemon
-        attacking_poke.attack(defending_poke)
-        print(f"Result: {attacking_poke} {defending_poke}")
+        attacking_poke.attack(defending_poke, sink, self.rng)
+        if sink is not None:
+            sink(AttackResult(PokeState.of(attacking_poke), PokeState.of(defending_poke)))
 
     def both_attack(self) -> None:
         """ 
@@ -172,12 +274,13 @@ class Battle:
                      Worst O(comp), where comp is the complexity of status comparison
         """
         # call paralysis() to check if the speed stat is halved when there is paralysis effect on either pokemon
-        self.team1_poke.paralysis()
-        self.team2_poke.paralysis()
+        self.team1_poke.paralysis(self.sink)
+        self.team2_poke.paralysis(self.sink)
         # get current speed of both pokemon for comparison later
         poke1_current_spd = self.team1_poke.get_current_speed()
         poke2_current_spd = self.team2_poke.get_current_speed()
-        print(f"{self.team1_poke} has {poke1_current_spd} speed, and {self.team2.team_name}, {self.team2_poke} has {poke2_current_spd} speed")
+        if self.sink is not None:
+            self.sink(Speeds(PokeState.of(self.team1_poke), poke1_current_spd, self.team2.team_name, PokeState.of(self.team2_poke), poke2_current_spd))
 
         if poke1_current_spd == poke2_current_spd:
             # both pokemon attack each other regardless of fainting status if speed stat is the same
@@ -220,10 +323,11 @@ class Battle:
 
         # level up if there is eligible pokemon to level up
         if poke is not None:
-            print(f"{poke} levels up to ", end = "")
+            old = PokeState.of(poke) if self.sink is not None else None
             # level up the pokemon
             poke.level_up()
-            print(poke,"!")
+            if self.sink is not None:
+                self.sink(LevelUp(old, PokeState.of(poke)))
 
     def handle_evolve(self, poke: PokemonBase) -> None:
         """ 
@@ -240,10 +344,10 @@ class Battle:
         """
         # pokemon can be evolved if it has not fainted, can evolve, and reached evolve level
         if not poke.is_fainted() and poke.can_evolve() and poke.should_evolve():
-            print(f"{poke} evolved to ", end = "")
             # get the evolved version of current pokemon
             evolved_poke = poke.get_evolved_version()
-            print(evolved_poke)
+            if self.sink is not None:
+                self.sink(Evolve(PokeState.of(poke), PokeState.of(evolved_poke)))
             # set the current pokemon as the evolved pokemon
             if poke == self.team1_poke:
                 self.team1_poke = evolved_poke
@@ -266,7 +370,8 @@ class Battle:
         """
         # only enter if pokemon is fainted
         if poke.is_fainted():
-            print(poke.get_poke_name() + " is fainted!")
+            if self.sink is not None:
+                self.sink(Faint(poke.get_poke_name()))
             # return fainted pokemon back to its team
             team.return_pokemon(poke)       
             # retrieve pokemon from the team      
@@ -277,14 +382,18 @@ class Battle:
             elif team == self.team2:
                 self.team2_poke = poke
 
-    def battle(self, team1: PokeTeam, team2: PokeTeam) -> int:
+    def battle(self, team1: PokeTeam, team2: PokeTeam, regenerate: bool = False) -> int:
         """ 
         Performs the battle between team1 and team2. battle should return 0 1 or 2. 0 representing a draw, and 1 or 2 representing player 1 or player 2 winning respectively.
         Battle starts with both teams retrieving and choosing battle option, then the actions are handled in order of swap, special, heal, attacks.
         The rounds continue until either team is empty, or either team healed more than 3 times.
+        With regenerate, both teams are regenerated after the battle, for callers which do not look at the teams in the state the
+        battle leaves them in. Only those battles are looked up in the cache: a battle found there is not played, and the teams
+        are handed back regenerated all the same.
         
         :param arg1: team1 (PokeTeam) - Team 1 to battle
         :param arg2: team2 (PokeTeam) - Team 2 to battle
+        :param arg3: regenerate (bool) - regenerate both teams after the battle (default = False)
         
         :pre: None
         
@@ -293,93 +402,219 @@ class Battle:
         :complexity: Best O(R*N), where R is number of rounds until battle ends, N is the length of PokeTeamMembers
                      Worst O(R*N^2), where R is number of rounds until battle ends, N is the length of PokeTeamMembers    
         """       
+        seed = self.rng.seed
+        key = self.cache_key(team1, team2) if regenerate else None
+        cached = None if key is None else self.cache.get(key)
+        if cached is not None:
+            result = self.replay(team1, team2, cached)
+        else:
+            self.start(team1, team2)
+
+            # battle while either team not empty, heal_time of each team not exceed 3 (loop for R times, where R is number of rounds)
+            while (not (self.team1_poke is None or self.team2_poke is None)):
+                if not self.play_round():
+                    break
+
+            result = self.finish()
+            if key is not None:
+                self.cache.put(key, CachedBattle(result, self.rounds, self.rng.seed))
+            if regenerate:
+                team1.regenerate_team()
+                team2.regenerate_team()
+
+        if self.store is not None:
+            self.store.record(team1.spec(), team2.spec(), seed, result, self.rounds,
+                              {"team1": team1.team_name, "team2": team2.team_name, **self.metadata})
+        return result
 
-        # set both teams as the current battling team
+    def cache_key(self, team1: PokeTeam, team2: PokeTeam) -> tuple | None:
+        """ 
+        Key of the battle between team1 and team2 in the cache: the specs of the teams and the seed of the random stream.
+        Only quiet battles between fresh teams without the USER_INPUT AI are cached, since the result of any other battle
+        depends on more than the key or has effects besides the result.
+
+        :param arg1: team1 (PokeTeam) - Team 1 to battle
+        :param arg2: team2 (PokeTeam) - Team 2 to battle
+
+        :pre: None
+
+        :return: key (tuple), or None if there is no cache or the battle cannot be cached
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        if self.cache is None or self.sink is not None or self.verbosity >= Battle.SCREEN or self.recorder is not None:
+            return None
+        if not (team1.fresh and team2.fresh) or PokeTeam.AI.USER_INPUT in (team1.ai_type, team2.ai_type):
+            return None
+        return (team1.spec(), team2.spec(), self.rng.seed)
+
+    def replay(self, team1: PokeTeam, team2: PokeTeam, cached: CachedBattle) -> int:
+        """ 
+        Finish the battle between team1 and team2 from its cached outcome: the random stream is moved to where the battle
+        leaves it, so later draws are unchanged. The teams are not played and stay fresh, as battle(..., regenerate=True)
+        hands them back after playing.
+
+        :param arg1: team1 (PokeTeam) - Team 1 to battle
+        :param arg2: team2 (PokeTeam) - Team 2 to battle
+        :param arg3: cached (CachedBattle) - outcome of the battle
+
+        :pre: None
+
+        :return: result (int) - Integer representing result of battle, 0 is draw, 1 is team 1 win, 2 is team 2 wins.
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
         self.team1 = team1
         self.team2 = team2
+        self.team1_poke = None
+        self.team2_poke = None
+        self.rng.set_seed(cached.seed)
+        self.rounds = cached.rounds
+        self.result = cached.result
+        return self.result
+
+    def start(self, team1: PokeTeam, team2: PokeTeam) -> None:
+        """ 
+        Set team1 and team2 as the battling teams and retrieve their first pokemon.
+
+        :param arg1: team1 (PokeTeam) - Team 1 to battle
+        :param arg2: team2 (PokeTeam) - Team 2 to battle
+
+        :pre: None
+
+        :return: None
+
+        :complexity: Best O(R), where R is the complexity of retrieve_pokemon
+                     Worst O(R), where R is the complexity of retrieve_pokemon
+        """
+        # set both teams as the current battling teams
+        self.team1 = team1
+        self.team2 = team2
+
+        self.rounds = 0
+        if self.sink is not None:
+            self.sink(BattleStart(team1.team_name, team2.team_name))
 
         # both teams retrieve pokemon
         self.team1_poke = self.team1.retrieve_pokemon()
         self.team2_poke = self.team2.retrieve_pokemon()
+        if self.recorder is not None:
+            self.recorder.start(self)
 
-        # battle while either team not empty, heal_time of each team not exceed 3 (loop for R times, where R is number of rounds)
-        while (not (self.team1_poke is None or self.team2_poke is None)):
+    def play_round(self) -> bool:
+        """ 
+        Play one round between the pokemon on the field: choices, then swaps, specials, heals and attacks,
+        round damage, level up, evolution and replacement of fainted pokemon.
+
+        :param: None
 
-            # display game screen for each round of fight until lose
+        :pre: both teams have a pokemon on the field
+
+        :return: False if the battle ends because a team healed more than 3 times, True otherwise
+
+        :complexity: Best O(N), where N is the length of PokeTeamMembers
+                     Worst O(N^2), where N is the length of PokeTeamMembers
+        """
+        self.rounds += 1
+
+        # display game screen for each round of fight until lose
+        if self.verbosity >= Battle.SCREEN:
             self.print_screen()
 
-            # each team choose their battle choice
-            self.choice1 = self.team1.choose_battle_option(self.team1_poke, self.team2_poke)
-            self.choice2 = self.team2.choose_battle_option(self.team2_poke, self.team1_poke)
-            print(f"{self.team1.team_name} chooses {self.choice1} and {self.team2.team_name} chooses {self.choice2}")
-
-            # handle swaps if chosen
-            if self.choice1 == Action.SWAP: 
-                self.swap(self.team1, self.team1_poke)
-            if self.choice2 == Action.SWAP:
-                self.swap(self.team2, self.team2_poke)
-
-            # handle special if chosen
-            if self.choice1 == Action.SPECIAL:
-                self.special(self.team1, self.team1_poke)
-            if self.choice2 == Action.SPECIAL:
-                self.special(self.team2, self.team2_poke)
-
-            # handle heal if chosen
-            if self.choice1 == Action.HEAL:
-                self.heal(self.team1, self.team1_poke)
-                if self.team1.heal_times > 3:
-                    break
-            if self.choice2 == Action.HEAL:
-                self.heal(self.team2, self.team2_poke)
-                if self.team2.heal_times > 3:
-                    break
+        # each team choose their battle choice
+        self.choice1 = self.team1.choose_battle_option(self.team1_poke, self.team2_poke, self.rng)
+        self.choice2 = self.team2.choose_battle_option(self.team2_poke, self.team1_poke, self.rng)
+        if self.sink is not None:
+            self.sink(Choices(self.rounds, self.team1.team_name, self.choice1, self.team2.team_name, self.choice2))
+        if self.recorder is not None:
+            self.recorder.turn(self)
+
+        # handle swaps if chosen
+        if self.choice1 == Action.SWAP: 
+            self.swap(self.team1, self.team1_poke)
+        if self.choice2 == Action.SWAP:
+            self.swap(self.team2, self.team2_poke)
+
+        # handle special if chosen
+        if self.choice1 == Action.SPECIAL:
+            self.special(self.team1, self.team1_poke)
+        if self.choice2 == Action.SPECIAL:
+            self.special(self.team2, self.team2_poke)
+
+        # handle heal if chosen
+        if self.choice1 == Action.HEAL:
+            self.heal(self.team1, self.team1_poke)
+            if self.team1.heal_times > 3:
+                return False
+        if self.choice2 == Action.HEAL:
+            self.heal(self.team2, self.team2_poke)
+            if self.team2.heal_times > 3:
+                return False
+
+        # handle attack if chosen
+        if self.choice1 == Action.ATTACK and self.choice2 == Action.ATTACK:
+            self.both_attack()
+        elif self.choice1 == Action.ATTACK:
+            self.attack(self.team1_poke, self.team2_poke)
+        elif self.choice2 == Action.ATTACK:
+            self.attack(self.team2_poke, self.team1_poke)
 
-            # handle attack if chosen
-            if self.choice1 == Action.ATTACK and self.choice2 == Action.ATTACK:
-                self.both_attack()
-            elif self.choice1 == Action.ATTACK:
-                self.attack(self.team1_poke, self.team2_poke)
-            elif self.choice2 == Action.ATTACK:
-                self.attack(self.team2_poke, self.team1_poke)
+        # both pokemon lose 1 HP if both not fainted
+        if not (self.team1_poke.is_fainted() or self.team2_poke.is_fainted()):
+            # both lose 1 HP if both still alive
+            self.team1_poke.lose_hp(1)
+            self.team2_poke.lose_hp(1)
+            if self.sink is not None:
+                self.sink(RoundDamage(PokeState.of(self.team1_poke), PokeState.of(self.team2_poke)))
+
+        # handle level up
+        self.handle_level_up()
 
-            # both pokemon lose 1 HP if both not fainted
-            if not (self.team1_poke.is_fainted() or self.team2_poke.is_fainted()):
-                # both lose 1 HP if both still alive
-                self.team1_poke.lose_hp(1)
-                self.team2_poke.lose_hp(1)
-                print("Both are still alive so lose 1 hp each")
+        # handle evolve
+        self.handle_evolve(self.team1_poke)
+        self.handle_evolve(self.team2_poke)
 
-            # handle level up
-            self.handle_level_up()
+        # handle fainted
+        self.handle_fainted(self.team1, self.team1_poke)
+        self.handle_fainted(self.team2, self.team2_poke)
+        return True
 
-            # handle evolve
-            self.handle_evolve(self.team1_poke)
-            self.handle_evolve(self.team2_poke)
+    def finish(self) -> int:
+        """ 
+        Return the pokemon left on the field to its team and decide the result of the battle.
+
+        :param: None
 
-            # handle fainted
-            self.handle_fainted(self.team1, self.team1_poke)
-            self.handle_fainted(self.team2, self.team2_poke)
+        :pre: the battle is over
 
+        :return: result (int) - Integer representing result of battle, 0 is draw, 1 is team 1 win, 2 is team 2 wins.
+
+        :complexity: Best O(1), when there is no pokemon left on the field
+                     Worst O(N), where N is the length of PokeTeamMembers
+        """
         # after battle ends must return alive pokemon on the field to its team
         if self.team1_poke is not None and not self.team1_poke.is_fainted():
             self.team1.return_pokemon(self.team1_poke)
         elif self.team2_poke is not None and not self.team2_poke.is_fainted():
             self.team2.return_pokemon(self.team2_poke)
 
-        print("--------------------Result--------------------")
         # check result
         if self.team1.is_empty() and self.team2.is_empty():
             # draw if both teams empty
             self.result = 0
-            print("BOTH TEAMS DRAWED!")
         elif self.team1.is_empty() or self.team1.heal_times > 3:
             # team 1 loses if its empty, or if heal times exceeded 3
             self.result = 2
-            print("TEAM 2 WINS!")
         elif self.team2.is_empty() or self.team2.heal_times > 3:
             # team 2 loses if its empty, or if heal times exceeded 3
             self.result = 1
-            print("TEAM 1 WINS!")
-        return self.result
 
+        if self.renderer is not None:
+            self.renderer.close()
+        if self.recorder is not None:
+            self.recorder.finish(self)
+        if self.sink is not None:
+            self.sink(BattleEnd(self.result, self.rounds))
+        return self.result
@@ -0,0 +1,135 @@
+from __future__ import annotations
+"""
+Opt-in cache of battle results, for Battle(cache=BattleCache(...)).
+
+A battle between two fresh teams (as built or regenerated) is decided by the specs of the teams and the state of the
+random stream when it starts, so its result, number of rounds and the state of the stream when it ends are kept under
+the key (spec of team 1, spec of team 2, seed). Entries are evicted least recently used first beyond capacity, and with
+a path every new entry is appended to a JSON lines file, which is read back when a cache is created on the same path.
+Battle only looks up battles played with battle(..., regenerate=True), which hand both teams back regenerated whether
+the battle was played or found in the cache, so the teams are in the same state either way.
+Unittests (Test cases) for the module will be located under tests\test_battle_cache.py
+
+"""
+
+import json
+import os
+from collections import OrderedDict
+from typing import NamedTuple
+
+from poke_team import Criterion, PokeTeam, TeamSpec
+
+
+class CachedBattle(NamedTuple):
+    """ Outcome of a battle: its result code, number of rounds and the seed of the random stream after the battle """
+    result: int
+    rounds: int
+    seed: int
+
+
+def encode_spec(spec: TeamSpec) -> list:
+    """ JSON value of a TeamSpec, enums by name. O(1) """
+    return [list(spec.team_numbers), spec.battle_mode,
+            None if spec.ai_type is None else spec.ai_type.name,
+            None if spec.criterion is None else spec.criterion.name]
+
+
+def decode_spec(value: list) -> TeamSpec:
+    """ Interned TeamSpec of a JSON value made by encode_spec. O(1) """
+    team_numbers, battle_mode, ai_type, criterion = value
+    return TeamSpec.of(team_numbers, battle_mode,
+                       None if ai_type is None else PokeTeam.AI[ai_type],
+                       None if criterion is None else Criterion[criterion])
+
+
+class BattleCache:
+    """
+    Least recently used cache of CachedBattle by (spec of team 1, spec of team 2, seed), optionally backed by a file.
+
+    Attributes:
+        capacity (int): maximum number of entries kept in memory
+        path (str | None): JSON lines file the entries are appended to, or None
+        hits (int): number of lookups which found an entry
+        misses (int): number of lookups which did not
+
+    :complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
+    """
+
+    def __init__(self, capacity: int = 4096, path: str | None = None) -> None:
+        """
+        :param arg1: capacity (int) - maximum number of entries kept in memory (default = 4096)
+        :param arg2: path (str)     - JSON lines file to load the entries from and append new entries to (default = None)
+
+        :pre: capacity is an integer greater than 0
+
+        :complexity: Best O(1), without a file
+                     Worst O(L), where L is the number of lines of the file
+        """
+        try:
+            assert isinstance(capacity, int) and capacity > 0, "Capacity must be integer greater than 0"
+        except AssertionError as e:
+            raise ValueError(e)
+
+        self.capacity = capacity
+        self.path = path
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        """ Number of entries in memory """
+        return len(self.entries)
+
+    def get(self, key: tuple) -> CachedBattle | None:
+        """ The entry of key, now the most recently used, or None """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, entry: CachedBattle) -> None:
+        """ Keep entry under key, evicting the least recently used entry beyond capacity, and append it to the file """
+        self._keep(key, entry)
+        if self.path is not None:
+            with open(self.path, "a") as file:
+                file.write(self._line(key, entry))
+
+    def _keep(self, key: tuple, entry: CachedBattle) -> None:
+        """ Keep entry under key in memory, as the most recently used """
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    @staticmethod
+    def _line(key: tuple, entry: CachedBattle) -> str:
+        """ Line of the file for entry under key """
+        spec1, spec2, seed = key
+        return json.dumps([encode_spec(spec1), encode_spec(spec2), seed, *entry]) + "\n"
+
+    def load(self) -> None:
+        """
+        Read the entries of the file, later lines being more recently used, skipping malformed lines.
+        The file is rewritten with the entries kept when it holds more than twice the capacity,
+        so it does not grow without bound across runs.
+
+        :complexity: Best O(L), where L is the number of lines of the file
+                     Worst O(L), where L is the number of lines of the file
+        """
+        lines = 0
+        with open(self.path) as file:
+            for line in file:
+                try:
+                    spec1, spec2, seed, result, rounds, end_seed = json.loads(line)
+                except ValueError:
+                    continue    # a line cut short by an interrupted run
+                self._keep((decode_spec(spec1), decode_spec(spec2), seed), CachedBattle(result, rounds, end_seed))
+                lines += 1
+        if lines > 2 * self.capacity:
+            with open(self.path, "w") as file:
+                file.writelines(self._line(key, entry) for key, entry in self.entries.items())
@@ -0,0 +1,221 @@
+from __future__ import annotations
+"""
+Battle event stream.
+
+Everything that happens during Battle.battle is emitted as a compact, immutable event record (a NamedTuple)
+to the sinks subscribed to the battle. A sink is any callable taking one event. Events are only constructed
+when at least one sink is subscribed, so a battle without sinks pays nothing for them.
+
+ConsoleLog is the sink that prints the battle log (used by Battle for verbosity >= 1) and EventLog collects
+events into a list for later analysis.
+Unittests (Test cases) for the module will be located under tests\test_battle_events.py
+
+"""
+
+from typing import Any, Callable, NamedTuple
+
+
+class PokeState(NamedTuple):
+    """Snapshot of the displayed state of a pokemon at the time of an event"""
+    name: str
+    level: int
+    hp: int
+
+    @classmethod
+    def of(cls, poke) -> PokeState | None:
+        """
+        Take a snapshot of poke, or None if there is no pokemon.
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        if poke is None:
+            return None
+        return cls(poke.poke_name, poke.level, poke.current_hp)
+
+    def __str__(self) -> str:
+        """ Same representation as PokemonBase.__str__ """
+        return f"LV. {self.level} {self.name}: {self.hp} HP"
+
+
+# ---- events emitted by PokemonBase ----
+
+class Asleep(NamedTuple):
+    """The attacking pokemon is asleep"""
+    pokemon: str
+
+class ConfusedSelfHit(NamedTuple):
+    """The attacking pokemon is confused and attacks itself"""
+    pokemon: str
+
+class Burning(NamedTuple):
+    """The attacking pokemon is burning and deals half damage"""
+    pokemon: str
+
+class Attack(NamedTuple):
+    """Damage dealt by an attack, before the defender's defence is applied"""
+    attacker: str
+    defender: str
+    base_attack: int
+    effectiveness: float
+    damage: int
+
+class StatusDamage(NamedTuple):
+    """The attacking pokemon lost hp to its own status"""
+    pokemon: str
+    status: str
+    damage: int
+
+class StatusInflicted(NamedTuple):
+    """A status was inflicted on the target"""
+    source: str
+    target: str
+    status: str
+
+class AlreadyParalysed(NamedTuple):
+    """The target could not be paralysed because it already is"""
+    pokemon: str
+
+class Paralysed(NamedTuple):
+    """The paralysis of a pokemon halved its speed"""
+    pokemon: str
+    speed: int
+    halved_speed: int
+
+
+# ---- events emitted by Battle ----
+
+class BattleStart(NamedTuple):
+    """Two teams start battling"""
+    team1: str
+    team2: str
+
+class Choices(NamedTuple):
+    """Actions chosen by both teams at the start of a round (rounds are counted from 1)"""
+    round: int
+    team1: str
+    choice1: Any
+    team2: str
+    choice2: Any
+
+class Swap(NamedTuple):
+    """A team swapped its pokemon"""
+    team: str
+    old: PokeState
+    new: PokeState | None
+
+class Special(NamedTuple):
+    """A team used its special action"""
+    team: str
+    old: PokeState
+    new: PokeState | None
+
+class Heal(NamedTuple):
+    """A team healed its pokemon"""
+    team: str
+    pokemon: PokeState
+
+class Speeds(NamedTuple):
+    """Speeds compared when both pokemon attack"""
+    pokemon1: PokeState
+    speed1: int
+    team2: str
+    pokemon2: PokeState
+    speed2: int
+
+class AttackStart(NamedTuple):
+    """A pokemon attacks another one"""
+    attacker: PokeState
+    defender: PokeState
+
+class AttackResult(NamedTuple):
+    """State of both pokemon after an attack"""
+    attacker: PokeState
+    defender: PokeState
+
+class RoundDamage(NamedTuple):
+    """Both pokemon are still alive at the end of the round and lose 1 hp each"""
+    pokemon1: PokeState
+    pokemon2: PokeState
+
+class LevelUp(NamedTuple):
+    """A pokemon levelled up after its opponent fainted"""
+    old: PokeState
+    new: PokeState
+
+class Evolve(NamedTuple):
+    """A pokemon evolved"""
+    old: PokeState
+    new: PokeState
+
+class Faint(NamedTuple):
+    """A pokemon fainted"""
+    pokemon: str
+
+class BattleEnd(NamedTuple):
+    """The battle ended. result is 0 for a draw, 1 or 2 for the winning team"""
+    result: int
+    rounds: int
+
+
+class EventLog(list):
+    """Sink collecting every event in order"""
+
+    def __call__(self, event: NamedTuple) -> None:
+        """
+        Record event.
+
+        :complexity: Best O(1)
+                     Worst O(1) amortised
+        """
+        self.append(event)
+
+
+class ConsoleLog:
+    """Sink printing the battle log to the console"""
+
+    RESULTS = {0: "BOTH TEAMS DRAWED!", 1: "TEAM 1 WINS!", 2: "TEAM 2 WINS!"}
+
+    def __init__(self, print_fn: Callable[[str], Any] = print) -> None:
+        """
+        :param: print_fn - function called with every line of the log (default = print)
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        self.print_fn = print_fn
+        self.formatters = {
+            Asleep: lambda e: f"{e.pokemon} is asleep!",
+            ConfusedSelfHit: lambda e: f"{e.pokemon} is confused and attacked itself!",
+            Burning: lambda e: f"Because {e.pokemon} is burning, it only deals half damage!",
+            Attack: lambda e: f"{e.attacker} has base attack of {e.base_attack} and type effectiveness of {e.effectiveness} against {e.defender}\n"
+                              f"{e.attacker} has effective damage output of {e.damage}",
+            StatusDamage: lambda e: f"{e.pokemon} lost {e.damage} hp to {'poison' if e.status == 'poison' else 'fire'} damage!",
+            StatusInflicted: lambda e: f"{e.source} inflicted {e.status} on {e.target}!",
+            AlreadyParalysed: lambda e: f"{e.pokemon} is already paralysed so cannot be paralysed again!",
+            Paralysed: lambda e: f"{e.pokemon} is paralysed and its speed is halved from {e.speed} to {e.halved_speed}",
+            BattleStart: None,
+            Choices: lambda e: f"{e.team1} chooses {e.choice1} and {e.team2} chooses {e.choice2}",
+            Swap: lambda e: f"{e.team} swapped out {e.old} and got {e.new}",
+            Special: lambda e: f"{e.team} used special with {e.old} and got {e.new}",
+            Heal: lambda e: f"{e.team} healed {e.pokemon}",
+            Speeds: lambda e: f"{e.pokemon1} has {e.speed1} speed, and {e.team2}, {e.pokemon2} has {e.speed2} speed",
+            AttackStart: lambda e: f"{e.attacker} attacks {e.defender}.",
+            AttackResult: lambda e: f"Result: {e.attacker} {e.defender}",
+            RoundDamage: lambda e: "Both are still alive so lose 1 hp each",
+            LevelUp: lambda e: f"{e.old} levels up to {e.new} !",
+            Evolve: lambda e: f"{e.old} evolved to {e.new}",
+            Faint: lambda e: f"{e.pokemon} is fainted!",
+            BattleEnd: lambda e: "--------------------Result--------------------\n" + self.RESULTS.get(e.result, ""),
+        }
+
+    def __call__(self, event: NamedTuple) -> None:
+        """
+        Print the log line(s) for event.
+
+        :complexity: Best O(1)
+                     Worst O(L), where L is the length of the line printed
+        """
+        formatter = self.formatters.get(type(event))
+        if formatter is not None:
+            self.print_fn(formatter(event))
@@ -1,40 +1,136 @@
 """
 Run leaderboard matches against the leaderboard team.
+
+Every battle uses its own RandomGen stream, seeded with a seed drawn from the master random stream after the
+opponents are generated, so the battles are independent of each other and can be split across worker processes.
+Opponents are drawn as interned TeamSpecs and only built by the workers, which reuse the team of a spec once its battle
+is over. Every worker reports a summary of its chunk of battles, which are merged in order.
+A given seed gives the same results for any number of processes.
 """
 
+from multiprocessing import Pool
+
 from battle import Battle
-from poke_team import PokeTeam, Criterion
+from battle_cache import BattleCache
+from poke_team import PokeTeam, Criterion, TeamPool, TeamSpec
 from random_gen import RandomGen
 
-def leaderboard():    
-    RandomGen.set_seed((1<<16) + 1029348)
+def summarise(results: list[int]) -> tuple:
+    """
+    Summarise the results of consecutive battles of the leaderboard team, so that summaries of
+    consecutive chunks of battles can be merged.
 
-    leaderboard_team = PokeTeam.leaderboard_team()
-    teams = [
-        PokeTeam.random_team(f"Team {x}", RandomGen.randint(0, 2), criterion=Criterion(RandomGen.randint(1, len(Criterion))))
-        for x in range(1000)
-    ]
+    :return: (won, loss, draw, prefix, suffix, best, has_loss), where prefix is the number of wins before the first loss,
+             suffix is the win streak at the end of the chunk and best is the longest win streak inside the chunk.
+             Draws do not break a streak.
 
-    streak = 0
-    max_streak = 0
-    played = 0
-    won = 0
-    draw = 0
-    loss = 0
-    b = Battle()
-    for team in teams:
-        res = b.battle(leaderboard_team, team)
+    :complexity: Best O(N), where N is the length of results
+                 Worst O(N), where N is the length of results
+    """
+    won = loss = draw = 0
+    streak = best = 0
+    prefix = None
+    for res in results:
         if res == 0:
             draw += 1
         elif res == 1:
             won += 1
             streak += 1
-            max_streak = max(max_streak, streak)
+            best = max(best, streak)
         elif res == 2:
             loss += 1
+            if prefix is None:
+                prefix = streak
             streak = 0
-        played += 1
-        leaderboard_team.regenerate_team()
+    has_loss = prefix is not None
+    return (won, loss, draw, prefix if has_loss else streak, streak, best, has_loss)
+
+def merge(summaries: list[tuple]) -> tuple:
+    """
+    Merge the summaries of consecutive chunks of battles, in order.
+
+    :return: (won, loss, draw, max_streak)
+
+    :complexity: Best O(C), where C is the number of chunks
+                 Worst O(C), where C is the number of chunks
+    """
+    won = loss = draw = 0
+    streak = max_streak = 0
+    for c_won, c_loss, c_draw, prefix, suffix, best, has_loss in summaries:
+        won += c_won
+        loss += c_loss
+        draw += c_draw
+        # the streak running into this chunk continues until its first loss
+        max_streak = max(max_streak, streak + prefix, best)
+        streak = suffix if has_loss else streak + prefix
+    return (won, loss, draw, max_streak)
+
+def play_chunk(leaderboard_spec: TeamSpec, opponents: list[tuple], cache: BattleCache | None = None) -> tuple:
+    """
+    Battle the leaderboard team against every (spec, seed) in opponents, each battle with its own stream seeded with seed.
+    Opponents are released to a pool of the chunk after their battle, so later opponents of the same spec reuse them.
+    Results are looked up in and added to cache when one is given.
+
+    :return: summary of the chunk (see summarise)
+
+    :complexity: Best O(N*B), where N is the length of opponents and B the complexity of a battle
+                 Worst O(N*B), where N is the length of opponents and B the complexity of a battle
+    """
+    leaderboard_team = PokeTeam.from_spec("Leaderboard", leaderboard_spec)
+    rng = RandomGen()
+    b = Battle(rng=rng, cache=cache)
+    team_pool = TeamPool()
+    results = []
+    for x, (spec, seed) in opponents:
+        rng.set_seed(seed)
+        opponent = PokeTeam.from_spec(f"Team {x}", spec, team_pool)
+        results.append(b.battle(leaderboard_team, opponent, regenerate=True))
+        opponent.release(team_pool)
+    return summarise(results)
+
+def leaderboard(leaderboard_team: PokeTeam | None = None, processes: int = 1, cache: BattleCache | None = None):
+    """
+    Battle the leaderboard team against 1000 random teams.
+
+    :param arg1: leaderboard_team (PokeTeam) - team to evaluate (default = PokeTeam.leaderboard_team())
+    :param arg2: processes (int)             - number of worker processes, 1 runs the battles in this process (default = 1)
+    :param arg3: cache (BattleCache)         - cache of battle results, so a leaderboard run again skips its battles (default = None).
+                                               Worker processes use a copy of it, adding their results only to its file.
+
+    :pre: processes is an integer greater than 0
+
+    :return: list of statistics of the leaderboard team
+
+    :complexity: Best O(N*B/P), where N is the number of opponents, B the complexity of a battle and P the number of processes
+                 Worst O(N*B/P), where N is the number of opponents, B the complexity of a battle and P the number of processes
+    """
+    try:
+        assert isinstance(processes, int) and processes > 0, "Number of processes must be integer greater than 0"
+    except AssertionError as e:
+        raise ValueError(e)
+
+    RandomGen.set_seed((1<<16) + 1029348)
+
+    if leaderboard_team is None:
+        leaderboard_team = PokeTeam.leaderboard_team()
+    specs = [
+        PokeTeam.random_spec(RandomGen.randint(0, 2), criterion=Criterion(RandomGen.randint(1, len(Criterion))))
+        for x in range(1000)
+    ]
+    # every battle gets its own seed from the master stream, so battles do not depend on the ones before them
+    opponents = [(x, (spec, RandomGen.random())) for x, spec in enumerate(specs)]
+    leaderboard_spec = leaderboard_team.spec()
+
+    if processes == 1:
+        summaries = [play_chunk(leaderboard_spec, opponents, cache)]
+    else:
+        # contiguous chunks, so the summaries can be merged in order
+        size = -(-len(opponents) // processes)
+        chunks = [opponents[i:i + size] for i in range(0, len(opponents), size)]
+        with Pool(processes) as pool:
+            summaries = pool.starmap(play_chunk, [(leaderboard_spec, chunk, cache) for chunk in chunks])
+    won, loss, draw, max_streak = merge(summaries)
+    played = won + loss + draw
 
     return [
         {"name": "Percentage Won", "value": f"{100*won/played:.2f}%"},
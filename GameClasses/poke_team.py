@@ -14,11 +14,14 @@ from stack_adt import ArrayStack
 
 from random_gen import RandomGen
 from queue_adt import CircularQueue
+from deque_adt import CircularDeque
 
 
 from enum import Enum, auto
-from pokemon_base import PokemonBase
+from typing import NamedTuple
+from pokemon_base import PokemonBase, Status
 from pokemon import *
+from species import TEAM_SPECIES
 from sorted_list import ListItem
 from array_sorted_list import ArraySortedList
 
@@ -39,11 +42,25 @@ class Criterion(Enum):
     DEF = auto()
 
 
+# criterion value of a new pokemon of each species of the team_numbers, by criterion
+INITIAL_CRITERION = {
+    Criterion.SPD: tuple(species.speed for species in TEAM_SPECIES),
+    Criterion.HP: tuple(species.hp for species in TEAM_SPECIES),
+    Criterion.LV: tuple(species.level for species in TEAM_SPECIES),
+    Criterion.DEF: tuple(species.defence for species in TEAM_SPECIES),
+}
+
 class BM2SortedList(ArraySortedList):
     """
-    Class inheriting ArraySortedList methods, but with additional methods and attribute that allows the items to be sorted in descending or ascending order.
-    Swap method added for bubble sort(used in sort_by_pokedex).
-    Can be sorted by increasing or decreasing criterion depending on the order argument during initialization.
+    Team of battle mode 2, an ArraySortedList of ListItems (pokemon, criterion value) in descending (order = 1) or ascending
+    (order = 0) order of criterion, with ties broken by pokedex number, ascending when the criterion is descending and vice versa.
+
+    Positions are counted from the first pokemon to come out, and the array holds the ListItems in reverse of that order
+    (position i is self.array[len - 1 - i]), so serving the first pokemon takes the last item of the array.
+    A pokemon is placed by the binary search battle mode 2 has always used, which stops at the first pokemon of the same
+    criterion it meets, so pokemon of one species and criterion come out in the order they always have.
+
+    :complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
     """
 
     def __init__(self, max_capacity: int, order: int) -> None:
@@ -51,17 +68,17 @@ class BM2SortedList(ArraySortedList):
         BM2SortedList object initialiser which inherits ArraySortedList functionality and can be sorted based on specified order(ascending/descending).
         This method is invoked to create an BM2SortedList object and initialise its state.
 
-        :param arg1: max_capacity (int) - Integer representing the maximum capacity for the ArraySortedList to be generated
+        :param arg1: max_capacity (int) - Integer representing the initial capacity of the referential array
         :param arg2: order (int) - Integer to represent whether to sort by ascending (order = 0) or descending order (order = 1)
 
         :pre: 
-        - max_capacity must be integer greater than 0
+        - max_capacity must be integer
         - order must be integer 0 or 1
 
         :return: None
 
-        :complexity: Best O(N), where N is the max_capacity representing the length of the referential array in BM2SortedList.
-                     Worst O(N), where N is the max_capacity representing the length of the referential array in BM2SortedList.
+        :complexity: Best O(N), where N is the max_capacity
+                     Worst O(N), where N is the max_capacity
         """
         # check the preconditions
         try:
@@ -70,146 +87,202 @@ class BM2SortedList(ArraySortedList):
         except AssertionError as e:
             raise ValueError(e)
 
-        # first initialise the sorted list with capacity
         ArraySortedList.__init__(self, max_capacity)
         self.order = order
 
+    def __getitem__(self, index: int) -> ListItem:
+        """ Magic method. Return the ListItem at a given position of the team. """
+        if not 0 <= index < len(self):
+            raise IndexError('No such index in the team')
+        return self.array[len(self) - 1 - index]
+
     def __setitem__(self, index: int, item: ListItem) -> None:
         """ 
         Magic method. Insert the item at a given position, if possible while following the order. Shift the following elements to the right.
-        Order determines ascending or descending criterion, 1 is descending order, 0 is ascending order.
-
-        :param: index(int) - the index to insert the item
 
         :pre: 
         - index is an integer greater or equal to 0
         - item is a ListItem object
 
-        :return: None
+        :raises IndexError: if the position of item is wrong with respect to its neighbours
 
-        :complexity: Best O(N), where N is length of the array in the BM2SortedList object
-                     Worst O(N), where N is length of the array in the BM2SortedList object
+        :complexity: Best O(1), when the item goes last
+                     Worst O(N), where N is length of the team, to move the items after it
         """
-        # check the preconditions
         try:
-            assert index is not None and isinstance(index, int) and index >= 0 , "Index must be an integer greater or equal to 0"
+            assert index is not None and isinstance(index, int) and index >= 0, "Index must be an integer greater or equal to 0"
             assert item is not None and isinstance(item, ListItem), "item must be an ListItem object"
         except AssertionError as e:
             raise ValueError(e)
 
-        can_place = False
-        # ascending order
-        ascending = self.order == 0 and (self.is_empty() or \
-                    (index == 0 and item.key <= self[index].key) or \
-                    (index == len(self) and self[index - 1].key <= item.key) or \
-                    (index > 0 and self[index - 1].key <= item.key <= self[index].key))
-        # descending order
-        descending = self.order == 1 and (self.is_empty() or \
-                    (index == 0 and item.key >= self[index].key) or \
-                    (index == len(self) and self[index - 1].key >= item.key) or \
-                    (index > 0 and self[index].key <= item.key <= self[index - 1].key))
-
-        if ascending or descending:
-            # resize the array if the array is full
-            if self.is_full():
-                self._resize()
-
-            # shuffle ListItems after the current index to the right to accomodate space for the new item
-            self._shuffle_right(index)
-            # set item at index position where space has been allocated
-            self.array[index] = item
-        else:
-            # the list isn't empty and the item's position is wrong with respect to its neighbours
+        # the item comes out after the item before it and before the item after it, in the order of the team
+        sign = 1 if self.order == 0 else -1
+        if (index > 0 and sign * self[index - 1].key > sign * item.key) or \
+                (index < len(self) and sign * item.key > sign * self[index].key):
             raise IndexError('Element should be inserted in sorted order')
+        if self.is_full():
+            self._resize()
+        self._shuffle_right(len(self) - index)
+        self.array[len(self) - index] = item
 
-    def _index_to_add(self, item: ListItem) -> int:
+    def _insert(self, index: int, item: ListItem) -> None:
         """
-        Find the position where the new item should be placed using binary search.
-
-        :param arg1: item (ListItem) - ListItem object to be inserted into the BM2SortedList object array
+        Insert item at a position known to be in order, shifting the items coming out after it.
 
-        :pre: None
+        :complexity: Best O(1), when the item comes out first and no need to resize
+                     Worst O(N), where N is length of the team, to move the items after it or when need to resize
+        """
+        if self.is_full():
+            self._resize()
+        slot = len(self) - index
+        self._shuffle_right(slot)
+        self.array[slot] = item
+        self.length += 1
 
-        :return: integer representing the index where the new item should be added into
+    def _index_to_add(self, item: ListItem) -> int:
+        """
+        Find the position where the new item should be placed using binary search.
+        A pokemon of the same criterion value as item found on the way is the position.
 
-        :complexity:Best O(1), when the index to add is directly at the centre.
-                    Worst O(log N), where N is the length of the array in BM2SortedList object, when index to add is not within the searching list.
+        :complexity: Best O(1), when the middle pokemon has the criterion value of item
+                     Worst O(log N), where N is the length of the team
         """
-        # check for preconditions
-        try:
-            assert item is not None and isinstance(item,ListItem), "item must be ListItem object."
-        except AssertionError as e:
-            raise ValueError(e)
+        array, last = self.array, len(self) - 1
         low = 0
-        high = len(self) - 1
-
+        high = last
         while low <= high:
             mid = (low + high) // 2         # get the middle index of the search list
-            if self[mid].key < item.key:    # enter when item larger than middle
-                if self.order == 0:         # when order is in ascending order
-                    low = mid + 1           # make the search list search from middle to end of current search list
-                elif self.order == 1:       # when order is in descending order
-                    high = mid - 1          # make the search list serach from start to middle of current search list
-            elif self[mid].key > item.key:  # enter when item smaller than middle
-                if self.order == 0:         # when order is in ascending order
-                    high = mid - 1          # search from start to middle of current search list
-                elif self.order == 1:       # when order is in descending order
-                    low = mid + 1           # search from middle to end of current search list
-            else:
+            key = array[last - mid].key
+            if key == item.key:
                 return mid                  # return the middle index when item is equal to middle
+            if (key < item.key) == (self.order == 0):
+                low = mid + 1               # item comes out after the middle
+            else:
+                high = mid - 1              # item comes out before the middle
+        return low
 
-        return low                          # return the low index indicating the index to insert the item into
+    def add(self, item: ListItem) -> None:
+        """
+        Add the ListItem (pokemon, criterion value) at the position found by the binary search.
 
-    def swap(self, index1: int, index2: int) -> None:
+        :complexity: Best O(log N), where N is the length of the team, when the pokemon comes out first
+                     Worst O(N), where N is the length of the team, to move the pokemon coming out before it
         """
-        Swaps the ListItems of index1 and index2 in BM2SortedList's array. Used in sort_by_pokedex method.
+        self._insert(self._index_to_add(item), item)
 
-        :param arg1: index1 (int) - Integer representing index of the item to be swapped
-        :param arg2: index2 (int) - Integer representing index of another item to be swapped
+    def add_by_pokedex(self, item: ListItem) -> None:
+        """
+        Add the ListItem (pokemon, criterion value) to a team whose ties are broken by pokedex, keeping them broken:
+        among the pokemon of its criterion value, it goes after those which come before it by pokedex number, and after
+        those of its pokedex number which the binary search puts before it.
 
-        :pre: index1 and index2 must be integers greater or equal to 0
+        :complexity: Best O(log N), where N is the length of the team, when the pokemon comes out first
+                     Worst O(N), where N is the length of the team
+        """
+        position = self._index_to_add(item)
+        start = end = position
+        # pokemon of the criterion value of item around the position
+        while start > 0 and self[start - 1].key == item.key:
+            start -= 1
+        while end < len(self) and self[end].key == item.key:
+            end += 1
+        pokedex = item.value.pokedex
+        index = start
+        for i in range(start, end):
+            other = self[i].value.pokedex
+            if (other < pokedex if self.order == 1 else other > pokedex) or (other == pokedex and i < position):
+                index += 1
+        self._insert(index, item)
+
+    def serve(self) -> ListItem:
+        """
+        Delete and return the ListItem of the first pokemon of the team.
 
-        :return: None
+        :raises Exception: if the team is empty
+        """
+        if self.is_empty():
+            raise Exception("Team is empty")
+        self.length -= 1
+        return self.array[self.length]
 
-        :complexity:Best O(N), where N is the length of the array in BM2SortedList object.
-                    Worst O(N), where N is the length of the array in BM2SortedList object.
+    def delete_at_index(self, index: int) -> ListItem:
         """
-        # check for preconditions
-        try:
-            assert index1 is not None and isinstance(index1, int) and len(self) > index1 >= 0
-            assert index2 is not None and isinstance(index2, int) and len(self) > index2 >= 0
-        except AssertionError:
-            raise ValueError("index1 and index2 must be integer greater or equal to 0.")
+        Delete the ListItem at a given position of the team.
 
-        # additional swap method for sort_by_pokedex
-        temp = self.array[index1]
-        self.array[index1] = self.array[index2]
-        self.array[index2] = temp
+        :complexity: Best O(1), when it is the first pokemon
+                     Worst O(N), where N is the length of the team
+        """
+        if not 0 <= index < len(self):
+            raise IndexError('No such index in the list')
+        slot = len(self) - 1 - index
+        item = self.array[slot]
+        self.length -= 1
+        self._shuffle_left(slot)
+        return item
 
-    def delete_at_index(self, index: int) -> ListItem:
+    def _find(self, item: ListItem) -> int:
+        """ Position of item in the team, or -1. O(N), where N is the length of the team """
+        for index in range(len(self)):
+            if self[index] == item:
+                return index
+        return -1
+
+    def break_ties(self) -> None:
         """
-        Delete the ListItem  at the specified index in the BM2SortedList array.
-        Similar to ArraySortedList method but when index >= len(self), instead of raising index error return None.
+        Order the pokemon of equal criterion value by pokedex number, ascending when the criterion is descending and
+        vice versa. Pokemon of the same species keep their order.
 
-        :param arg1: index (int) - Integer representing index of item to be deleted
+        :complexity: Best O(N), where N is the length of the team
+                     Worst O(N log N), where N is the length of the team
+        """
+        items = self.array[:len(self)][::-1]      # in the order they come out
+        start = 0
+        for end in range(1, len(items) + 1):
+            if end == len(items) or items[end].key != items[start].key:
+                items[start:end] = sorted(items[start:end], key=lambda item: item.value.pokedex, reverse=self.order == 0)
+                start = end
+        self.array[:len(self)] = items[::-1]
+
+    def reverse(self) -> None:
+        """
+        Reverse the order of the criterion, and of the pokedex numbers breaking its ties: the pokemon are added again,
+        in the order they come out, to the team in the other order.
 
-        :pre: index must be an integer greater or equal to 0
+        :complexity: Best O(N log N), where N is the length of the team
+                     Worst O(N^2), where N is the length of the team
+        """
+        items = self.array[:len(self)][::-1]
+        self.length = 0
+        self.order = 1 - self.order
+        for item in items:
+            self.add(item)
+        self.break_ties()
+
+    def snapshot(self) -> tuple:
+        """ State of the team which restore brings back: its ListItems as in the array, and order. O(N) """
+        return (tuple(self.array[:len(self)]), self.order)
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        Bring the team back to the state it was in when snapshot was taken, reusing its ListItems.
 
-        :return: item (ListItem) - The ListItem deleted from the BM2Sorted list
+        :complexity: Best O(N), where N is the length of the team in the snapshot
+                     Worst O(N), where N is the length of the team in the snapshot
+        """
+        items, self.order = snapshot
+        while len(self.array) < len(items):
+            self._resize()
+        self.array[:len(items)] = items
+        self.length = len(items)
 
-        :complexity:Best O(N), where N is the length of the array in BM2SortedList object.
-                    Worst O(N), where N is the length of the array in BM2SortedList object.
+    def __iter__(self):
         """
-        try:
-            assert index is not None and isinstance(index, int) and index >= 0
-        except AssertionError:
-            raise ValueError("Index must be an integer greater or equal to 0")
-        if index >= len(self):
-            return None
-        item = self.array[index]
-        self.length -= 1
-        self._shuffle_left(index)
-        return item
+        Iterate over the ListItems of the team, in order.
+
+        :complexity: Best O(N), where N is the length of the team
+                     Worst O(N), where N is the length of the team
+        """
+        return reversed(self.array[:len(self)])
 
 
 class BattleMode0():
@@ -234,15 +307,15 @@ class BattleMode0():
         self.poke_team_list = poke_team_list
         self.pokeTeamMembers = self.generate_queue_ADT_battle_0()
 
-    def generate_queue_ADT_battle_0(self) -> CircularQueue:
+    def generate_queue_ADT_battle_0(self) -> CircularDeque:
         """
-        This method generate a queue for the pokemon team in battle mode 0
+        This method generate a deque for the pokemon team in battle mode 0, so pokemon can be returned to the front
 
         :param: None
 
         :pre: None
 
-        :return: pokeTeamMembers (CircularQueue obj) - the queue which stores the pokemon
+        :return: pokeTeamMembers (CircularDeque obj) - the deque which stores the pokemon
 
         :complexity: Best O(N), where N is length of pokeTeamMembers
                      WorstO(N), where N is length of pokeTeamMembers
@@ -250,7 +323,7 @@ class BattleMode0():
         array_poke_team = self.poke_team_list
         len_poke_team = len(self.poke_team_list)
 
-        self.pokeTeamMembers = CircularQueue(len_poke_team)
+        self.pokeTeamMembers = CircularDeque(len_poke_team)
 
         for i in range(len_poke_team):
             self.pokeTeamMembers.append(array_poke_team[i])
@@ -259,7 +332,7 @@ class BattleMode0():
 
     def return_pokemon(self, poke: PokemonBase) -> None:
         """
-        This method put poke to the front of the queue only if the poke isn't fainted
+        This method put poke to the front of the deque only if the poke isn't fainted
 
         :param: poke (PokemonBase) - a PokemonBase object
 
@@ -267,8 +340,8 @@ class BattleMode0():
 
         :return: None
 
-        :complexity: Best O(N), where N is length of pokeTeamMembers
-                     WorstO(N), where N is length of pokeTeamMembers
+        :complexity: Best O(1)
+                     Worst O(1)
         """
         try:
             assert (isinstance(poke,PokemonBase)), "poke should be an object of PokemonBase"
@@ -276,23 +349,8 @@ class BattleMode0():
             raise ValueError(e)
 
         if not poke.is_fainted(): 
-            temp_queue = CircularQueue(len(self.pokeTeamMembers))
-
-            # add all the pokemon in the queue to temporary queue
-            for _ in range(len(self.pokeTeamMembers)):
-                item = self.pokeTeamMembers.serve()
-                temp_queue.append(item)
-
-            # ensure the queue is clear now
-            self.pokeTeamMembers.clear()
-
-            # put the poke to the front of the queue
-            self.pokeTeamMembers.append(ListItem(poke, poke.pokedex))  # remember that we want list items
-
-            # add back the pokemon which we store in the temp queue to the queue 
-            for _ in range(len(temp_queue)):
-                item = temp_queue.serve()
-                self.pokeTeamMembers.append(item)
+            # put the poke to the front of the deque
+            self.pokeTeamMembers.push_front(ListItem(poke, poke.pokedex))  # remember that we want list items
 
 
     def retrieve_pokemon(self) -> PokemonBase | None:
@@ -309,7 +367,6 @@ class BattleMode0():
         len_poke_team = len(self.pokeTeamMembers)
 
         if len_poke_team == 0:
-            print("No pokemon")
             return None
 
         first_pokemon = self.pokeTeamMembers.serve()
@@ -327,46 +384,17 @@ class BattleMode0():
 
         :return: None
 
-        :complexity: Best O(N), where N is length of pokeTeamMembers
-                     WorstO(N), where N is length of pokeTeamMembers
+        :complexity: Best O(1)
+                     Worst O(1)
         """ 
-        if len(self.pokeTeamMembers) == 1:
-            print("Special not available")
-            temp = CircularQueue(len(self.pokeTeamMembers))
-            item = self.pokeTeamMembers.serve()
-            self.pokeTeamMembers.append(item)
-            temp.append(item)
-
-            
-        # This is to store all elements except first and last   
-        temp_queue = CircularQueue(len(self.pokeTeamMembers)-2)
+        # when only one pokemon left, this method should do nothing, so pokeTeamMembers should remain unchanged.
+        if len(self.pokeTeamMembers) < 2:
+            return
 
-        # This is new queue
-        new_queue = CircularQueue(len(self.pokeTeamMembers))
-
-        # Get first item
         first_item = self.pokeTeamMembers.serve()
-
-        # Add all elements except last element
-        for i in range(len(self.pokeTeamMembers)-1):
-            temp_queue.append(self.pokeTeamMembers.serve())
-
-        # Get last element
-        try:
-            last_item = self.pokeTeamMembers.serve()
-        except Exception: # when only one pokemon left, this method should do nothing, so pokeTeamMembers should remain unchanged.
-            self.pokeTeamMembers = temp
-        else:
-            # Add last element
-            new_queue.append(last_item)
-
-            # Add all elements in temp_queue to new_queue
-            for i in range(len(temp_queue)):
-                new_queue.append(temp_queue.serve())    
-            # Add first element     
-            new_queue.append(first_item)
-                        
-            self.pokeTeamMembers = new_queue
+        last_item = self.pokeTeamMembers.pop_back()
+        self.pokeTeamMembers.push_front(last_item)
+        self.pokeTeamMembers.append(first_item)
 
 class BattleMode1():
     """
@@ -506,12 +534,12 @@ class BattleMode2():
 
         :return: None
 
-        :complexity: Best O(N^2), where N is sum of team_numbers
-                     Worst O(N^2), where N is sum of team_numbers
+        :complexity: Best O(N log N), where N is sum of team_numbers
+                     Worst O(N log N), where N is sum of team_numbers
         """
 
         self.criterion = criterion
-        self.pokeTeamMembers = self.bm_2_team(team_numbers)  # this is sorted by criterion only
+        self.pokeTeamMembers = self.bm_2_team(team_numbers)  # ordered by criterion, then pokedex
 
     def get_criterion(self, pokemon: PokemonBase) -> int:
         """ 
@@ -546,25 +574,18 @@ class BattleMode2():
 
         :return: pokeTeamMembers (BM2SortedList[ListItem(PokemonBase, int)])
         
-        :complexity: Best O(N^2), where N is sum of team_numbers
+        :complexity: Best O(N log N), where N is sum of team_numbers
                      Worst O(N^2), where N is sum of team_numbers
         """        
 
         pokeTeamMembers = BM2SortedList(sum(team_numbers), 1)
-        for i in range(5): # always 5
-            for j in range(len(team_numbers)): # always 5
-                if i == j:
-                    for k in range(team_numbers[j]): # this executes sum(team_numbers) times
-                        if i == 0:
-                            pokeTeamMembers.add(ListItem(Charmander(k), self.get_criterion(Charmander()))) # add is O(len(pokeTeamMembers))
-                        elif i == 1:
-                            pokeTeamMembers.add(ListItem(Bulbasaur(k), self.get_criterion(Bulbasaur())))
-                        elif i == 2:
-                            pokeTeamMembers.add(ListItem(Squirtle(k), self.get_criterion(Squirtle())))
-                        elif i == 3:
-                            pokeTeamMembers.add(ListItem(Gastly(k), self.get_criterion(Gastly())))
-                        elif i == 4:
-                            pokeTeamMembers.add(ListItem(Eevee(k), self.get_criterion(Eevee())))
+        initial = INITIAL_CRITERION[self.criterion]
+        for i in range(len(team_numbers)): # always 5
+            pokemon_class = TEAM_POKEMON[i]     # species registry lookup
+            for k in range(team_numbers[i]): # this executes sum(team_numbers) times
+                # the criterion of a new pokemon is a species constant, read from the registry
+                pokeTeamMembers.add(ListItem(pokemon_class(k), initial[i])) # add is O(len(pokeTeamMembers))
+        pokeTeamMembers.break_ties()    # pokedex order breaks the ties in criterion
         return pokeTeamMembers
 
     def return_pokemon(self, poke: PokemonBase) -> None:
@@ -577,8 +598,8 @@ class BattleMode2():
 
         :return: None
 
-        :complexity: Best O(N), where N is length of pokeTeamMembers
-                     WorstO(N), where N is length of pokeTeamMembers
+        :complexity: Best O(log N), where N is length of pokeTeamMembers, when the pokemon comes out first
+                     Worst O(N), where N is length of pokeTeamMembers
         """ 
         try:
             assert (isinstance(poke,PokemonBase)), "poke should be an object of PokemonBase"
@@ -587,7 +608,7 @@ class BattleMode2():
 
         criterion_value = self.get_criterion(poke)
         if not poke.is_fainted(): 
-            self.pokeTeamMembers.add(ListItem(poke, criterion_value)) # O(len(pokeTeamMembers))
+            self.pokeTeamMembers.add_by_pokedex(ListItem(poke, criterion_value)) # O(len(pokeTeamMembers))
 
     def retrieve_pokemon(self) -> PokemonBase | None:
         """ 
@@ -599,13 +620,12 @@ class BattleMode2():
 
         :return: First pokemon in the team (PokemonBase) or None
 
-        :complexity: Best O(N), where N is length of pokeTeamMembers
-                     Worst O(N), where N is length of pokeTeamMembers
+        :complexity: Best O(1)
+                     Worst O(1)
         """ 
-        list_item = self.pokeTeamMembers.delete_at_index(0) # O(len(pokeTeamMembers))
-        if list_item is not None:
-            return list_item.value
-        return None
+        if self.pokeTeamMembers.is_empty():
+            return None
+        return self.pokeTeamMembers.serve().value # O(1)
 
     def special(self):
         """
@@ -617,24 +637,11 @@ class BattleMode2():
 
         :return: None
 
-        :complexity: Best case: O(N^2), where N is length of pokeTeamMembers
-                     Worst case: O(N^2), where N is length of pokeTeamMembers        
+        :complexity: Best case: O(N log N), where N is length of pokeTeamMembers
+                     Worst case: O(N^2), where N is length of pokeTeamMembers
         
         """
- 
-        new_order = 1-self.pokeTeamMembers.order
-        queue = CircularQueue(len(self.pokeTeamMembers)) # O(len(self.pokeTeamMembers))
-
-        for i in range(len(self.pokeTeamMembers)): # O(len(self.pokeTeamMembers))
-            queue.append(self.pokeTeamMembers[i])
-
-        self.pokeTeamMembers = BM2SortedList(len(queue), new_order) # O(len(self.pokeTeamMembers))
-
-        for i in range(len(queue)): # O(len(self.pokeTeamMembers))
-            self.pokeTeamMembers.add(queue.serve()) # O(len(self.pokeTeamMembers))
-
-        # reverse pokedex sorting
-        self.pokeTeamMembers = PokeTeam.sort_by_pokedex(self.pokeTeamMembers, new_order)
+        self.pokeTeamMembers.reverse()
 
 
 
@@ -697,6 +704,9 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
         self.heal_times = 0
         self.won_against = None
         self.pokeTeamMembers = self.generate_team()
+        self.make_template()
+        self.fresh = True   # True while the team is as built or regenerated, before any pokemon leaves it
+        self.released = False   # True from release until from_spec hands the team out again
 
     def generate_team(self) -> CircularQueue | BM2SortedList:
         """
@@ -709,7 +719,7 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
         :return: CircularQueue (Battle mode 0 or 1) or BM2SortedList (Battle mode 2)
 
         :complexity: Best O(N), where N is sum of team_numbers
-                     Worst O(N^2), where N is sum of team_numbers
+                     Worst O(N log N), where N is sum of team_numbers
         """
         team_numbers = self.team_numbers
         if self.battle_mode == 0:
@@ -724,14 +734,13 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
 
         elif self.battle_mode == 2:
             # generate team for battle_mode 2 (BM2SortedList)
-            # the criterion is used as the key for each pokemon to get sorted in the ArraySortedList
-            self.bm = BattleMode2(team_numbers,self.criterion)                          # BattleMode2.pokeTeamMembers is sorted based on criterion
-            self.bm.pokeTeamMembers = self.sort_by_pokedex(self.bm.pokeTeamMembers, 1)  # Now it is sorted by pokedex to break ties in criterion
+            # the criterion is used as the key for each pokemon, with the pokedex breaking ties
+            self.bm = BattleMode2(team_numbers,self.criterion)
 
         return self.bm.pokeTeamMembers      # return the pokeTeamMembers as the team generated based on battle mode
 
     @classmethod
-    def random_team(cls, team_name: str, battle_mode: int, team_size=None, ai_mode=None, **kwargs) -> PokeTeam:
+    def random_team(cls, team_name: str, battle_mode: int, team_size=None, ai_mode=None, rng=RandomGen, **kwargs) -> PokeTeam:
         """
         Generate a team based on the team_number generated randomly for a random team.
 
@@ -739,6 +748,7 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
         :param arg2: team_numbers (list[int])  - List representing the number of specific pokemons to generate
         :param arg3: battle_mode (int)         - Integer representing battle mode for the team
         :param arg4: ai_type (PokeTeam.AI)     - AI Mode to be used by the Poke Team during battle
+        :param arg5: rng (RandomGen)           - random stream to generate the team from (default = RandomGen, the default stream)
 
         :pre: None
 
@@ -747,15 +757,105 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
         :complexity: Best O(N^2), where N is sum of team_numbers
                      Worst O(N^2), where N is sum of team_numbers
         """
-        team_numbers = cls.generate_random_team(team_size)
+        team_numbers = cls.generate_random_team(team_size, rng)
         return PokeTeam(team_name, team_numbers, battle_mode, ai_mode, **kwargs)
 
     @classmethod
-    def generate_random_team(cls, team_size:int|None = None) -> list[int]:
+    def random_spec(cls, battle_mode: int, team_size=None, ai_mode=None, rng=RandomGen, criterion=None) -> TeamSpec:
+        """
+        Generate the interned TeamSpec of a random team, drawing the same random numbers as random_team,
+        without building the team. The team is built when the spec is materialised with from_spec.
+
+        :param arg1: battle_mode (int)     - Integer representing battle mode for the team
+        :param arg2: team_size (int)       - number of pokemon in the team, or None for a random size (default = None)
+        :param arg3: ai_mode (PokeTeam.AI) - AI Mode to be used by the Poke Team during battle (default = None)
+        :param arg4: rng (RandomGen)       - random stream to generate the team from (default = RandomGen, the default stream)
+        :param arg5: criterion (Criterion) - Criterion to sort the members in battle mode 2 (default = None)
+
+        :pre: None
+
+        :return: TeamSpec of the random team
+
+        :complexity: Best O(N), where N is the maximum team size for PokeTeam object
+                     Worst O(N), where N is the maximum team size for PokeTeam object
+        """
+        return TeamSpec.of(cls.generate_random_team(team_size, rng), battle_mode, ai_mode, criterion)
+
+    @classmethod
+    def from_spec(cls, team_name: str, spec: TeamSpec, pool: TeamPool | None = None) -> PokeTeam:
+        """
+        Materialise a team of spec: a team of the same spec released to pool is regenerated and renamed when there is one,
+        otherwise a new team is built.
+
+        :param arg1: team_name (string) - Name for the Poke Team in string
+        :param arg2: spec (TeamSpec)    - spec of the team
+        :param arg3: pool (TeamPool)    - pool of released teams to reuse, or None to always build the team (default = None)
+
+        :pre: spec holds valid arguments for the PokeTeam constructor
+
+        :return: PokeTeam of spec, in the state of a new team
+
+        :complexity: Best O(N), where N is the sum of team_numbers, when a released team is reused
+                     Worst O(N log N), where N is the sum of team_numbers, when the team is built
+        """
+        team = None if pool is None else pool.take(spec)
+        if team is None:
+            return PokeTeam(team_name, list(spec.team_numbers), spec.battle_mode, spec.ai_type, spec.criterion)
+        team.team_name = team_name
+        team.won_against = None
+        team.regenerate_team()
+        return team
+
+    def spec(self) -> TeamSpec:
+        """
+        Return the TeamSpec of the team, interned by TeamSpec.of unless MAX_INTERNED_SPECS specs are interned already.
+
+        :param: None
+
+        :pre: None
+
+        :return: TeamSpec of the team
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        return TeamSpec.of(self.team_numbers, self.battle_mode, self.ai_type, self.criterion)
+
+    def release(self, pool: TeamPool) -> None:
+        """
+        Give the team back to pool, for from_spec to reuse with the same pool. The team must not be used after it is released.
+        Teams with a criterion value are not described by their spec and are not kept, nor are teams the pool is full for.
+
+        :param arg1: pool (TeamPool) - pool of released teams, owned by the caller
+
+        :pre: 
+        - the team is not used after the call
+        - the team was not released since from_spec handed it out (or it was built)
+
+        :raises ValueError: if the team is already released
+
+        :return: None
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        try:
+            assert not self.released, "Team is already released"
+            assert isinstance(pool, TeamPool), "pool must be a TeamPool object"
+        except AssertionError as e:
+            raise ValueError(e)
+
+        self.released = True
+        if self.criterion_value is None:
+            pool.put(self)
+
+    @classmethod
+    def generate_random_team(cls, team_size:int|None = None, rng=RandomGen) -> list[int]:
         """
         Generate list of integers as team_numbers for random team generation based on the team_size.
 
         :param arg1: team_size (int) - Integer representing the number of pokemon to generate in the team.
+        :param arg2: rng (RandomGen) - random stream to draw the numbers from (default = RandomGen, the default stream)
 
         :pre: team_size is a positive integer greater or equal to 0
 
@@ -767,7 +867,7 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
         team_numbers = list()
         if team_size is None:
             # Generate team size between half of poke limit and poke limit
-            team_size = RandomGen.randint(PokeTeam.MAX_TEAM_SIZE//2, PokeTeam.MAX_TEAM_SIZE)
+            team_size = rng.randint(PokeTeam.MAX_TEAM_SIZE//2, PokeTeam.MAX_TEAM_SIZE)
 
         try:
             assert isinstance(team_size, int) and team_size >= 0
@@ -783,7 +883,7 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
 
         # Generate and add 4 random numbers from 0 to team size
         for _ in range(4):
-            random_number = RandomGen.randint(0, team_size)
+            random_number = rng.randint(0, team_size)
             sorted_list_team_num.add(ListItem(random_number, random_number))
 
         team_numbers = []
@@ -796,63 +896,6 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
             second += 1
         return team_numbers
 
-    @classmethod
-    def sort_by_pokedex(self, lst: BM2SortedList, order: int) -> BM2SortedList:
-        """
-        Sorts the BM2SortedList based on its ListItem's key in specified order, where order 1 is ascending, order 0 is descending.
-        This method is called when breaking ties for criterion values of pokemon in the BM2SortedList.
-        This method uses Bubble sort for sorting.
-
-        :param arg1: lst (BM2SortedList) - BM2SortedList object to get sorted
-        :param arg2: order (int) - Integer representing ascending or descending order to get sorted.
-
-        :pre: 
-        - lst must be BM2SortedList object where BM2SortedList has swap method defined.
-        - order must be integer 0 or 1
-
-        :return: lst - Sorted BM2SortedList which is the Bm2SortedList passed in as argument   
-
-        :complexity: Best O(N), where N is the length of the BM2SortedList
-                     Worst O(N^2), where N is the length of the BM2SortedList
-        """
-        try:
-            assert lst is not None and isinstance(lst, BM2SortedList), "lst must be BM2SortedList object"
-            assert order is not None and isinstance(order, int) and (order == 0 or order == 1), "Order must be integer 0 (ascending) or 1 (descending) only"
-        except AssertionError as e:
-            raise ValueError(e)
-
-        if order == 1: # ascending pokedex
-            # traverse through all ListItems in BM2SortedList
-            for mark in range(len(lst) - 1, 0, -1):
-                swapped = False
-
-                # last "mark" elements are already in correct place
-                for i in range(mark):
-                    # if have same key(criterion), then check pokedex value to sort based on pokedex order
-                    if (lst[i].key == lst[i + 1].key) and (lst[i].value.pokedex > lst[i + 1].value.pokedex):
-                        lst.swap(i, i + 1)
-                        swapped = True
-
-                # if no swapping occur by inner loop, lst is sorted. Break the loop.
-                if not swapped:
-                    break
-            return lst
-            
-        elif order == 0: # descending pokedex
-            # traverse through all ListItems in BM2SortedList
-            for mark in range(len(lst) - 1, 0, -1):
-                swapped = False
-                # last "mark" elements are already in correct place
-                for i in range(mark):
-                    # if have same key(criterion), then check pokedex value to sort based on pokedex order
-                    if (lst[i].key == lst[i + 1].key) and (lst[i].value.pokedex < lst[i + 1].value.pokedex):
-                        lst.swap(i, i + 1)
-                        swapped = True
-                # if no swapping occur by inner loop, lst is sorted. Break the loop.
-                if not swapped:
-                    break
-            return lst            
-
     def bm_0_or_1_team(self, team_numbers: list[int]) -> ArraySortedList:
         """
         Creates an ArraySortedList for the PokeTeam object based on team_numbers passed in.
@@ -864,27 +907,18 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
 
         :return: pokeTeamMembers (ArraySortedList) - ArraySortedList with ListItems of pokemon and its order in pokedex
 
-        :complexity: Best O(N), where N is smallest possible number for specific pokemon.
-                     Worst O(N*M) where N is maximum team size for PokeTeam object, M is length of pokeTeamMembers
-        """
-        pokeTeamMembers = ArraySortedList(sum(team_numbers))
-        for i in range(5):
-            for j in range(len(team_numbers)):  # This executes constant times, since team_numbers is always 5
-                if i == j:
-                    for k in range(team_numbers[j]):    # Worst case: This case executes PokeTeam.MAX_TEAM_SIZE times
-                        # add Pokemon object and their pokedex order as ListItem into the ArraySortedList
-                        if i == 0:
-                            pokeTeamMembers.add(ListItem(Charmander(k), Charmander().pokedex))  # add is O(len(pokeTeamMembers))
-                        elif i == 1:
-                            pokeTeamMembers.add(ListItem(Bulbasaur(k), Bulbasaur().pokedex))
-                        elif i == 2:
-                            pokeTeamMembers.add(ListItem(Squirtle(k), Squirtle().pokedex))
-                        elif i == 3:
-                            pokeTeamMembers.add(ListItem(Gastly(k), Gastly().pokedex))
-                        elif i == 4:
-                            pokeTeamMembers.add(ListItem(Eevee(k), Eevee().pokedex))
+        :complexity: Best O(N), where N is the team size, since the pokemons are generated in pokedex order
+                     Worst O(N log N), where N is the team size, to sort the pokemons once
+        """
+        items = []
+        for i in range(len(team_numbers)):  # This executes constant times, since team_numbers is always 5
+            pokemon_class = TEAM_POKEMON[i]     # species registry lookup
+            for k in range(team_numbers[i]):    # Worst case: This case executes PokeTeam.MAX_TEAM_SIZE times
+                # Pokemon object and their pokedex order as ListItem
+                items.append(ListItem(pokemon_class(k), pokemon_class.SPECIES.pokedex))
 
-        return pokeTeamMembers
+        # sorted once into the ArraySortedList, rather than added one at a time
+        return ArraySortedList.from_items(items)
 
     def retrieve_pokemon(self) -> PokemonBase | None:
         """
@@ -896,9 +930,10 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
 
         :return: Pokemon object which inherits PokemonBase class.
         
-        :complexity: Best O(1), when battle mode is 0 or 1
-                     Worst O(N), where N is the length of ArraySortedList for PokeTeam in battle mode 2
+        :complexity: Best O(1)
+                     Worst O(1), in every battle mode
         """
+        self.fresh = False
         if isinstance(self.bm, BattleMode0):
             poke = BattleMode0.retrieve_pokemon(self)
             return poke
@@ -922,8 +957,9 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
         :complexity: Best O(N), where N is the length of pokeTeamMembers
                      Worst O(N^2), where N is the length of pokeTeamMembers
         """
+        self.fresh = False
         if poke is not None: 
-            poke.status = "free"
+            poke.status_code = Status.FREE
         poke.paralysis()
         if isinstance(self.bm, BattleMode0):
             BattleMode0.return_pokemon(self, poke)
@@ -931,8 +967,6 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
             BattleMode1.return_pokemon(self, poke)
         elif isinstance(self.bm, BattleMode2):
             BattleMode2.return_pokemon(self, poke)
-            order = self.pokeTeamMembers.order
-            self.pokeTeamMembers = self.sort_by_pokedex(self.pokeTeamMembers, order)
 
     def special(self) -> None:
         """  
@@ -947,6 +981,7 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
         :complexity: Best O(N), where N is length of pokeTeamMembers
                      Worst O(N^2), where N is length of pokeTeamMembers
         """
+        self.fresh = False
         if isinstance(self.bm, BattleMode0):
             BattleMode0.special(self)
         elif isinstance(self.bm, BattleMode1):
@@ -954,9 +989,32 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
         elif isinstance(self.bm, BattleMode2):
             BattleMode2.special(self)
 
+    def make_template(self) -> None:
+        """
+        Keep the initial roster of the team, which regenerate_team restores: the pokemon as created, and the ListItems of
+        pokeTeamMembers in queue order (Battle mode 0 or 1) or a snapshot of the BM2SortedList (Battle mode 2).
+
+        :param: None
+
+        :pre: pokeTeamMembers was just generated
+
+        :return: None
+
+        :complexity: Best O(N), where N is the length of pokeTeamMembers
+                     Worst O(N), where N is the length of pokeTeamMembers
+        """
+        if self.battle_mode == 2:
+            self.template = self.pokeTeamMembers.snapshot()
+            self.roster = tuple(item.value for item in self.template[0])
+        else:
+            self.template = tuple(self.poke_team_list[i] for i in range(len(self.poke_team_list)))
+            self.roster = tuple(item.value for item in self.template)
+
     def regenerate_team(self) -> None:
         """
-        Regenerate team based on its team_numbers and reset its heal_times to 0.
+        Regenerate team from its template and reset its heal_times to 0.
+        The pokemon created with the team are reset in place and put back in their initial order,
+        so no pokemon, ListItem or container is created.
 
         :param: None
 
@@ -964,24 +1022,26 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
 
         :return: None
 
-        :complexity: Best O(N), where N is the length of the pokeTeamMembers (Battle mode 0 or 1)
-                      Worst O(N^2), where N is the length of the pokeTeamMembers (Battle mode 2)
+        :complexity: Best O(N), where N is the sum of team_numbers
+                     Worst O(N), where N is the sum of team_numbers
         """
-        battle_mode = self.battle_mode
-        if battle_mode == 0 or battle_mode == 1:
-            # generate CircularQueue based on team_numbers for battle mode 0 and 1
-            pokeTeamList = self.bm_0_or_1_team(self.team_numbers)
-            bm = BattleMode0(pokeTeamList)
-            self.pokeTeamMembers = bm.pokeTeamMembers
+        for poke in self.roster:
+            poke.reset()
+
+        if self.battle_mode == 0 or self.battle_mode == 1:
+            # refill the queue with the ListItems of the initial roster for battle mode 0 and 1
+            members = self.pokeTeamMembers
+            members.clear()
+            for item in self.template:
+                members.append(item)
 
-        elif battle_mode == 2:
-            # generate ArraySortedList based on team_numbers for battle mode 2
-            self.pokeTeamMembers = self.bm_2_team(self.team_numbers)
-            # Sort in decresing pokemon order to break ties for criterion value
-            self.pokeTeamMembers = self.sort_by_pokedex(self.pokeTeamMembers, 1)
+        elif self.battle_mode == 2:
+            # restore the sorted team of the initial roster for battle mode 2
+            self.pokeTeamMembers.restore(self.template)
 
         # reset heal_times to 0
         self.heal_times = 0
+        self.fresh = True
 
     def __str__(self) -> str:
         """
@@ -1013,8 +1073,8 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
                 self.pokeTeamMembers.append(queue_items[i])
             
         elif self.battle_mode == 2:
-            # iterate through the whole ArraySortedList to get the string representation for each pokemon in the team
-            result += ", ".join([str(self.pokeTeamMembers[i].value) for i in range(len(self.pokeTeamMembers))])
+            # iterate through the whole team in order to get the string representation for each pokemon in the team
+            result += ", ".join([str(item.value) for item in self.pokeTeamMembers])
 
         return result + "]"
 
@@ -1037,12 +1097,13 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
         """
         return len(self.pokeTeamMembers) == 0
 
-    def choose_battle_option(self, my_pokemon: PokemonBase, their_pokemon: PokemonBase) -> Action:
+    def choose_battle_option(self, my_pokemon: PokemonBase, their_pokemon: PokemonBase, rng=RandomGen) -> Action:
         """ 
         This method returns Action chosen during battle by attacking pokemon based on its team's AI type/mode
 
         :param arg1: my_pokemon    - Attacking Pokemon object to choose battle option
         :param arg2: their_pokemon - Defending Pokemon object
+        :param arg3: rng           - random stream for the RANDOM AI (default = RandomGen, the default stream)
         :pre: None
         :return: Action enum class member        
         :complexity: Best O(N), where N is the length of actions list
@@ -1069,7 +1130,7 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
                 actions.remove(Action.HEAL)
             if self.ai_type == self.AI.RANDOM or self.ai_type is None:
                 # return a random action in the actions list
-                return actions[RandomGen.randint(0, len(actions) - 1)]
+                return actions[rng.randint(0, len(actions) - 1)]
 
             if self.ai_type == self.AI.USER_INPUT:
                 # prompt user for user input
@@ -1106,3 +1167,99 @@ class PokeTeam(BattleMode0, BattleMode1, BattleMode2):
         # return selected Action based on enum value
         return actions[user_input-1]
 
+
+
+class TeamSpec(NamedTuple):
+    """
+    Canonical description of a team, the arguments of the PokeTeam constructor after the team name.
+    team_numbers is a tuple and criterion is None outside battle mode 2, where it plays no part, so equal teams have
+    equal specs. Specs are hashable and interned by TeamSpec.of, and can be passed to worker processes.
+    """
+    team_numbers: tuple[int, ...]
+    battle_mode: int
+    ai_type: PokeTeam.AI | None
+    criterion: Criterion | None
+
+    @classmethod
+    def of(cls, team_numbers, battle_mode: int, ai_type: PokeTeam.AI | None = None, criterion: Criterion | None = None) -> TeamSpec:
+        """
+        Return the interned spec of a team, the same object for equal arguments.
+        Beyond MAX_INTERNED_SPECS specs, new specs are not interned: they are still equal (and hash alike) to equal specs.
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        spec = cls(tuple(team_numbers), battle_mode, ai_type, criterion if battle_mode == 2 else None)
+        interned = INTERNED_SPECS.get(spec)
+        if interned is None:
+            if len(INTERNED_SPECS) < MAX_INTERNED_SPECS:
+                INTERNED_SPECS[spec] = spec
+            return spec
+        return interned
+
+
+class TeamPool():
+    """
+    Released teams of each spec, for PokeTeam.from_spec to reuse. A pool is owned by the code which releases teams to it
+    (such as a chunk of leaderboard battles), and keeps at most max_teams teams of a spec, of at most max_specs specs.
+
+    :complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
+    """
+
+    MAX_SPECS = 4096    # default number of specs whose released teams are kept
+    MAX_TEAMS = 8       # default number of released teams kept for each spec
+
+    def __init__(self, max_specs: int = MAX_SPECS, max_teams: int = MAX_TEAMS) -> None:
+        """
+        TeamPool object initialiser, for an empty pool.
+
+        :param arg1: max_specs (int) - number of specs whose released teams are kept (default = TeamPool.MAX_SPECS)
+        :param arg2: max_teams (int) - number of released teams kept for each spec (default = TeamPool.MAX_TEAMS)
+
+        :pre: 
+        - max_specs is an integer greater or equal to 0
+        - max_teams is an integer greater than 0
+
+        :return: None
+        """
+        try:
+            assert isinstance(max_specs, int) and max_specs >= 0, "max_specs must be an integer greater or equal to 0"
+            assert isinstance(max_teams, int) and max_teams > 0, "max_teams must be an integer greater than 0"
+        except AssertionError as e:
+            raise ValueError(e)
+
+        self.max_specs = max_specs
+        self.max_teams = max_teams
+        self.idle: dict[TeamSpec, ArrayStack[PokeTeam]] = {}    # released teams of each spec
+
+    def take(self, spec: TeamSpec) -> PokeTeam | None:
+        """ Remove and return a released team of spec, or None if the pool has none. """
+        idle = self.idle.get(spec)
+        if idle is None or idle.is_empty():
+            return None
+        team = idle.pop()
+        team.released = False
+        return team
+
+    def put(self, team: PokeTeam) -> None:
+        """ Keep the released team for its spec, unless the pool is full for it. """
+        spec = team.spec()
+        idle = self.idle.get(spec)
+        if idle is None:
+            if len(self.idle) == self.max_specs:
+                return
+            idle = self.idle[spec] = ArrayStack(self.max_teams)
+        if not idle.is_full():
+            idle.push(team)
+
+    def __len__(self) -> int:
+        """ Magic method. Return the number of teams kept. O(S), where S is the number of specs kept """
+        return sum(len(idle) for idle in self.idle.values())
+
+    def clear(self) -> None:
+        """ Drop every team kept. """
+        self.idle = {}
+
+
+MAX_INTERNED_SPECS = 4096   # number of specs interned by TeamSpec.of
+INTERNED_SPECS: dict[TeamSpec, TeamSpec] = {}   # canonical object of every spec created by TeamSpec.of
@@ -1,823 +1,195 @@
 """
 This module implements Pokemon classes that inherits PokemonBase class.
-Methods, attributes and features that are specific to each Pokemon objects are implemented in this module,
-which allow initialisation of different types of Pokemon objects.
+Every species is a thin subclass of Pokemon, which creates, levels up, evolves and defends pokemon
+from the parameters of its species in the species registry (species.py).
 Each function has docstring which gives us description of the function.
 Unittests (Test cases) for the module will be located under tests\test_shared_methods.py
 
 """
+from __future__ import annotations
 __author__ = "Scaffold by Jackson Goerner, Code by Khor Jia Wynn"
 
-from pokemon_base import PokeType, PokemonBase
+from pokemon_base import PokemonBase, Status
+from species import SPECIES, Species, TEAM_SPECIES
 
-class Charizard(PokemonBase):
-    """
-    Complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
-    """
-    def __init__(self, current_status=None, current_hp_difference=0, instance = 0 ) -> None:
-        """
-        This method invoked automatically to set a newly created object's attributes to their initial state.
-
-        :param arg1: current_status (String) - the current status of Charizard (default = None)
-        :param arg2: current_hp_difference (int) - (default = 0)
-        :param arg3: instance (int) - the number of Charizard (default = 0)
-
-        :pre: None
-
-        :return: None
-        
-        """
-        self.level = 3
-        self.poke_type = PokeType.FIRE
-        self.hp = 12 + 1 * self.level
-        self.current_hp = self.hp - current_hp_difference
-        self.attack_stat = 10 + 2 * self.level
-        self.speed_stat = 9 + 1 * self.level
-        self.current_speed_stat = self.speed_stat
-        self.defence = 4
-        self.status = current_status
-        self.poke_name = "Charizard"
-        self.status_inflicted = "burn"
-        self.pokedex = 2
-        self.instance = instance
-        self.isParalysed = False
-
-    def defend(self, effective_damage: int) -> None:
-        """
-        This method will determine and update how much hp the pokemon has lost
-
-        :param: effective_damage (int) - the damage caused by the opponent
-
-        :pre: None
-
-        :return: None
-        """
-        if effective_damage > self.get_defence():
-            self.lose_hp(effective_damage * 2)
-        else:
-            self.lose_hp(effective_damage)
-
-
-    def level_up(self) -> None:
-        """
-        This method will level up the pokemon, update the attributes (hp, speed stat, attack_stat) of the pokemon object accordingly 
-
-        :param:  None
-
-        :pre: None
-
-        :return: None
-        """
-        self.level += 1
-        if self.get_hp() == self.hp:
-            self.hp += 1
-            self.current_hp += 1
-        else:
-            previous_max = self.hp
-            self.hp += 1
-            self.current_hp = self.hp - (previous_max - self.current_hp)
-        self.attack_stat += 2
-        if self.current_speed_stat == self.speed_stat:
-            self.speed_stat += 1
-            self.current_speed_stat += 1
-        else:
-            if self.isParalysed:
-                self.isParalysed = False # To get the updated current speed of the level-up pokemon
-            self.speed_stat += 1
-
-    def get_evolved_version(self) -> None:
-        """
-        This method will raise exception as the Charizard couldn't evolve anymore
-
-        :param: None
+POKEMON_CLASSES = {}    # class of every species, by species name
 
-        :pre: None
-
-        :return: None
-        """
-        raise Exception(self.poke_name + " cannot evolve!")
-
-
-class Charmander(PokemonBase):
+class Pokemon(PokemonBase):
     """
-    Complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
-    """
-    def __init__(self, instance = 0) -> None:
-        """
-        This method invoked automatically to set a newly created object's attributes to their initial state.
-
-        :param: instance (int) - the number of Charmander (default = 0)
+    Pokemon of the species SPECIES, which every subclass sets. The species constants of PokemonBase are
+    copied from SPECIES onto the class when it is defined, so pokemon only store their own state.
+    Subclasses declare empty __slots__ to keep pokemon without an instance __dict__.
 
-        :pre: None
-
-        :return: None
-        """
-        self.level = 1
-        self.poke_type = PokeType.FIRE
-        self.hp = 8 + 1 * self.level
-        self.current_hp = self.hp
-        self.attack_stat = 6 + 1 * self.level
-        self.speed_stat = 7 + 1 * self.level
-        self.current_speed_stat = self.speed_stat
-        self.defence = 4
-        self.status = "free"
-        self.poke_name = "Charmander"
-        self.status_inflicted = "burn"
-        self.evolve_level = 3
-        self.pokedex = 1
-        self.instance = instance
-        self.isParalysed = False
-
-    def defend(self, effective_damage: int) -> None:
-        """
-        This method will determine and update how much hp the pokemon has lost
-
-        :param: effective_damage (int) - the damage caused by the opponent
-        
-        :pre: None
-        
-        :return: None
-        """
-        if effective_damage > self.get_defence():
-            self.lose_hp(effective_damage)
-        else:
-            self.lose_hp(effective_damage // 2)
-
-    def level_up(self) -> None:
-        """
-        This method will level up the pokemon, update the respective attributes of the pokemon object accordingly 
-
-        :param:  None
-
-        :pre: None
-
-        :return: None
-        """
-        self.level += 1
-        if self.get_hp() == self.hp:
-            self.hp += 1
-            self.current_hp += 1
-        else:
-            previous_max = self.hp
-            self.hp += 1
-            self.current_hp = self.hp - (previous_max - self.current_hp)
-        self.attack_stat += 1
-        if self.current_speed_stat == self.speed_stat:
-            self.speed_stat += 1
-            self.current_speed_stat += 1
-        else:
-            if self.isParalysed:
-                self.isParalysed = False # To get the updated current speed of the level-up pokemon
-            self.speed_stat += 1
-
-    def get_evolved_version(self) -> Charizard:
-        """
-        This method will get the object of evolved pokemon
-
-        :param:  None
-        
-        :pre: None
-        
-        :return: Charizard (Pokemon) - the object of Charizard
-        """
-        current_hp_difference = self.hp - self.current_hp
-        return Charizard(self.status, current_hp_difference, self.instance)
-
-
-class Venusaur(PokemonBase):
-    """
     Complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
     """
-    def __init__(self, current_status=None, current_hp_difference=0, instance = 0) -> None:
-        """
-        This method invoked automatically to set a newly created object's attributes to their initial state.
+    __slots__ = ()
+    SPECIES: Species | None = None
 
-        :param arg1: current_status (String) - the current status of Venusaur (default = None)
-        :param arg2: current_hp_difference (int) - (default = 0)
-        :param arg3: instance (int) - the number of Charizard (default = 0)
-        
-        :pre: None
-        
-        :return: None
-        """
-        self.level = 2
-        self.poke_type = PokeType.GRASS
-        self.hp = 20 + self.level // 2
-        self.current_hp = self.hp - current_hp_difference
-        self.attack_stat = 5
-        self.speed_stat = 3 + self.level // 2
-        self.current_speed_stat = self.speed_stat
-        self.defence = 10
-        self.status = current_status
-        self.poke_name = "Venusaur"
-        self.status_inflicted = "poison"
-        self.pokedex = 4
-        self.instance = instance
-        self.isParalysed = False
-
-    def defend(self, effective_damage: int) -> None:
-        """
-        This method will determine and update how much hp the pokemon has lost
+    def __init_subclass__(cls, **kwargs) -> None:
+        """ Set the species constants of the class and register it """
+        super().__init_subclass__(**kwargs)
+        species = cls.SPECIES
+        if species is not None:
+            cls.poke_name = species.name
+            cls.status_inflicted = species.status_inflicted
+            cls.status_inflicted_code = Status.of(species.status_inflicted)
+            cls.evolve_level = species.evolve_level
+            cls.pokedex = species.pokedex
+            POKEMON_CLASSES[species.name] = cls
 
-        :param: arg1 effective_damage (int) - the damage caused by the opponent
-        
-        :pre: None
-        
-        :return: None
-        """
-        if effective_damage > (self.get_defence()+5):
-            self.lose_hp(effective_damage)
-        else:
-            self.lose_hp(effective_damage // 2)
-
-    def level_up(self) -> None:
-        """
-        This method will level up the pokemon, update the respective attributes of the pokemon object accordingly 
-
-        :param:  None
-        
-        :pre: None
-        
-        :return: None
-        """
-        self.level += 1
-        if self.get_hp() == self.hp:
-            self.hp = 20 + (self.get_level()//2)
-            self.current_hp = self.hp
-        else:
-            previous_max = self.hp
-            self.hp = 20 + self.get_level()//2
-            self.current_hp = self.hp - (previous_max - self.current_hp)
-        if self.current_speed_stat == self.speed_stat:
-            self.speed_stat = 3 + (self.get_level()//2)
-            self.current_speed_stat = 3 + (self.get_level()//2)
-        else:
-            if self.isParalysed:
-                self.isParalysed = False # To get the updated current speed of the level-up pokemon
-            self.speed_stat = 3 + (self.get_level()//2)
-
-    def get_evolved_version(self) -> None:
-        """
-        This method will raise exception as the Venusaur couldn't evolve anymore
-
-        :param:  None
-        
-        :pre: None
-        
-        :return: None
-        """
-        raise Exception(self.poke_name + " cannot evolve!")
-
-
-class Bulbasaur(PokemonBase):
-    """
-    Complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
-    """
-    def __init__(self, instance = 0) -> None:
+    def __init__(self, current_status=None, current_hp_difference=0, instance=0) -> None:
         """
         This method invoked automatically to set a newly created object's attributes to their initial state.
 
-        :param: arg1 instance (int) - the number of Bulbasaur (default = 0)
-        
-        :pre: None
-        
-        :return: None
-        """
-        self.level = 1
-        self.poke_type = PokeType.GRASS
-        self.hp = 12 + 1*self.level
-        self.current_hp = self.hp
-        self.attack_stat = 5
-        self.speed_stat = 7 + self.level//2
-        self.current_speed_stat = self.speed_stat
-        self.defence = 5
-        self.status = "free"
-        self.poke_name = "Bulbasaur"
-        self.status_inflicted = "poison"
-        self.evolve_level = 2
-        self.pokedex = 3
-        self.instance = instance
-        self.isParalysed = False
-
-    def defend(self, effective_damage: int) -> None:
-        """
-        This method will determine and update how much hp the pokemon has lost
-
-        :param: arg1 effective_damage (int) - the damage caused by the opponent
-        
-        :pre: None
-        
-        :return: None
-        """
-        if effective_damage > (self.get_defence()+5):
-            self.lose_hp(effective_damage)
-        else:
-            self.lose_hp(effective_damage // 2)
-
-    def level_up(self) -> None:
-        """
-        This method will level up the pokemon, update the respective attributes of the pokemon object accordingly 
-
-        :param:  None
-        
-        :pre: None
-        
-        :return: None
-        """
-        self.level += 1
-        if self.get_hp() == self.hp:
-            self.hp += 1
-            self.current_hp += 1
-        else:
-            previous_max = self.hp
-            self.hp += 1
-            self.current_hp = self.hp - (previous_max - self.current_hp)
-
-        if self.current_speed_stat == self.speed_stat:
-            self.speed_stat = 7 + (self.get_level()//2)
-            self.current_speed_stat = 7 + (self.get_level()//2)
-        else:
-            if self.isParalysed:
-                self.isParalysed = False # To get the updated current speed of the level-up pokemon
-            self.speed_stat = 7 + (self.get_level()//2)
-
-    def get_evolved_version(self) -> Venusaur:
-        """
-        This method will get the object of evolved pokemon
+        :param arg1: current_status (String or Status) - the current status of the pokemon, None for no status (default = None)
+        :param arg2: current_hp_difference (int) - hp lost before evolving into this pokemon (default = 0)
+        :param arg3: instance (int) - the number of the pokemon (default = 0)
 
-        :param:  None
-        
         :pre: None
-        
-        :return: Venusaur (Pokemon) - the object of Venusaur
-        """
-        current_hp_difference = self.hp - self.current_hp
-        return Venusaur(self.status, current_hp_difference, self.instance)
-
-
-class Blastoise(PokemonBase):
-    """
-    Complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
-    """
-    def __init__(self, current_status=None, current_hp_difference=0, instance = 0) -> None:
-        """
-        This method invoked automatically to set a newly created object's attributes to their initial state.
 
-        :param arg1: current_status (String) - the current status of Blastoise (default = None)
-        :param arg2: current_hp_difference (int) - (default = 0)
-        :param arg3: instance (int) - the number of Blastoise (default = 0)
-        
-        :pre: None
-        
         :return: None
         """
-        self.level = 3
-        self.poke_type = PokeType.WATER
-        self.hp = 15 + 2 * self.level
+        species = self.SPECIES
+        self.level = species.level
+        self.poke_type = species.poke_type
+        self.hp = species.hp
         self.current_hp = self.hp - current_hp_difference
-        self.attack_stat = 8 + self.level // 2
-        self.speed_stat = 10
-        self.current_speed_stat = self.speed_stat
-        self.defence = 8 + 1 * self.level
-        self.status = current_status
-        self.poke_name = "Blastoise"
-        self.status_inflicted = "paralysis"
-        self.pokedex = 6
-        self.instance = instance
-        self.isParalysed = False
-
-    def defend(self, effective_damage: int) -> None:
-        """
-        This method will determine and update how much hp the pokemon has lost
-
-        :param: arg1 effective_damage (int) - the damage caused by the opponent
-        
-        :pre: None
-        
-        :return: None
-        """
-        if effective_damage > (2 * self.get_defence()):
-            self.lose_hp(effective_damage)
-        else:
-            self.lose_hp(effective_damage // 2)
-
-    def level_up(self) -> None:
-        """
-        This method will level up the pokemon, update the respective attributes of the pokemon object accordingly 
-
-        :param:  None
-        
-        :pre: None
-        
-        :return: None
-        """
-        self.level += 1
-        if self.get_hp() == self.hp:
-            self.hp += 2
-            self.current_hp += 2
-        else:
-            previous_max = self.hp
-            self.hp += 2
-            self.current_hp = self.hp - (previous_max - self.current_hp)
-        self.attack_stat = 8 + (self.get_level()//2)
-        self.defence += 1
-
-    def get_evolved_version(self) -> None:
-        """
-        This method will raise exception as the Blastoise couldn't evolve anymore
-
-        :param:  None
-        
-        :pre: None
-        
-        :return: None
-        """
-        raise Exception(self.poke_name + " cannot evolve!")
-
-class Squirtle(PokemonBase):
-    """
-    Complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
-    """
-    def __init__(self, instance = 0) -> None:
-        """
-        This method invoked automatically to set a newly created object's attributes to their initial state.
-
-        :param: instance (int) - the number of Squirtle (default = 0)
-        
-        :pre: None
-        
-        :return: None
-        """
-        self.level = 1
-        self.poke_type = PokeType.WATER
-        self.hp = 9 + 2 * self.level
-        self.current_hp = self.hp
-        self.attack_stat = 4 + self.level // 2
-        self.speed_stat = 7
+        self.attack_stat = species.attack
+        self.speed_stat = species.speed
         self.current_speed_stat = self.speed_stat
-        self.defence = 6 + self.level
-        self.status = "free"
-        self.poke_name = "Squirtle"
-        self.status_inflicted = "paralysis"
-        self.evolve_level = 3
-        self.pokedex = 5
+        self.defence = species.defence
+        self.status_code = Status.of(current_status)
         self.instance = instance
         self.isParalysed = False
 
-    def defend(self, effective_damage: int) -> None:
-        """
-        This method will determine and update how much hp the pokemon has lost
-
-        
-        :param: effective_damage (int) - the damage caused by the opponent
-        
-        :pre: None
-        
-        :return: None
-        """
-        if effective_damage > (2 * self.get_defence()):
-            self.lose_hp(effective_damage)
-        else:
-            self.lose_hp(effective_damage // 2)
-
-    def level_up(self) -> None:
+    def reset(self) -> None:
         """
-        This method will level up the pokemon, update the respective attributes of the pokemon object accordingly 
+        Restore the pokemon in place to the state it joins a team in: at the base level of its species, unhurt and free of status.
 
-        
         :param: None
-        
-        :pre: None
-        
-        :return: None
-        """
-        self.level += 1
-        if self.get_hp() == self.hp:
-            self.hp += 2
-            self.current_hp += 2
-        else:
-            previous_max = self.hp
-            self.hp += 2
-            self.current_hp = self.hp - (previous_max - self.current_hp)
-        self.attack_stat = 4 + (self.get_level()//2)
-        self.defence += 1
-
-    def get_evolved_version(self) -> Blastoise:
-        """
-        This method will get the object of evolved pokemon
-
-        
-        :param:  None
-        
-        :pre: None
-        
-        :return: Blastoise (Pokemon) - the object of Blastoise
-        """
-        current_hp_difference = self.hp - self.current_hp
-        return Blastoise(self.status, current_hp_difference, self.instance)
-
-
-class Gengar(PokemonBase):
-    """
-    Complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
-    """
-    def __init__(self, current_status=None, current_hp_difference=0, instance = 0) -> None:
-        """
-        This method invoked automatically to set a newly created object's attributes to their initial state.
-
-        :param arg1: current_status (String) - the current status of Gengar (default = None)
-        :param arg2: current_hp_difference (int) - (default = 0)
-        :param arg3: instance (int) - the number of Gengar (default = 0)
 
         :pre: None
 
         :return: None
         """
-        self.level = 3
-        self.poke_type = PokeType.GHOST
-        self.hp = 12 + self.level//2
-        self.current_hp = self.hp - current_hp_difference
-        self.attack_stat = 18
-        self.speed_stat = 12
-        self.current_speed_stat = self.speed_stat
-        self.defence = 3
-        self.status = current_status
-        self.poke_name = "Gengar"
-        self.status_inflicted = "sleep"
-        self.pokedex = 9
-        self.instance = instance
-        self.isParalysed = False
+        Pokemon.__init__(self, Status.FREE, 0, self.instance)
 
     def defend(self, effective_damage: int) -> None:
         """
-        This method will update how much hp the pokemon has lost
+        This method will determine and update how much hp the pokemon has lost, by the defend rule of its species
 
-        :param:  arg1 effective_damage (int) - the damage caused by the opponent
+        :param: effective_damage (int) - the damage caused by the opponent
 
         :pre: None
 
         :return: None
         """
-        self.lose_hp(effective_damage)
+        self.lose_hp(self.SPECIES.defend.hp_lost(effective_damage, self.get_defence()))
 
     def level_up(self) -> None:
         """
-        This method will level up the pokemon, update the respective attributes of the pokemon object accordingly 
+        This method will level up the pokemon, update the attributes of the pokemon by the growth of its species.
+        Hp lost is kept, and a speed debuff from paralysis is removed when the speed changes.
 
-        :param:  None
+        :param: None
 
         :pre: None
 
         :return: None
         """
+        species = self.SPECIES
         self.level += 1
-        if self.get_hp() == self.hp:
-            self.hp = 12 + self.get_level()//2
-            self.current_hp = self.hp
-        else:
-            previous_max = self.hp
-            self.hp = 12 + self.get_level()//2
-            self.current_hp = self.hp - (previous_max - self.current_hp)
-
-    def get_evolved_version(self) -> None:
-        """
-        This method will raise exception as the Gengar couldn't evolve anymore
-
-        :param:  None
-
-        :pre: None
-
-        :return: None
-        """
-        raise Exception(self.poke_name + " cannot evolve!")
-
-
-class Haunter(PokemonBase):
-    """
-    Complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
-    """
-    def __init__(self, current_status=None, current_hp_difference=0, instance = 0) -> None:
-        """
-        This method invoked automatically to set a newly created object's attributes to their initial state.
-
-        :param arg1: current_status (String) - the current status of Haunter (default = None)
-        :param arg2: current_hp_difference (int) - (default = 0)
-        :param arg3: instance (int) - the number of Haunter (default = 0)
+        previous_max = self.hp
+        self.hp = species.hp_growth.apply(self.hp, self.level)
+        self.current_hp = self.hp - (previous_max - self.current_hp)
+        self.attack_stat = species.attack_growth.apply(self.attack_stat, self.level)
+        if species.speed_growth is not None:
+            speed = species.speed_growth.apply(self.speed_stat, self.level)
+            if self.current_speed_stat == self.speed_stat:
+                self.current_speed_stat = speed
+            elif self.isParalysed:
+                self.isParalysed = False # To get the updated current speed of the level-up pokemon
+            self.speed_stat = speed
+        self.defence = species.defence_growth.apply(self.defence, self.level)
 
-        :pre: None
-        
-        :return: None
+    def can_evolve(self) -> bool:
         """
-        self.level = 1
-        self.poke_type = PokeType.GHOST
-        self.hp = 9 + self.level//2
-        self.current_hp = self.hp - current_hp_difference
-        self.attack_stat = 8
-        self.speed_stat = 6
-        self.current_speed_stat = self.speed_stat
-        self.defence = 6
-        self.status = current_status
-        self.poke_name = "Haunter"
-        self.status_inflicted = "sleep"
-        self.evolve_level = 3
-        self.pokedex = 8
-        self.instance = instance
-        self.isParalysed = False
+        Check if the species of the pokemon has an evolution in the species registry
 
-    def defend(self, effective_damage: int) -> None:
-        """
-        This method will update how much hp the pokemon has lost
-
-        :param: arg1 effective_damage (int) - the damage caused by the opponent
+        :param: None
 
         :pre: None
 
-        :return: None
+        :return: boolean - True, if the pokemon can be evolved
         """
-        self.lose_hp(effective_damage)
+        return self.SPECIES.evolves_to is not None
 
-    def level_up(self) -> None:
+    def get_evolved_version(self) -> PokemonBase:
         """
-        This method will level up the pokemon, update the respective attributes of the pokemon object accordingly 
+        This method will get the object of the evolved pokemon, which keeps the status and hp lost
 
-        :param:  None
+        :param: None
 
         :pre: None
 
-        :return: None
-        """
-        self.level += 1
-        if self.get_hp() == self.hp:
-            self.hp = 9 + self.get_level()//2
-            self.current_hp = self.hp
-        else:
-            previous_max = self.hp
-            self.hp = 9 + self.get_level()//2
-            self.current_hp = self.hp - (previous_max - self.current_hp)
-        self.defence += 1
-
-    def get_evolved_version(self) -> Gengar:
-        """
-        This method will get the object of evolved pokemon
+        :return: the object of the evolution of the species
 
-        :param:  None
-
-        :pre: None
-
-        :return: Gengar (Pokemon) - the object of Gengar
+        :raises Exception: if the species cannot evolve
         """
+        if not self.SPECIES.can_evolve():
+            raise Exception(self.poke_name + " cannot evolve!")
         current_hp_difference = self.hp - self.current_hp
-        return Gengar(self.status, current_hp_difference, self.instance)
+        return POKEMON_CLASSES[self.SPECIES.evolves_to](self.status_code, current_hp_difference, self.instance)
 
+class BasePokemon(Pokemon):
+    """ Pokemon of a species which a PokeTeam is made of, created unhurt and free of status """
+    __slots__ = ()
 
-class Gastly(PokemonBase):
-    """
-    Complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
-    """
-    def __init__(self, instance = 0) -> None:
+    def __init__(self, instance=0) -> None:
         """
-        This method invoked automatically to set a newly created object's attributes to their initial state.
-
-        :param: arg1 instance (int) - the number of Gastly (default = 0)
-
-        :pre: None
-
-        :return: None
+        :param: instance (int) - the number of the pokemon (default = 0)
         """
-        self.level = 1
-        self.poke_type = PokeType.GHOST
-        self.hp = 6 + self.level//2
-        self.current_hp = self.hp
-        self.attack_stat = 4
-        self.speed_stat = 2
-        self.current_speed_stat = self.speed_stat
-        self.defence = 8
-        self.status = "free"
-        self.poke_name = "Gastly"
-        self.status_inflicted = "sleep"
-        self.evolve_level = 1
-        self.pokedex = 7
-        self.instance = instance
-        self.isParalysed = False
-
-    def defend(self, effective_damage: int) -> None:
-        """
-        This method will update how much hp the pokemon has lost
+        Pokemon.__init__(self, Status.FREE, 0, instance)
 
-        :param: effective_damage (int) - the damage caused by the opponent
+class Charmander(BasePokemon):
+    __slots__ = ()
+    SPECIES = SPECIES["Charmander"]
 
-        :pre: None
+class Charizard(Pokemon):
+    __slots__ = ()
+    SPECIES = SPECIES["Charizard"]
 
-        :return: None
-        """
-        self.lose_hp(effective_damage)
+class Bulbasaur(BasePokemon):
+    __slots__ = ()
+    SPECIES = SPECIES["Bulbasaur"]
 
-    def level_up(self) -> None:
-        """
-        This method will level up the pokemon, update the respective attributes of the pokemon object accordingly 
+class Venusaur(Pokemon):
+    __slots__ = ()
+    SPECIES = SPECIES["Venusaur"]
 
-        :param:  None
+class Squirtle(BasePokemon):
+    __slots__ = ()
+    SPECIES = SPECIES["Squirtle"]
 
-        :pre: None
+class Blastoise(Pokemon):
+    __slots__ = ()
+    SPECIES = SPECIES["Blastoise"]
 
-        :return: None
-        """
-        self.level += 1
-        if self.get_hp() == self.hp:
-            self.hp = 6 + self.get_level()//2
-            self.current_hp = self.hp
-        else:
-            previous_max = self.hp
-            self.hp = 6 + self.get_level()//2
-            self.current_hp = self.hp - (previous_max - self.current_hp)
-
-    def get_evolved_version(self) -> Haunter:
-        """
-        This method will get the object of evolved pokemon
+class Gastly(BasePokemon):
+    __slots__ = ()
+    SPECIES = SPECIES["Gastly"]
 
-        :param:  None
+class Haunter(Pokemon):
+    __slots__ = ()
+    SPECIES = SPECIES["Haunter"]
 
-        :pre: None
+class Gengar(Pokemon):
+    __slots__ = ()
+    SPECIES = SPECIES["Gengar"]
 
-        :return: Haunter (Pokemon) - the object of Haunter
-        """
-        current_hp_difference = self.hp - self.current_hp
-        return Haunter(self.status, current_hp_difference, self.instance)
+class Eevee(BasePokemon):
+    __slots__ = ()
+    SPECIES = SPECIES["Eevee"]
 
-
-class Eevee(PokemonBase):
-    """
-    Complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
-    """
-    def __init__(self, instance = 0) -> None:
-        """
-        This method invoked automatically to set a newly created object's attributes to their initial state.
-
-        :param: instance (int) - the number of Eevee (default = 0)
-
-        :pre: None
-
-        :return: None
-        """
-        self.level = 1
-        self.poke_type = PokeType.NORMAL
-        self.hp = 10
-        self.current_hp = self.hp
-        self.attack_stat = 6 + self.level
-        self.speed_stat = 7 + self.level
-        self.current_speed_stat = self.speed_stat
-        self.defence = 4 + self.level
-        self.status = "free"
-        self.poke_name = "Eevee"
-        self.status_inflicted = "confuse"
-        self.pokedex = 10
-        self.instance = instance
-        self.isParalysed = False
-
-    def defend(self, effective_damage: int) -> None:
-        """
-        This method will determine and update how much hp the pokemon has lost
-
-        :param: effective_damage (int) - the damage caused by the opponent
-        
-        :pre: None
-
-        :return: None
-        """
-        if effective_damage >= self.get_defence():
-            self.lose_hp(effective_damage)
-        else:
-            self.lose_hp(0)
-
-    def level_up(self) -> None:
-        """
-        This method will level up the pokemon, update the respective attributes of the pokemon object accordingly 
-
-        :param: None
-        
-        :pre: None
-        
-        :return: None
-        """
-        self.level += 1
-        self.attack_stat += 1
-        if self.current_speed_stat == self.speed_stat:
-            self.speed_stat += 1
-            self.current_speed_stat += 1
-        else:
-            if self.isParalysed:
-                self.isParalysed = False # To get the updated current speed of the level-up pokemon
-            self.speed_stat += 1
-        self.defence += 1
-
-    def get_evolved_version(self) -> None:
-        """
-        This method will raise exception as the Eevee couldn't evolve anymore
-
-        :param:  None
-        
-        :pre: None
-        
-        :return: None
-        """
-        raise Exception(self.poke_name + " cannot evolve!")
\ No newline at end of file
+# classes of the team_numbers of a PokeTeam, in order
+TEAM_POKEMON = tuple(POKEMON_CLASSES[species.name] for species in TEAM_SPECIES)
@@ -12,8 +12,11 @@ Unittests (Test cases) for the module will be located under tests\test_shared_me
 __author__ = "Scaffold by Jackson Goerner, Code by Khor Jia Wynn, Tee Zhi Hui"
 
 from abc import ABC, abstractmethod
+from array import array
 from random_gen import RandomGen
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
+from typing import NamedTuple
+from battle_events import Asleep, ConfusedSelfHit, Burning, Attack, StatusDamage, StatusInflicted, AlreadyParalysed, Paralysed
 
 class PokeType(Enum):
     """Enum class containing Pokemon types"""
@@ -23,10 +26,95 @@ class PokeType(Enum):
     GHOST = auto()
     NORMAL = auto()
 
+# small integer id of every type, used to index TYPE_EFFECTIVENESS
+TYPE_ID = {poke_type: poke_type.value - 1 for poke_type in PokeType}
+
+# TYPE_EFFECTIVENESS[attacker type id][defender type id] is the multiplier of the damage of an attack
+#                     FIRE  GRASS  WATER  GHOST  NORMAL  (defender)
+TYPE_EFFECTIVENESS = ((1,    2,     0.5,   1,     1),     # FIRE
+                      (0.5,  1,     2,     1,     1),     # GRASS
+                      (2,    0.5,   1,     1,     1),     # WATER
+                      (1.25, 1.25,  1.25,  2,     0),     # GHOST
+                      (1.25, 1.25,  1.25,  0,     1))     # NORMAL
+
+# row-major flat copy of TYPE_EFFECTIVENESS for vectorised engines (numpy.frombuffer(TYPE_EFFECTIVENESS_FLAT).reshape(5, 5))
+TYPE_EFFECTIVENESS_FLAT = array("d", [multiplier for row in TYPE_EFFECTIVENESS for multiplier in row])
+
+class Status(IntEnum):
+    """Status codes of a pokemon, which index STATUS_EFFECTS and STATUS_NAME and are used as is by array based engines"""
+    FREE = 0
+    BURN = 1
+    POISON = 2
+    PARALYSIS = 3
+    SLEEP = 4
+    CONFUSE = 5
+
+    @classmethod
+    def of(cls, status) -> Status:
+        """
+        Status code of status, given as a code or by its name ("free", "burn", ...). None is FREE.
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        try:
+            return STATUS_OF[status]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid status {status!r}")
+
+# name of every status code, the string form of PokemonBase.status
+STATUS_NAME = tuple(status.name.lower() for status in Status)
+
+# status codes by code, by name, and None for no status
+STATUS_OF = {**{status: status for status in Status}, **{name: Status(code) for code, name in enumerate(STATUS_NAME)}, None: Status.FREE}
+
+class StatusEffect(NamedTuple):
+    """
+    Effects of a status on the pokemon which has it: its attack damage is multiplied by attack_multiplier, it loses
+    self_damage hp after attacking, it attacks itself half of the time if confused, and its speed is halved if
+    halves_speed. announce is the event emitted before it attacks, if any.
+    """
+    attack_multiplier: float
+    self_damage: int
+    confused: bool
+    halves_speed: bool
+    announce: type | None
+
+# STATUS_EFFECTS[status code] are the effects of the status
+STATUS_EFFECTS = (
+    StatusEffect(1,   0, False, False, None),       # FREE
+    StatusEffect(0.5, 1, False, False, Burning),    # BURN
+    StatusEffect(1,   3, False, False, None),       # POISON
+    StatusEffect(1,   0, False, True,  None),       # PARALYSIS
+    StatusEffect(1,   0, False, False, Asleep),     # SLEEP
+    StatusEffect(1,   0, True,  False, None),       # CONFUSE
+)
+
+def effectiveness(attacker: PokeType, defender: PokeType) -> float:
+    """
+    Get the multiplier of the damage of an attack of a pokemon of type attacker on a pokemon of type defender.
+
+    :complexity: Best O(1)
+                 Worst O(1)
+    """
+    return TYPE_EFFECTIVENESS[TYPE_ID[attacker]][TYPE_ID[defender]]
+
 class PokemonBase(ABC):
     """
+    Pokemon keep only their own state in __slots__, without an instance __dict__. Data which is the same for every
+    pokemon of a species (name, status inflicted, evolve level, pokedex number) is kept on the class.
+
     :complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
     """
+    __slots__ = ("level", "_poke_type", "type_id", "hp", "current_hp", "attack_stat", "speed_stat",
+                 "current_speed_stat", "defence", "status_code", "instance", "isParalysed")
+
+    # species constants, set on the class by the subclasses
+    poke_name = ""
+    status_inflicted = ""
+    status_inflicted_code = Status.FREE
+    evolve_level = 0
+    pokedex = 0
 
     def __init__(self, hp: int, poke_type: PokeType) -> None:
         """ 
@@ -57,13 +145,31 @@ class PokemonBase(ABC):
         self.speed_stat = int()
         self.current_speed_stat = int()
         self.defence = int()
-        self.status = "free"
-        self.poke_name = ""
-        self.status_inflicted = ""
-        self.evolve_level = int()
-        self.pokedex = int()
+        self.status_code = Status.FREE
+        self.instance = int()
         self.isParalysed = False
 
+    @property
+    def poke_type(self) -> PokeType:
+        """ The type of the pokemon """
+        return self._poke_type
+
+    @poke_type.setter
+    def poke_type(self, poke_type: PokeType) -> None:
+        """ Set the type of the pokemon and cache its type id (see TYPE_ID) """
+        self._poke_type = poke_type
+        self.type_id = TYPE_ID[poke_type]
+
+    @property
+    def status(self) -> str:
+        """ Name of the status of the pokemon (see STATUS_NAME) """
+        return STATUS_NAME[self.status_code]
+
+    @status.setter
+    def status(self, status) -> None:
+        """ Set the status of the pokemon, by code or by name (see Status.of) """
+        self.status_code = Status.of(status)
+
     def is_fainted(self) -> bool:
         """ 
         If the pokemon has hp is less than or equal to 0, then the pokemon has fainted
@@ -196,55 +302,54 @@ class PokemonBase(ABC):
     def defend(self, damage: int) -> None:
         pass
 
-    def attack(self, other: PokemonBase):
+    def attack(self, other: PokemonBase, sink=None, rng=RandomGen):
         """ 
         Attack the pokemon of the opponent on the field by its status
 
-        :param:nother (PokemonBase) - the object of PokemonBase
+        :param arg1: other (PokemonBase) - the object of PokemonBase
+        :param arg2: sink (callable) - receives the battle events of the attack, no event is built when None (default = None)
+        :param arg3: rng (RandomGen) - random stream for the confusion and status rolls (default = RandomGen, the default stream)
 
         :pre: None
 
         :return: None
         
         :complexity:
-        Best: O(comp), where comp is the complexity of status comparison.
-        Worst: O(comp), where comp is the complexity of status comparison.
+        Best: O(1), the effects of the status are looked up in STATUS_EFFECTS by its code.
+        Worst: O(1), the effects of the status are looked up in STATUS_EFFECTS by its code.
         """
-        attack_multiplier = 1
+        effect = STATUS_EFFECTS[self.status_code]
         # Step 1: Status effects on attack damage / redirecting attacks
-        if self.status == "sleep": 
-            print(self.poke_name, 'is asleep!')
-            pass
-        elif self.status == "confuse": 
-            if RandomGen.random_chance(0.5): 
-                print(self.poke_name, 'is confused and attacked itself!')
-                other = self
-        elif self.status == "burn": 
-            print(f"Because {self.get_poke_name()} is burning, it only deals half damage!")
-            attack_multiplier = 0.5
+        if effect.announce is not None and sink is not None:
+            sink(effect.announce(self.poke_name))
+        if effect.confused and rng.random_chance(0.5):
+            if sink is not None:
+                sink(ConfusedSelfHit(self.poke_name))
+            other = self
 
         # Step 2: Do the attack
-        print(f"{self.get_poke_name()} has base attack of {self.get_attack_damage()} and type effectiveness of {self.type_multiplier(other)} against {other.get_poke_name()}")
-        effective_damage = int(self.get_attack_damage()* attack_multiplier * self.type_multiplier(other))
-        print(self.poke_name, "has effective damage output of", str(effective_damage))
+        type_multiplier = self.type_multiplier(other)
+        effective_damage = int(self.get_attack_damage() * effect.attack_multiplier * type_multiplier)
+        if sink is not None:
+            sink(Attack(self.poke_name, other.poke_name, self.get_attack_damage(), type_multiplier, effective_damage))
         other.defend(effective_damage) 
 
         # Step 3: Losing hp to status effects
-        if self.status == "poison": 
-            self.lose_hp(3)
-            print(self.poke_name + 'lost 3 hp to poison damage!')
-        elif self.status == "burn":
-            self.lose_hp(1)
-            print(self.poke_name + 'lost 1 hp to fire damage!')
+        if effect.self_damage:
+            self.lose_hp(effect.self_damage)
+            if sink is not None:
+                sink(StatusDamage(self.poke_name, self.status, effect.self_damage))
 
         # Step 4: Possibly applying status effects
-        if RandomGen.random_chance(0.2):
-            status = self.get_status_inflicted()
-            if status == "paralysis" and other.isParalysed == True:
-                print(f"{other.get_poke_name()} is already paralysed so cannot be paralysed again!")
+        if rng.random_chance(0.2):
+            status = self.status_inflicted_code
+            if status == Status.PARALYSIS and other.isParalysed:
+                if sink is not None:
+                    sink(AlreadyParalysed(other.poke_name))
             else:
-                other.status = status
-                print(f"{self.get_poke_name()} inflicted {self.get_status_inflicted()} on {other.get_poke_name()}!")
+                other.status_code = status
+                if sink is not None:
+                    sink(StatusInflicted(self.poke_name, other.poke_name, STATUS_NAME[status]))
 
     def get_poke_name(self) -> str:
         """ 
@@ -295,7 +400,7 @@ class PokemonBase(ABC):
         Worst: O(1), All operations that this function do is O(1). It is a constant time.
         """
         self.current_hp = self.hp
-        self.status = "free"
+        self.status_code = Status.FREE
         self.current_speed_stat = self.get_speed()
 
 
@@ -351,26 +456,12 @@ class PokemonBase(ABC):
 
         :return:
         (float) - the multiplier of the attack pokemon and defence pokemon
-        
+
         :complexity:
-        Best : O(1), since the list of types has constant size
-        Worst: O(1), since the list of types has constant size
+        Best : O(1), lookup in the precomputed TYPE_EFFECTIVENESS table by the cached type ids
+        Worst: O(1), lookup in the precomputed TYPE_EFFECTIVENESS table by the cached type ids
         """
-        types = [PokeType.FIRE, PokeType.GRASS, PokeType.WATER, PokeType.GHOST, PokeType.NORMAL]
-        matcher = [[1, 2, 0.5, 1, 1],
-                  [0.5, 1, 2, 1, 1],
-                  [2, 0.5, 1, 1, 1],
-                  [1.25, 1.25, 1.25, 2, 0],
-                  [1.25, 1.25, 1.25, 0, 1]]
-        self_index = 0
-        other_index = 0
-
-        for i in range(len(types)):
-            if self.poke_type == types[i]:
-                self_index = i
-            if other.poke_type == types[i]:
-                other_index = i
-        return matcher[self_index][other_index]
+        return TYPE_EFFECTIVENESS[self.type_id][other.type_id]
 
     def get_status_inflicted(self) -> None:
         """ 
@@ -388,28 +479,30 @@ class PokemonBase(ABC):
         """
         return self.status_inflicted
 
-    def paralysis(self):
+    def paralysis(self, sink=None):
         """ 
         This function must be called before attack. If the pokemon is paralysed, its speed will be halved
 
-        :param: None
+        :param: sink (callable) - receives the Paralysed event when the speed is halved (default = None)
 
         :pre: None
 
         :return: None
         
         :complexity:
-        Best: O(comp), where comp is the complexity of status comparison
-        Worst: O(comp), where comp is the complexity of status comparison
+        Best: O(1), the effects of the status are looked up in STATUS_EFFECTS by its code
+        Worst: O(1), the effects of the status are looked up in STATUS_EFFECTS by its code
         """
+        halves_speed = STATUS_EFFECTS[self.status_code].halves_speed
         # Need to evaluate speed affected by Paralysis before attacking. Assumption: Speed only halves once, not every turn
-        if self.status == "paralysis" and not self.isParalysed:
-            print(f"{self.get_poke_name()} is paralysed and its speed is halved from {self.get_speed()} to {self.get_speed()//2}")
+        if halves_speed and not self.isParalysed:
+            if sink is not None:
+                sink(Paralysed(self.poke_name, self.get_speed(), self.get_speed() // 2))
             self.current_speed_stat = self.get_speed() // 2
             self.isParalysed = True # This ensures that next turn won't halve speed again
 
         # case when paralysis is overwritten with another status(either inflicted or None if healed/taken off field)
-        if self.status != "paralysis" and self.isParalysed: 
+        if not halves_speed and self.isParalysed: 
             self.current_speed_stat = self.get_speed() # ensures that speed debuff is removed
             self.isParalysed = False # ensures that poke can be paralysed next time around
 
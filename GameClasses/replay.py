@@ -0,0 +1,302 @@
+from __future__ import annotations
+"""
+Compact recordings of battles, for Battle(recorder=BattleRecorder()), and their playback.
+
+A recording holds, for every round of a battle, the choices of both teams and the displayed state of both sides when
+the round starts (the pokemon on the field, its level, hp, maximum hp and status, and the number of pokemon left),
+which is everything print_screen draws. Rounds are encoded as varints: every keyframe_interval rounds a keyframe holds
+the whole state, and the rounds in between only the fields which changed since the round before. The offset of every
+keyframe is kept in the header, so Replay.turn reaches any round by decoding at most keyframe_interval rounds.
+A battle of 25 rounds takes about 200 bytes. Replay.frame draws the game screen of a round again and
+Replay.to_asciicast writes the whole battle as an asciicast v2 recording.
+Unittests (Test cases) for the module will be located under tests\test_replay.py
+
+"""
+
+import json
+from typing import NamedTuple, TextIO
+
+from battle_events import ConsoleLog
+from poke_team import Action
+from pokemon_base import STATUS_NAME
+from species import SPECIES_TABLE
+
+MAGIC = b"PKR1"
+ACTIONS = tuple(Action)
+SPECIES_INDEX = {species.name: index for index, species in enumerate(SPECIES_TABLE)}
+FIELDS = 6      # fields of a SideState
+NO_RESULT = 3   # result code stored for a battle which did not finish
+
+
+class SideState(NamedTuple):
+    """ Displayed state of a side when a round starts """
+    pokemon: str
+    level: int
+    hp: int
+    max_hp: int
+    status: str
+    remaining: int
+
+    @classmethod
+    def of(cls, team, poke) -> SideState:
+        """ State of team with poke on the field. O(1) """
+        return cls(poke.poke_name, poke.get_level(), poke.get_hp(), poke.hp, poke.status, len(team.pokeTeamMembers) + 1)
+
+    def encode(self) -> tuple:
+        """ The fields as integers. O(1) """
+        return (SPECIES_INDEX[self.pokemon], self.level, self.hp, self.max_hp, STATUS_NAME.index(self.status), self.remaining)
+
+    @classmethod
+    def decode(cls, values) -> SideState:
+        """ State from the integers of encode. O(1) """
+        species, level, hp, max_hp, status, remaining = values
+        return cls(SPECIES_TABLE[species].name, level, hp, max_hp, STATUS_NAME[status], remaining)
+
+
+class Turn(NamedTuple):
+    """ A round of a recorded battle: its number (from 1), the choices of both teams and the state of both sides """
+    round: int
+    choice1: Action
+    choice2: Action
+    side1: SideState
+    side2: SideState
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    """ Append value to out, zigzag encoded so small negative numbers stay short, 7 bits per byte. O(log value) """
+    value = value * 2 if value >= 0 else -value * 2 - 1
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """ The value written by write_varint at pos in data, and the position after it. O(log value) """
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return (value >> 1 if value % 2 == 0 else -(value >> 1) - 1), pos
+
+
+def encode_replay(team1: str, team2: str, result: int | None, turns: list[tuple], keyframe_interval: int) -> bytes:
+    """
+    Bytes of a recording.
+
+    :param arg1: team1 (str)              - name of team 1
+    :param arg2: team2 (str)              - name of team 2
+    :param arg3: result (int)             - result of the battle, or None if it did not finish
+    :param arg4: turns (list[tuple])      - (choice1, choice2, fields of side 1 + fields of side 2) of every round
+    :param arg5: keyframe_interval (int)  - number of rounds from a keyframe to the next
+
+    :complexity: Best O(T), where T is the number of rounds
+                 Worst O(T), where T is the number of rounds
+    """
+    body = bytearray()
+    offsets = []
+    previous = None
+    for index, (choice1, choice2, values) in enumerate(turns):
+        if index % keyframe_interval == 0:
+            offsets.append(len(body))
+            previous = None
+        body.append(ACTIONS.index(choice1) << 2 | ACTIONS.index(choice2))
+        if previous is None:
+            for value in values:
+                write_varint(body, value)
+        else:
+            changed = [field for field in range(2 * FIELDS) if values[field] != previous[field]]
+            write_varint(body, sum(1 << field for field in changed))
+            for field in changed:
+                write_varint(body, values[field])
+        previous = values
+
+    header = bytearray(MAGIC)
+    for name in (team1, team2):
+        encoded = name.encode("utf-8")
+        write_varint(header, len(encoded))
+        header += encoded
+    for value in (NO_RESULT if result is None else result, keyframe_interval, len(turns), *offsets):
+        write_varint(header, value)
+    return bytes(header + body)
+
+
+class BattleRecorder:
+    """
+    Recorder of battles, called by Battle when a battle starts, every round after the choices, and when it ends.
+
+    Attributes:
+        keyframe_interval (int): number of rounds from a keyframe to the next
+        replays (list[bytes]): recording of every battle finished, in order
+
+    :complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
+    """
+
+    def __init__(self, keyframe_interval: int = 16) -> None:
+        """
+        :param arg1: keyframe_interval (int) - number of rounds from a keyframe to the next (default = 16)
+
+        :pre: keyframe_interval is an integer greater than 0
+        """
+        try:
+            assert isinstance(keyframe_interval, int) and keyframe_interval > 0, "Keyframe interval must be integer greater than 0"
+        except AssertionError as e:
+            raise ValueError(e)
+
+        self.keyframe_interval = keyframe_interval
+        self.replays = []
+        self.turns = []
+
+    def start(self, battle) -> None:
+        """ A battle starts """
+        self.turns = []
+
+    def turn(self, battle) -> None:
+        """ The teams of battle made their choices for the round """
+        self.turns.append((battle.choice1, battle.choice2,
+                           SideState.of(battle.team1, battle.team1_poke).encode() + SideState.of(battle.team2, battle.team2_poke).encode()))
+
+    def finish(self, battle) -> None:
+        """ The battle ended, its recording is added to replays. O(T), where T is the number of rounds """
+        self.replays.append(encode_replay(battle.team1.team_name, battle.team2.team_name, battle.result, self.turns, self.keyframe_interval))
+        self.turns = []
+
+
+class Replay:
+    """
+    Playback of a recording made by BattleRecorder.
+
+    Attributes:
+        team1 (str): name of team 1
+        team2 (str): name of team 2
+        result (int | None): result of the battle, 0 is draw, 1 is team 1 win, 2 is team 2 wins, None if it did not finish
+        keyframe_interval (int): number of rounds from a keyframe to the next
+
+    :complexity: All functions, unless stated otherwise, have best/worst case complexity of O(1)
+    """
+
+    def __init__(self, data: bytes) -> None:
+        """
+        :param arg1: data (bytes) - a recording
+
+        :pre: data is a recording made by BattleRecorder
+
+        :complexity: Best O(T / K), where T is the number of rounds and K the keyframe interval
+                     Worst O(T / K), where T is the number of rounds and K the keyframe interval
+        """
+        try:
+            assert data[:len(MAGIC)] == MAGIC, "Not a battle recording"
+        except AssertionError as e:
+            raise ValueError(e)
+
+        self.data = data
+        pos = len(MAGIC)
+        names = []
+        for _ in range(2):
+            length, pos = read_varint(data, pos)
+            names.append(data[pos:pos + length].decode("utf-8"))
+            pos += length
+        self.team1, self.team2 = names
+        result, pos = read_varint(data, pos)
+        self.result = None if result == NO_RESULT else result
+        self.keyframe_interval, pos = read_varint(data, pos)
+        self.turns, pos = read_varint(data, pos)
+        self.offsets = []
+        for _ in range((self.turns + self.keyframe_interval - 1) // self.keyframe_interval):
+            offset, pos = read_varint(data, pos)
+            self.offsets.append(offset)
+        self.body = pos
+
+    def __len__(self) -> int:
+        """ Number of rounds """
+        return self.turns
+
+    def _decode(self, pos: int, previous: list | None) -> tuple[int, list, int]:
+        """ Choices byte and fields of the round at pos, after the round with fields previous (None at a keyframe), and the position after it """
+        data = self.data
+        choices = data[pos]
+        pos += 1
+        if previous is None:
+            values = []
+            for _ in range(2 * FIELDS):
+                value, pos = read_varint(data, pos)
+                values.append(value)
+        else:
+            mask, pos = read_varint(data, pos)
+            values = previous[:]
+            for field in range(2 * FIELDS):
+                if mask >> field & 1:
+                    values[field], pos = read_varint(data, pos)
+        return choices, values, pos
+
+    @staticmethod
+    def _turn(index: int, choices: int, values: list) -> Turn:
+        """ Round index (from 0) from its choices byte and fields """
+        return Turn(index + 1, ACTIONS[choices >> 2], ACTIONS[choices & 3], SideState.decode(values[:FIELDS]), SideState.decode(values[FIELDS:]))
+
+    def __iter__(self):
+        """ Every round in order. O(T), where T is the number of rounds """
+        pos = self.body
+        values = None
+        for index in range(self.turns):
+            choices, values, pos = self._decode(pos, None if index % self.keyframe_interval == 0 else values)
+            yield self._turn(index, choices, values)
+
+    def turn(self, index: int) -> Turn:
+        """
+        Round index (from 0), decoded from the keyframe before it.
+
+        :pre: 0 <= index < number of rounds
+
+        :complexity: Best O(1), at a keyframe
+                     Worst O(K), where K is the keyframe interval
+        """
+        try:
+            assert 0 <= index < self.turns, "Round out of range"
+        except AssertionError as e:
+            raise IndexError(e)
+
+        keyframe = index // self.keyframe_interval
+        pos = self.body + self.offsets[keyframe]
+        values = None
+        for _ in range(keyframe * self.keyframe_interval, index + 1):
+            choices, values, pos = self._decode(pos, values)
+        return self._turn(index, choices, values)
+
+    @staticmethod
+    def screen(turn: Turn) -> str:
+        """ Game screen of turn, as Battle prints it. O(H*W), where H and W are the height and width of the screen """
+        from print_screen import render_game_screen
+
+        side1, side2 = turn.side1, turn.side2
+        return render_game_screen(side1.pokemon, side2.pokemon, side1.hp, side1.max_hp, side2.hp, side2.max_hp, side1.level, side2.level,
+                                  side1.status, side2.status, side1.remaining, side2.remaining)
+
+    def frame(self, index: int) -> str:
+        """ Game screen of round index (from 0). O(K + H*W), where K is the keyframe interval and H*W the size of the screen """
+        return self.screen(self.turn(index))
+
+    def to_asciicast(self, stream: TextIO, delay: float = 1.0) -> None:
+        """
+        Write the battle as an asciicast v2 recording: a frame every delay seconds with a caption, then the result.
+
+        :param arg1: stream (TextIO) - stream the recording is written to
+        :param arg2: delay (float)   - seconds from a frame to the next (default = 1.0)
+
+        :complexity: Best O(T*H*W), where T is the number of rounds and H*W the size of the screen
+                     Worst O(T*H*W), where T is the number of rounds and H*W the size of the screen
+        """
+        from print_screen import template_window
+
+        window = template_window()
+        header = {"version": 2, "width": len(window[0]), "height": len(window) + 2, "title": f"{self.team1} vs {self.team2}"}
+        stream.write(json.dumps(header) + "\n")
+        for turn in self:
+            text = "\x1b[2J\x1b[H" + self.screen(turn).replace("\n", "\r\n") + "\r\n" \
+                   + f"{self.team1} chooses {turn.choice1} and {self.team2} chooses {turn.choice2}\r\n"
+            stream.write(json.dumps([round((turn.round - 1) * delay, 6), "o", text]) + "\n")
+        if self.result is not None:
+            stream.write(json.dumps([round(self.turns * delay, 6), "o", ConsoleLog.RESULTS[self.result] + "\r\n"]) + "\n")
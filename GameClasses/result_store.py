@@ -0,0 +1,194 @@
+from __future__ import annotations
+"""
+SQLite store of battle results, for Battle(store=ResultStore(...)).
+
+Every battle is a row with the ids of the specs of both teams, the seed of the random stream when it started, its result
+and number of rounds, and JSON metadata (the team names and the metadata of the Battle). Specs are stored once in their
+own table, as canonical JSON (see battle_cache.encode_spec). Rows are inserted in batches, and the battles are indexed
+by matchup and by seed, so head_to_head and battles_with_seed read only the rows they need from millions of battles.
+Unittests (Test cases) for the module will be located under tests\test_result_store.py
+
+"""
+
+import json
+import sqlite3
+from typing import NamedTuple
+
+from battle_cache import decode_spec, encode_spec
+from poke_team import TeamSpec
+from simulation import SimulationResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS specs (
+    id INTEGER PRIMARY KEY,
+    spec TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS battles (
+    id INTEGER PRIMARY KEY,
+    team1 INTEGER NOT NULL REFERENCES specs (id),
+    team2 INTEGER NOT NULL REFERENCES specs (id),
+    seed INTEGER NOT NULL,
+    result INTEGER NOT NULL,
+    rounds INTEGER NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS battles_matchup ON battles (team1, team2, result, rounds);
+CREATE INDEX IF NOT EXISTS battles_seed ON battles (seed);
+"""
+
+
+class StoredBattle(NamedTuple):
+    """ A battle read back from the store """
+    team1: TeamSpec
+    team2: TeamSpec
+    seed: int
+    result: int
+    rounds: int
+    metadata: dict
+
+
+def spec_key(spec: TeamSpec) -> str:
+    """ Canonical JSON text of a TeamSpec, as stored in the specs table. O(1) """
+    return json.dumps(encode_spec(spec))
+
+
+class ResultStore:
+    """
+    Battle results in an SQLite database, inserted in batches of batch_size rows.
+    Pending rows are written before every query and by flush or close, and the store closes itself as a context manager.
+
+    Attributes:
+        path (str): database file, or ":memory:" for a store which lives as long as the object
+        batch_size (int): number of rows kept pending before they are inserted together
+        pending (list[tuple]): rows recorded and not inserted yet
+        spec_ids (dict[TeamSpec, int]): id of every spec this store has looked up
+
+    :complexity: record is O(1) amortised, other functions are stated
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 1000) -> None:
+        """
+        :param arg1: path (str)       - database file, created if needed (default = ":memory:")
+        :param arg2: batch_size (int) - number of rows inserted together (default = 1000)
+
+        :pre: batch_size is an integer greater than 0
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        try:
+            assert isinstance(batch_size, int) and batch_size > 0, "Batch size must be integer greater than 0"
+        except AssertionError as e:
+            raise ValueError(e)
+
+        self.path = path
+        self.batch_size = batch_size
+        self.pending = []
+        self.spec_ids = {}
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> ResultStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def record(self, spec1: TeamSpec, spec2: TeamSpec, seed: int, result: int, rounds: int, metadata: dict | None = None) -> None:
+        """
+        Record a battle, inserting the pending rows once there are batch_size of them.
+
+        :param arg1: spec1 (TeamSpec) - spec of team 1
+        :param arg2: spec2 (TeamSpec) - spec of team 2
+        :param arg3: seed (int)       - seed of the random stream when the battle started
+        :param arg4: result (int)     - result of the battle, 0 is draw, 1 is team 1 win, 2 is team 2 wins
+        :param arg5: rounds (int)     - number of rounds of the battle
+        :param arg6: metadata (dict)  - JSON serialisable details of the battle (default = None)
+
+        :complexity: Best O(1)
+                     Worst O(B), where B is the batch size, when the batch is inserted
+        """
+        self.pending.append((self.spec_id(spec1), self.spec_id(spec2), seed, result, rounds, json.dumps(metadata or {})))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def spec_id(self, spec: TeamSpec, add: bool = True) -> int | None:
+        """
+        Id of spec in the specs table, added to it if needed (and add is True, else None), remembered by spec.
+
+        :complexity: Best O(1), when the spec was looked up before
+                     Worst O(log S), where S is the number of specs stored
+        """
+        spec_id = self.spec_ids.get(spec)
+        if spec_id is None:
+            key = spec_key(spec)
+            if add:
+                self.connection.execute("INSERT OR IGNORE INTO specs (spec) VALUES (?)", (key,))
+            row = self.connection.execute("SELECT id FROM specs WHERE spec = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            spec_id = self.spec_ids[spec] = row[0]
+        return spec_id
+
+    def flush(self) -> None:
+        """
+        Insert the pending rows in one transaction.
+
+        :complexity: Best O(1), when no row is pending
+                     Worst O(B log N), where B is the number of pending rows and N the number of rows stored
+        """
+        if self.pending:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT INTO battles (team1, team2, seed, result, rounds, metadata) VALUES (?, ?, ?, ?, ?, ?)", self.pending)
+            self.pending = []
+
+    def close(self) -> None:
+        """ Insert the pending rows and close the database. O(B log N), where B is the number of pending rows """
+        self.flush()
+        self.connection.close()
+
+    def __len__(self) -> int:
+        """ Number of battles stored, pending rows included. O(N), where N is the number of rows stored """
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM battles").fetchone()[0]
+
+    def head_to_head(self, spec_a: TeamSpec, spec_b: TeamSpec) -> SimulationResult:
+        """
+        Results of every battle stored between teams of spec_a and spec_b, on either side, from the point of view of spec_a.
+
+        :param arg1: spec_a (TeamSpec) - spec of the team the results are counted for
+        :param arg2: spec_b (TeamSpec) - spec of its opponent
+
+        :return: SimulationResult with the wins, draws and losses of spec_a and the histogram of rounds
+
+        :complexity: Best O(log N + M), where N is the number of rows stored and M the number of battles of the matchup
+                     Worst O(log N + M), where N is the number of rows stored and M the number of battles of the matchup
+        """
+        self.flush()
+        id_a, id_b = self.spec_id(spec_a, add=False), self.spec_id(spec_b, add=False)
+        counts = [0, 0, 0]      # draws, wins of spec_a, wins of spec_b
+        rounds = {}
+        # the result of a battle where spec_a is team 2 is seen from the other side
+        sides = [(id_a, id_b, (0, 1, 2))] if id_a == id_b else [(id_a, id_b, (0, 1, 2)), (id_b, id_a, (0, 2, 1))]
+        for team1, team2, side in sides:
+            rows = self.connection.execute(
+                "SELECT result, rounds, COUNT(*) FROM battles WHERE team1 = ? AND team2 = ? GROUP BY result, rounds", (team1, team2))
+            for result, battle_rounds, count in rows:
+                counts[side[result]] += count
+                rounds[battle_rounds] = rounds.get(battle_rounds, 0) + count
+        return SimulationResult(counts[1], counts[0], counts[2], dict(sorted(rounds.items())))
+
+    def battles_with_seed(self, seed: int) -> list[StoredBattle]:
+        """
+        Every battle stored which started from seed, in the order they were recorded.
+
+        :complexity: Best O(log N + M), where N is the number of rows stored and M the number of battles with the seed
+                     Worst O(log N + M), where N is the number of rows stored and M the number of battles with the seed
+        """
+        self.flush()
+        rows = self.connection.execute(
+            "SELECT s1.spec, s2.spec, seed, result, rounds, metadata FROM battles "
+            "JOIN specs AS s1 ON s1.id = team1 JOIN specs AS s2 ON s2.id = team2 WHERE seed = ? ORDER BY battles.id", (seed,))
+        return [StoredBattle(decode_spec(json.loads(team1)), decode_spec(json.loads(team2)), seed, result, rounds, json.loads(metadata))
+                for team1, team2, seed, result, rounds, metadata in rows]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+"""
+Batch simulation of battles between two team specs.
+
+A team spec is the tuple (team_numbers, battle_mode, ai_type, criterion) accepted by the PokeTeam constructor,
+such as a TeamSpec of poke_team.
+simulate_many builds each team once, battles them n times in a headless Battle, regenerating both teams
+between battles, and returns the aggregate results. simulate_batch plays all the battles at once with the
+vectorised engine of batch_engine (requires numpy, ALWAYS_ATTACK teams only).
+Unittests (Test cases) for the module will be located under tests\test_simulation.py
+
+"""
+
+from typing import NamedTuple
+
+from battle import Battle
+from poke_team import PokeTeam
+from random_gen import RandomGen
+
+
+class SimulationResult(NamedTuple):
+    """
+    Aggregate results of a batch of battles, from the point of view of the first team.
+    rounds maps the number of rounds of a battle to the number of battles which lasted that long.
+    """
+    wins: int
+    draws: int
+    losses: int
+    rounds: dict[int, int]
+
+    @property
+    def battles(self) -> int:
+        """ Number of battles simulated """
+        return self.wins + self.draws + self.losses
+
+
+def simulate_many(spec_a: tuple, spec_b: tuple, n: int, seed: int | None = None) -> SimulationResult:
+    """
+    Battle a team built from spec_a against a team built from spec_b n times.
+
+    :param arg1: spec_a (tuple) - (team_numbers, battle_mode, ai_type, criterion) of the first team
+    :param arg2: spec_b (tuple) - (team_numbers, battle_mode, ai_type, criterion) of the second team
+    :param arg3: n (int)        - number of battles
+    :param arg4: seed (int)     - seed for RandomGen, or None to continue the current random stream (default = None)
+
+    :pre:
+    - both specs are valid arguments for the PokeTeam constructor
+    - n is an integer greater or equal to 0
+
+    :return: SimulationResult with the wins, draws and losses of the first team and the histogram of rounds
+
+    :complexity: Best O(n*B), where B is the complexity of a single battle and regeneration of both teams
+                 Worst O(n*B), where B is the complexity of a single battle and regeneration of both teams
+    """
+    try:
+        assert isinstance(n, int) and n >= 0, "Number of battles must be integer greater or equal than 0"
+        assert isinstance(spec_a, tuple) and len(spec_a) == 4, "Team spec must be (team_numbers, battle_mode, ai_type, criterion)"
+        assert isinstance(spec_b, tuple) and len(spec_b) == 4, "Team spec must be (team_numbers, battle_mode, ai_type, criterion)"
+    except AssertionError as e:
+        raise ValueError(e)
+
+    if seed is not None:
+        RandomGen.set_seed(seed)
+
+    # teams are built once and regenerated in place between battles
+    team_a = PokeTeam("A", *spec_a)
+    team_b = PokeTeam("B", *spec_b)
+    b = Battle(verbosity=Battle.QUIET)
+
+    counts = [0, 0, 0]      # draws, wins of team_a, wins of team_b
+    rounds = {}
+    for _ in range(n):
+        res = b.battle(team_a, team_b)
+        counts[res] += 1
+        rounds[b.rounds] = rounds.get(b.rounds, 0) + 1
+        team_a.regenerate_team()
+        team_b.regenerate_team()
+
+    return SimulationResult(counts[1], counts[0], counts[2], dict(sorted(rounds.items())))
+
+
+def simulate_batch(spec_a: tuple, spec_b: tuple, n: int, seed: int | None = None) -> SimulationResult:
+    """
+    Battle a team built from spec_a against a team built from spec_b n times with the vectorised engine of batch_engine.
+    Battle i uses its own random stream, seeded with the i-th output of RandomGen(seed), so its result is the same
+    as Battle(rng=RandomGen(seeds[i])).battle of the two teams.
+
+    :param arg1: spec_a (tuple) - (team_numbers, battle_mode, ai_type, criterion) of the first team
+    :param arg2: spec_b (tuple) - (team_numbers, battle_mode, ai_type, criterion) of the second team
+    :param arg3: n (int)        - number of battles
+    :param arg4: seed (int)     - seed of the stream the seeds of the battles are drawn from, or None for a time based seed
+
+    :pre:
+    - both specs are valid arguments for the PokeTeam constructor, with the ALWAYS_ATTACK AI
+    - n is an integer greater or equal to 0
+    - numpy is installed
+
+    :return: SimulationResult with the wins, draws and losses of the first team and the histogram of rounds
+
+    :complexity: Best O(R*n), where R is the number of rounds of the longest battle
+                 Worst O(R*n), where R is the number of rounds of the longest battle
+    """
+    try:
+        assert isinstance(n, int) and n >= 0, "Number of battles must be integer greater or equal than 0"
+        assert isinstance(spec_a, tuple) and len(spec_a) == 4, "Team spec must be (team_numbers, battle_mode, ai_type, criterion)"
+        assert isinstance(spec_b, tuple) and len(spec_b) == 4, "Team spec must be (team_numbers, battle_mode, ai_type, criterion)"
+        assert spec_a[2] == spec_b[2] == PokeTeam.AI.ALWAYS_ATTACK, "The vectorised engine only supports ALWAYS_ATTACK teams"
+    except AssertionError as e:
+        raise ValueError(e)
+
+    from batch_engine import BatchBattle, roster
+
+    roster_a = roster(PokeTeam("A", *spec_a))
+    roster_b = roster(PokeTeam("B", *spec_b))
+    engine = BatchBattle([roster_a] * n, [roster_b] * n, RandomGen(seed).random_block(n))
+    results = engine.run()
+
+    counts = [int((results == res).sum()) for res in range(3)]
+    rounds = {}
+    for r in engine.rounds.tolist():
+        rounds[r] = rounds.get(r, 0) + 1
+    return SimulationResult(counts[1], counts[0], counts[2], dict(sorted(rounds.items())))
@@ -0,0 +1,258 @@
+from __future__ import annotations
+"""
+Exact solver of battles between two teams with the ALWAYS_ATTACK AI.
+
+Such teams never swap, heal or use special, so their pokemon come out in the fixed order of their roster and a battle
+is a Markov chain over the pokemon on the field and the pokemon still waiting. The only random events are the rolls of
+PokemonBase.attack: the 50% confusion roll and the 20% status roll. MatchupSolver plays each round with the real
+Battle.play_round and a ScriptedRandom stream which answers the rolls from a script, enumerating every outcome of the
+round with its probability, and memoises the win/draw/loss probabilities and expected rounds of every battle state.
+Rolls are taken with their nominal chance, so results are exact for an ideal random stream.
+Unittests (Test cases) for the module will be located under tests\test_solver.py
+
+"""
+
+from typing import NamedTuple
+
+from battle import Battle
+from poke_team import Action, PokeTeam
+from pokemon_base import PokemonBase
+from random_gen import RandomGen
+
+SLOTS = PokemonBase.__slots__
+
+
+class MatchupOdds(NamedTuple):
+    """ Probabilities of the results of a battle, from the point of view of the first team, and its expected number of rounds """
+    wins: float
+    draws: float
+    losses: float
+    rounds: float
+
+
+class RollsExhausted(Exception):
+    """ Raised by ScriptedRandom at the first roll past the end of its script, with the chance of the roll """
+
+    def __init__(self, ratio: float) -> None:
+        super().__init__(ratio)
+        self.ratio = ratio
+
+
+class ScriptedRandom(RandomGen):
+    """ Random stream whose random_chance rolls are answered in order from script, a tuple of booleans """
+
+    def __init__(self) -> None:
+        super().__init__(0)
+        self.script = ()
+        self.rolls = 0
+
+    def random_chance(self, ratio: float) -> bool:
+        """
+        Answer the next roll from the script.
+
+        :raises RollsExhausted: if every roll of the script has been answered
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        if self.rolls == len(self.script):
+            raise RollsExhausted(ratio)
+        self.rolls += 1
+        return self.script[self.rolls - 1]
+
+
+def freeze(poke: PokemonBase | None) -> tuple | None:
+    """
+    Hashable state of poke: its class followed by the values of its slots. None stays None.
+
+    :complexity: Best O(1)
+                 Worst O(1)
+    """
+    if poke is None:
+        return None
+    return (type(poke),) + tuple(getattr(poke, name) for name in SLOTS)
+
+
+def thaw(state: tuple | None) -> PokemonBase | None:
+    """
+    New pokemon in the state made by freeze. None stays None.
+
+    :complexity: Best O(1)
+                 Worst O(1)
+    """
+    if state is None:
+        return None
+    poke = object.__new__(state[0])
+    for name, value in zip(SLOTS, state[1:]):
+        setattr(poke, name, value)
+    return poke
+
+
+class Roster:
+    """
+    Stand-in for a PokeTeam with the ALWAYS_ATTACK AI in a solved battle: the frozen pokemon of waiting
+    come out in order, and a pokemon returned at the end of the battle keeps the team from being empty.
+    """
+
+    def __init__(self, team_name: str) -> None:
+        self.team_name = team_name
+        self.waiting = ()
+        self.returned = False
+        self.heal_times = 0
+
+    def retrieve_pokemon(self) -> PokemonBase | None:
+        """ Next pokemon of the roster, or None when there is none left. O(1) """
+        if not self.waiting:
+            return None
+        poke = thaw(self.waiting[0])
+        self.waiting = self.waiting[1:]
+        return poke
+
+    def return_pokemon(self, poke: PokemonBase) -> None:
+        """ Fainted pokemon leave the team, any other is only returned when the battle is over. O(1) """
+        if not poke.is_fainted():
+            self.returned = True
+
+    def is_empty(self) -> bool:
+        """ True if no pokemon is waiting or returned. O(1) """
+        return not self.waiting and not self.returned
+
+    def choose_battle_option(self, my_pokemon: PokemonBase, their_pokemon: PokemonBase, rng=RandomGen) -> Action:
+        """ The ALWAYS_ATTACK AI. O(1) """
+        return Action.ATTACK
+
+
+class MatchupSolver:
+    """
+    Exact win/draw/loss probabilities and expected rounds of battles between teams with the ALWAYS_ATTACK AI.
+    A battle state is (pokemon waiting in team 1, pokemon of team 1 on the field, the same for team 2), all frozen,
+    and the results of every state solved are kept, so matchups sharing the end of their rosters share their work.
+
+    :complexity: solve is O(S*B), where S is the number of battle states reachable and B the number of outcomes of a round (at most 16)
+    """
+
+    def __init__(self) -> None:
+        self.rng = ScriptedRandom()
+        self.battle = Battle(verbosity=Battle.QUIET, rng=self.rng)
+        self.team1 = Roster("1")
+        self.team2 = Roster("2")
+        self.memo = {}
+
+    @staticmethod
+    def roster(spec: tuple) -> tuple:
+        """
+        Frozen pokemon of a team built from spec, in the order they come out.
+
+        :pre: spec is a valid (team_numbers, battle_mode, ai_type, criterion) with the ALWAYS_ATTACK AI
+
+        :complexity: Best O(N*R), where N is the size of the team and R the complexity of retrieve_pokemon
+                     Worst O(N*R), where N is the size of the team and R the complexity of retrieve_pokemon
+        """
+        team = PokeTeam("Roster", list(spec[0]), *spec[1:])
+        pokemon = []
+        poke = team.retrieve_pokemon()
+        while poke is not None:
+            pokemon.append(freeze(poke))
+            poke = team.retrieve_pokemon()
+        return tuple(pokemon)
+
+    def solve(self, spec_a: tuple, spec_b: tuple) -> MatchupOdds:
+        """
+        Exact odds of a battle between a team built from spec_a and a team built from spec_b.
+
+        :param arg1: spec_a (tuple) - (team_numbers, battle_mode, ai_type, criterion) of the first team
+        :param arg2: spec_b (tuple) - (team_numbers, battle_mode, ai_type, criterion) of the second team
+
+        :pre: both specs are valid arguments for the PokeTeam constructor, with the ALWAYS_ATTACK AI and at least one pokemon
+
+        :return: MatchupOdds of the first team
+
+        :complexity: Best O(1), when the matchup is already solved
+                     Worst O(S*B), where S is the number of battle states reachable and B the number of outcomes of a round
+        """
+        try:
+            assert isinstance(spec_a, tuple) and len(spec_a) == 4, "Team spec must be (team_numbers, battle_mode, ai_type, criterion)"
+            assert isinstance(spec_b, tuple) and len(spec_b) == 4, "Team spec must be (team_numbers, battle_mode, ai_type, criterion)"
+            assert spec_a[2] == spec_b[2] == PokeTeam.AI.ALWAYS_ATTACK, "The solver only supports ALWAYS_ATTACK teams"
+            assert sum(spec_a[0]) > 0 and sum(spec_b[0]) > 0, "Both teams must have a pokemon"
+        except AssertionError as e:
+            raise ValueError(e)
+
+        roster_a = self.roster(spec_a)
+        roster_b = self.roster(spec_b)
+        draws, wins, losses, rounds = self._solve((roster_a[1:], roster_a[0], roster_b[1:], roster_b[0]))
+        return MatchupOdds(wins, draws, losses, rounds)
+
+    def _solve(self, state: tuple) -> tuple:
+        """
+        (draw, win, loss) probabilities and expected rounds of the battle from state, memoised.
+        Every round loses hp or makes a pokemon faint, so states never repeat and the recursion ends.
+
+        :complexity: Best O(1), when state is already solved
+                     Worst O(S*B), where S is the number of battle states reachable from state and B the number of outcomes of a round
+        """
+        solved = self.memo.get(state)
+        if solved is not None:
+            return solved
+        odds = [0.0, 0.0, 0.0]
+        rounds = 0.0
+        for chance, result, after in self._outcomes(state):
+            rounds += chance
+            if result is not None:
+                odds[result] += chance
+            else:
+                *after_odds, after_rounds = self._solve(after)
+                for i in range(3):
+                    odds[i] += chance * after_odds[i]
+                rounds += chance * after_rounds
+        solved = (odds[0], odds[1], odds[2], rounds)
+        self.memo[state] = solved
+        return solved
+
+    def _load(self, state: tuple) -> None:
+        """ Put the battle in state. O(N), where N is the size of the larger team """
+        waiting1, poke1, waiting2, poke2 = state
+        battle = self.battle
+        for team, waiting in ((self.team1, waiting1), (self.team2, waiting2)):
+            team.waiting = waiting
+            team.returned = False
+        battle.team1, battle.team2 = self.team1, self.team2
+        battle.team1_poke, battle.team2_poke = thaw(poke1), thaw(poke2)
+
+    def _outcomes(self, state: tuple):
+        """
+        Every outcome of a round played from state, as (probability, result, state after the round), where result is the
+        result of the battle if the round ends it and None otherwise. The round is replayed with every script of rolls,
+        extending a script by both answers of the roll it runs out at.
+
+        :complexity: Best O(1), when the round has no roll
+                     Worst O(B), where B is the number of outcomes of a round (at most 16)
+        """
+        battle = self.battle
+        scripts = [((), 1.0)]
+        while scripts:
+            script, chance = scripts.pop()
+            self._load(state)
+            self.rng.script = script
+            self.rng.rolls = 0
+            try:
+                battle.play_round()
+            except RollsExhausted as roll:
+                scripts.append((script + (True,), chance * roll.ratio))
+                scripts.append((script + (False,), chance * (1 - roll.ratio)))
+                continue
+            if battle.team1_poke is None or battle.team2_poke is None:
+                yield chance, battle.finish(), None
+            else:
+                yield chance, None, (self.team1.waiting, freeze(battle.team1_poke), self.team2.waiting, freeze(battle.team2_poke))
+
+
+def solve_matchup(spec_a: tuple, spec_b: tuple) -> MatchupOdds:
+    """
+    Exact odds of a battle between a team built from spec_a and a team built from spec_b, both with the ALWAYS_ATTACK AI.
+    See MatchupSolver.solve.
+
+    :complexity: Best O(S*B), where S is the number of battle states reachable and B the number of outcomes of a round
+                 Worst O(S*B), where S is the number of battle states reachable and B the number of outcomes of a round
+    """
+    return MatchupSolver().solve(spec_a, spec_b)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+"""
+Species registry. One row per species with its base stats, growth on level up, defend rule, status inflicted,
+pokedex number and evolution edge. The pokemon classes of pokemon.py, team construction in poke_team.py and
+the vectorised engine of batch_engine.py all read their parameters from this table.
+Unittests (Test cases) for the module will be located under tests\test_species.py
+
+"""
+from functools import lru_cache
+from typing import NamedTuple
+
+from pokemon_base import PokeType
+
+
+class Growth(NamedTuple):
+    """ On level up a stat becomes keep * stat + add + half * (new level // 2) """
+    keep: int
+    add: int
+    half: int
+
+    def apply(self, stat: int, level: int) -> int:
+        """
+        Value of the stat after levelling up to level.
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        return self.keep * stat + self.add + self.half * (level // 2)
+
+
+class DefendRule(NamedTuple):
+    """
+    The hp lost to an attack of damage is damage * above_mul when damage > mul * defence + add (>= if not strict),
+    else damage // below_div (nothing when below_div is 0)
+    """
+    mul: int
+    add: int
+    strict: bool
+    above_mul: int
+    below_div: int
+
+    def hp_lost(self, damage: int, defence: int) -> int:
+        """
+        Hp lost by a pokemon with the given defence to an attack of damage.
+
+        :complexity: Best O(1)
+                     Worst O(1)
+        """
+        threshold = self.mul * defence + self.add
+        if damage > threshold if self.strict else damage >= threshold:
+            return damage * self.above_mul
+        return damage // self.below_div if self.below_div else 0
+
+
+class Species(NamedTuple):
+    """ Parameters of a species at its base level. evolve_level is 0 and evolves_to is None when it cannot evolve """
+    name: str
+    pokedex: int
+    poke_type: PokeType
+    level: int
+    hp: int
+    attack: int
+    speed: int
+    defence: int
+    status_inflicted: str
+    evolve_level: int
+    evolves_to: str | None
+    hp_growth: Growth
+    attack_growth: Growth
+    speed_growth: Growth | None     # None when levelling up does not change the speed
+    defence_growth: Growth
+    defend: DefendRule
+
+    def can_evolve(self) -> bool:
+        """ True if the species has an evolution """
+        return self.evolves_to is not None
+
+
+SAME = Growth(1, 0, 0)
+PLUS_1 = Growth(1, 1, 0)
+PLUS_2 = Growth(1, 2, 0)
+
+# fields: name, pokedex, type, level, hp, attack, speed, defence, status inflicted, evolve level, evolves to,
+#         growth of hp, attack, speed and defence on level up, defend rule
+SPECIES_TABLE = (
+    Species("Charmander", 1,  PokeType.FIRE,   1,  9,  7,  8,  4, "burn",      3, "Charizard", PLUS_1,            PLUS_1,          PLUS_1,           SAME,   DefendRule(1, 0, True, 1, 2)),
+    Species("Charizard",  2,  PokeType.FIRE,   3, 15, 16, 12,  4, "burn",      0, None,        PLUS_1,            PLUS_2,          PLUS_1,           SAME,   DefendRule(1, 0, True, 2, 1)),
+    Species("Bulbasaur",  3,  PokeType.GRASS,  1, 13,  5,  7,  5, "poison",    2, "Venusaur",  PLUS_1,            SAME,            Growth(0, 7, 1),  SAME,   DefendRule(1, 5, True, 1, 2)),
+    Species("Venusaur",   4,  PokeType.GRASS,  2, 21,  5,  4, 10, "poison",    0, None,        Growth(0, 20, 1),  SAME,            Growth(0, 3, 1),  SAME,   DefendRule(1, 5, True, 1, 2)),
+    Species("Squirtle",   5,  PokeType.WATER,  1, 11,  4,  7,  7, "paralysis", 3, "Blastoise", PLUS_2,            Growth(0, 4, 1), None,             PLUS_1, DefendRule(2, 0, True, 1, 2)),
+    Species("Blastoise",  6,  PokeType.WATER,  3, 21,  9, 10, 11, "paralysis", 0, None,        PLUS_2,            Growth(0, 8, 1), None,             PLUS_1, DefendRule(2, 0, True, 1, 2)),
+    Species("Gastly",     7,  PokeType.GHOST,  1,  6,  4,  2,  8, "sleep",     1, "Haunter",   Growth(0, 6, 1),   SAME,            None,             SAME,   DefendRule(0, -1, True, 1, 1)),
+    Species("Haunter",    8,  PokeType.GHOST,  1,  9,  8,  6,  6, "sleep",     3, "Gengar",    Growth(0, 9, 1),   SAME,            None,             PLUS_1, DefendRule(0, -1, True, 1, 1)),
+    Species("Gengar",     9,  PokeType.GHOST,  3, 13, 18, 12,  3, "sleep",     0, None,        Growth(0, 12, 1),  SAME,            None,             SAME,   DefendRule(0, -1, True, 1, 1)),
+    Species("Eevee",      10, PokeType.NORMAL, 1, 10,  7,  8,  5, "confuse",   0, None,        SAME,              PLUS_1,          PLUS_1,           PLUS_1, DefendRule(1, 0, False, 1, 0)),
+)
+
+SPECIES = {species.name: species for species in SPECIES_TABLE}
+
+# species of the team_numbers of a PokeTeam, in order
+TEAM_SPECIES = tuple(SPECIES[name] for name in ("Charmander", "Bulbasaur", "Squirtle", "Gastly", "Eevee"))
+
+
+@lru_cache(maxsize=None)
+def stats_at(species: Species, level: int) -> tuple[int, int, int, int]:
+    """
+    (hp, attack, speed, defence) of an unhurt pokemon of species levelled up from its base level to level.
+
+    :pre: level is greater or equal to the base level of species
+
+    :complexity: Best O(1), when cached
+                 Worst O(L), where L is the number of levels above the base level
+    """
+    try:
+        assert level >= species.level, "Level must be at least the base level of the species"
+    except AssertionError as e:
+        raise ValueError(e)
+    if level == species.level:
+        return (species.hp, species.attack, species.speed, species.defence)
+    hp, attack, speed, defence = stats_at(species, level - 1)
+    speed_growth = species.speed_growth
+    return (species.hp_growth.apply(hp, level),
+            species.attack_growth.apply(attack, level),
+            speed if speed_growth is None else speed_growth.apply(speed, level),
+            species.defence_growth.apply(defence, level))
@@ -145,7 +145,8 @@ class BattleTowerIterator(BattleTower):
         if self.battle_result != 2 and num_teams > 0:
             opponent = self.tower_teams.serve()
             opponent_lives = self.lives_left.serve()
-            print(f"Opponent has {opponent_lives} lives")
+            if self.battle_instance.verbosity >= Battle.LOG:
+                print(f"Opponent has {opponent_lives} lives")
             self.battle_result = self.battle_instance.battle(my_team, opponent) #? O(R*M^2), where R is number of rounds until battle ends, M is the length of PokeTeamMembers
 
             # After each battle, regenerate
@@ -1,4 +1,14 @@
-TEMPLATE_WINDOW = list(map(list, """\
+"""
+Game screen printed by Battle every round at verbosity SCREEN.
+
+Nothing is built or run on import: the rows of the template are made from TEMPLATE_SCREEN by the first frame,
+and the terminal is set up for ANSI colour codes when a screen is first printed to it.
+"""
+
+import os
+import sys
+
+TEMPLATE_SCREEN = """\
   ........................................................................................................................................  
  *O                                                                                                                                      O. 
  oO                                                                                                                                      O. 
@@ -26,12 +36,7 @@ TEMPLATE_WINDOW = list(map(list, """\
  o#                                                                          @°   HP |------------------------------------------|   .#@@##° 
  o#                                                                         @#.                                                     .#@@#O° 
  o#          #######OOOOOOOOOoOOOOOOoOo*****°°°o#OOO                       o°    ..°*.°°**..*°°°°°°°*°°°°°°°°°°°°°°°°*°°°°°°°°°°.  .o@@@@#° 
- *O#OOOOOooooooooooooooooooooo**ooo*°*°....  .°oooooooooooooooooooOOOOO###o*********o*o*o***oooooooooooooooooooooooooooooooooooo**oO####OO.""".split("\n")))
-
-import copy
-import os
-
-os.system('')
+ *O#OOOOOooooooooooooooooooooo**ooo*°*°....  .°oooooooooooooooooooOOOOO###o*********o*o*o***oooooooooooooooooooooooooooooooooooo**oO####OO."""
 
 STATUS_MAPPING = {
     "burn": ("\x1b[41mB", "R", "N\x1b[0m"),
@@ -61,13 +66,96 @@ POKEMON_COLORS = {
     "eevee": "\x1b[37m",
 }
 
-def print_game_screen(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team1_max_hp, team2_cur_hp, team2_max_hp, team1_lvl, team2_lvl, team1_status, team2_status, team1_remaining_pokemon, team2_remaining_pokemon):
+SPRITE_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pokemon_printing")
+
+# (bottom row, centre column, first row, last row, first column, last column) of the area of the sprite of each side
+BACK_AREA = (27, 31, 12, 27, 5, 75)
+FRONT_AREA = (17, 101, 1, 17, 65, 136)
+
+TEMPLATE_WINDOW = []     # cells of TEMPLATE_SCREEN, one list per row, made by template_window
+SPRITES = {}
+OVERLAYS = {}
+ANSI_ENABLED = False
+
+def template_window() -> list[list[str]]:
     """
-    Display game screen based on the attributes of PokeTeam and Pokemon passed in
-    :complexity: Best O(N*M), where N is length of lines(height) for pokemon sprite, M is length of characters in line (width)for sprite
+    Cells of the template screen, one list per row, made from TEMPLATE_SCREEN the first time and then kept in TEMPLATE_WINDOW.
+    :complexity: Best O(1), when the template was made before
+                Worst O(H*W), where H and W are the height and width of the screen
+    """
+    if not TEMPLATE_WINDOW:
+        TEMPLATE_WINDOW.extend(map(list, TEMPLATE_SCREEN.split("\n")))
+    return TEMPLATE_WINDOW
+
+
+def enable_ansi(stream=None) -> None:
+    """
+    Set the terminal up for ANSI codes the first time the screen is printed to one (stream, default sys.stdout).
+    Windows consoles only interpret them once a command was run in them, other terminals always do.
+    :complexity: Best O(1)
+                Worst O(1)
+    """
+    global ANSI_ENABLED
+    if ANSI_ENABLED:
+        return
+    isatty = getattr(sys.stdout if stream is None else stream, "isatty", None)
+    if isatty is not None and isatty():
+        ANSI_ENABLED = True
+        if os.name == "nt":
+            os.system('')
+
+
+def load_sprite(pokemon_name: str, back: bool) -> list[str]:
+    """
+    Lines of the sprite of a pokemon, read from pokemon_printing once and then kept in SPRITES.
+    :complexity: Best O(1), when the sprite was loaded before
                 Worst O(N*M), where N is length of lines(height) for pokemon sprite, M is length of characters in line (width)for sprite
     """
-    BATTLE_WINDOW = copy.deepcopy(TEMPLATE_WINDOW)
+    key = (pokemon_name, back)
+    lines = SPRITES.get(key)
+    if lines is None:
+        with open(os.path.join(SPRITE_FOLDER, pokemon_name + ("_back.txt" if back else ".txt")), "r") as f:
+            lines = SPRITES[key] = f.read().split("\n")
+    return lines
+
+
+def sprite_overlay(pokemon_name: str, back: bool) -> list[tuple]:
+    """
+    Cells of the sprite of a pokemon as drawn on the screen, as (row, first column, cells) for every row of the sprite,
+    clipped to the area of its side and coloured. Computed once and then kept in OVERLAYS.
+    :complexity: Best O(1), when the overlay was computed before
+                Worst O(N*M), where N is length of lines(height) for pokemon sprite, M is length of characters in line (width)for sprite
+    """
+    key = (pokemon_name, back)
+    overlay = OVERLAYS.get(key)
+    if overlay is None:
+        lines = load_sprite(pokemon_name, back)
+        color = POKEMON_COLORS[pokemon_name]
+        bottom, centre, top_row, bottom_row, left_col, right_col = BACK_AREA if back else FRONT_AREA
+        sprite_width = len(lines[0])
+        sprite_height = len(lines)
+        overlay = OVERLAYS[key] = []
+        for x in range(sprite_height):
+            xind = bottom - sprite_height + x
+            if not top_row <= xind <= bottom_row:
+                continue
+            left = centre - sprite_width // 2
+            first = max(0, left_col - left)
+            last = min(sprite_width, len(lines[x]), right_col - left + 1)
+            cells = [(color if y == 0 else "") + lines[x][y] + (CLEAR if y == sprite_width - 1 else "") for y in range(first, last)]
+            if cells:
+                overlay.append((xind, left + first, cells))
+    return overlay
+
+
+def render_game_window(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team1_max_hp, team2_cur_hp, team2_max_hp, team1_lvl, team2_lvl, team1_status, team2_status, team1_remaining_pokemon, team2_remaining_pokemon) -> list[list[str]]:
+    """
+    Cells of the game screen based on the attributes of PokeTeam and Pokemon passed in, one list of cells per row.
+    Every cell is one character on the screen, with the ANSI colour codes which start or end there. The template is copied row by row and the sprites are drawn from their cached overlays, so no file is read after warm-up.
+    :complexity: Best O(H*W), where H and W are the height and width of the screen, when both overlays are cached
+                Worst O(H*W + N*M), where N is length of lines(height) for pokemon sprite, M is length of characters in line (width)for sprite
+    """
+    BATTLE_WINDOW = [row[:] for row in template_window()]
     team1_pokemon_name = team1_pokemon_name.lower()
     team2_pokemon_name = team2_pokemon_name.lower()
     # NAMES
@@ -120,31 +208,28 @@ def print_game_screen(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team
         BATTLE_WINDOW[21][112 + 3*x] = "█" if x < team1_remaining_pokemon else "*"
     
     # SPRITES
-    team1_color = POKEMON_COLORS[team1_pokemon_name]
-    with open("pokemon_printing/" + team1_pokemon_name + "_back.txt", "r") as f:
-        team1_lines = f.read().split("\n")
-    team1_sprite_width = len(team1_lines[0])
-    team1_sprite_height = len(team1_lines)
-    for x in range(team1_sprite_height):
-        for y in range(team1_sprite_width):
-            xind = 27 - team1_sprite_height + x
-            yind = 31 - team1_sprite_width // 2 + y
-            if 12 <= xind <= 27 and 5 <= yind <= 75 and y < len(team1_lines[x]):
-                BATTLE_WINDOW[xind][yind] = (team1_color if y == 0 else "") + team1_lines[x][y] + (CLEAR if y == team1_sprite_width - 1 else "")
-
-    team2_color = POKEMON_COLORS[team2_pokemon_name]
-    with open("pokemon_printing/" + team2_pokemon_name + ".txt", "r") as f:
-        team2_lines = f.read().split("\n")
-    team2_sprite_width = len(team2_lines[0])
-    team2_sprite_height = len(team2_lines)
-    for x in range(team2_sprite_height):
-        for y in range(team2_sprite_width):
-            xind = 17 - team2_sprite_height + x
-            yind = 101 - team2_sprite_width // 2 + y
-            if 1 <= xind <= 17 and 65 <= yind <= 136 and y < len(team2_lines[x]):
-                BATTLE_WINDOW[xind][yind] = (team2_color if y == 0 else "") + team2_lines[x][y] + (CLEAR if y == team2_sprite_width - 1 else "")
-    
-    print("\n".join(map(lambda z: "".join(z), BATTLE_WINDOW)))
+    for overlay in (sprite_overlay(team1_pokemon_name, True), sprite_overlay(team2_pokemon_name, False)):
+        for xind, yind, cells in overlay:
+            BATTLE_WINDOW[xind][yind:yind + len(cells)] = cells
+
+    return BATTLE_WINDOW
+
+def render_game_screen(*args) -> str:
+    """
+    Game screen based on the attributes of PokeTeam and Pokemon passed in (see render_game_window), as printed by print_game_screen.
+    :complexity: Best O(H*W), where H and W are the height and width of the screen, when both sprites are cached
+                Worst O(H*W + N*M), where N is length of lines(height) for pokemon sprite, M is length of characters in line (width)for sprite
+    """
+    return "\n".join(map(lambda z: "".join(z), render_game_window(*args)))
+
+def print_game_screen(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team1_max_hp, team2_cur_hp, team2_max_hp, team1_lvl, team2_lvl, team1_status, team2_status, team1_remaining_pokemon, team2_remaining_pokemon):
+    """
+    Display game screen based on the attributes of PokeTeam and Pokemon passed in
+    :complexity: Best O(H*W), where H and W are the height and width of the screen, when both sprites are cached
+                Worst O(H*W + N*M), where N is length of lines(height) for pokemon sprite, M is length of characters in line (width)for sprite
+    """
+    enable_ansi()
+    print(render_game_screen(team1_pokemon_name, team2_pokemon_name, team1_cur_hp, team1_max_hp, team2_cur_hp, team2_max_hp, team1_lvl, team2_lvl, team1_status, team2_status, team1_remaining_pokemon, team2_remaining_pokemon))
 
 if __name__ == "__main__":
     POKEMON = ["Charmander", "Charizard", "Bulbasaur", "Venusaur", "Squirtle", "Blastoise", "Gastly", "Haunter", "Gengar", "Eevee"]
@@ -4,34 +4,90 @@ Random number generator class. Uses LCG method with some reasonable initialisati
 __author__ = "Jackson Goerner"
 
 import time
+from array import array
+from types import MethodType
+
+
+def _load_numpy():
+    """
+    Returns the numpy module, imported on first use: numpy is optional and only random_block(k, as_numpy=True) and
+    block_tables need it, so importing this module (and everything built on it) does not load numpy.
+    Raises ImportError if numpy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("random_block(k, as_numpy=True) and RandomGen.block_tables require numpy") from None
+    return numpy
+
 
 class RandomGen():
     """
     Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
-    
-    Uses LCG method. All methods are O(1) best/worst case time complexity.
-    
+
+    Uses LCG method. All methods are O(1) best/worst case time complexity, except jump, spawn and random_block.
+
+    Calling the methods on the class uses the default stream shared by the whole process.
+    Instances are independent streams with the same constants, which can be handed to battles, threads or processes.
+
     Usage:
     ```
     RandomGen.set_seed(123)
     RandomGen.random()           # Random number from 0 to 2^32-1
     RandomGen.randint(1, 10)     # Random number from 1 to 10
     RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+
+    rng = RandomGen(123)         # Independent stream, same outputs as the default stream seeded with 123
+    rng.jump(1000)               # Skip the next 1000 outputs in O(log 1000)
+    streams = rng.spawn(4)       # 4 non-overlapping substreams of RandomGen.STRIDE outputs each
+    rng.random_block(100)        # array of the next 100 outputs of random()
     ```
     """
-    
+
     MOD = pow(2, 48)
     A = 25214903917
     C = 11
-    
+    STRIDE = pow(2, 32)     # default distance between substreams handed out by spawn
+
     seed = time.time_ns()
-    
+
+    _block_a = None     # numpy tables of jump_coefficients(j) for j from 0, shared by all streams
+    _block_c = None
+
+    # classmethods which act on the stream of an instance when called on it
+    _STREAM_METHODS = ("set_seed", "random", "randint", "random_chance", "jump", "substream", "spawn", "random_block")
+
+    def __init__(self, seed=None):
+        """Create an independent stream, seeded like set_seed."""
+        self._bind_stream_methods()
+        self.set_seed(seed)
+
+    def _bind_stream_methods(self):
+        """
+        Bind the stream methods to this instance once, so calling them on it acts on its own stream,
+        while calling them on the class stays a plain classmethod call on the default stream.
+        Methods a subclass overrides as instance methods are left to it.
+        """
+        cls = type(self)
+        for name in RandomGen._STREAM_METHODS:
+            method = getattr(cls, name)
+            if getattr(method, "__self__", None) is cls:
+                setattr(self, name, MethodType(method.__func__, self))
+
+    def __getstate__(self):
+        """The bound stream methods are not pickled, they are bound again on unpickling."""
+        return {name: value for name, value in self.__dict__.items() if name not in RandomGen._STREAM_METHODS}
+
+    def __setstate__(self, state):
+        self._bind_stream_methods()
+        self.__dict__.update(state)
+
     @classmethod
     def set_seed(cls, seed=None):
         """Seed all future calls to `random`."""
         seed = time.time_ns() if seed is None else seed
         cls.seed = seed
-    
+
     @classmethod
     def random(cls):
         """Returns a random integer from 0 to 2^32-1"""
@@ -47,3 +103,76 @@ class RandomGen():
     def random_chance(cls, ratio):
         """Returns random()/2^32 < ratio"""
         return cls.random()/(1 << 32) < ratio
+
+    @classmethod
+    def jump_coefficients(cls, n):
+        """
+        Returns (a, c) such that n steps of the LCG are seed -> (a * seed + c) % MOD.
+        O(log n), by squaring the step.
+        """
+        a, c = 1, 0                     # accumulated steps
+        step_a, step_c = cls.A, cls.C   # 2^i steps
+        while n > 0:
+            if n & 1:
+                a, c = (step_a * a) % cls.MOD, (step_a * c + step_c) % cls.MOD
+            step_a, step_c = (step_a * step_a) % cls.MOD, (step_a * step_c + step_c) % cls.MOD
+            n >>= 1
+        return a, c
+
+    @classmethod
+    def jump(cls, n):
+        """Skip the next `n` outputs, as if `random` was called `n` times. O(log n)"""
+        a, c = RandomGen.jump_coefficients(n)
+        cls.seed = (a * cls.seed + c) % cls.MOD
+
+    @classmethod
+    def substream(cls, i, stride=None):
+        """Returns a new stream starting `i` strides of `stride` outputs (default STRIDE) after this one. O(log(i*stride))"""
+        stream = RandomGen(cls.seed)
+        stream.jump(i * (RandomGen.STRIDE if stride is None else stride))
+        return stream
+
+    @classmethod
+    def spawn(cls, k, stride=None):
+        """Returns `k` new streams, the i-th starting `i+1` strides of `stride` outputs after this one. O(k log(k*stride))"""
+        return [cls.substream(i + 1, stride) for i in range(k)]
+
+    @classmethod
+    def block_tables(cls, k):
+        """
+        Returns numpy uint64 arrays (a, c) of at least k+1 elements, where (a[j], c[j]) = jump_coefficients(j).
+        The tables are grown by doubling, composing the first half with a jump of its length, and cached.
+        """
+        a, c = RandomGen._block_a, RandomGen._block_c
+        if a is None or len(a) <= k:
+            numpy = _load_numpy()
+            mask = numpy.uint64(cls.MOD - 1)
+            a, c = numpy.ones(1, dtype=numpy.uint64), numpy.zeros(1, dtype=numpy.uint64)
+            while len(a) <= k:
+                # j steps followed by n steps (products wrap modulo 2^64, which 2^48 divides)
+                a_n, c_n = (numpy.uint64(x) for x in cls.jump_coefficients(len(a)))
+                a, c = numpy.concatenate((a, (a * a_n) & mask)), numpy.concatenate((c, (a * c_n + c) & mask))
+            RandomGen._block_a, RandomGen._block_c = a, c
+        return a, c
+
+    @classmethod
+    def random_block(cls, k, as_numpy=False):
+        """
+        Returns the next `k` outputs of `random` as an array('L'), or a numpy uint32 array if `as_numpy`,
+        bit-identical to `k` sequential calls and advancing the stream the same way. O(k)
+        """
+        seed = cls.seed % cls.MOD
+        if as_numpy:
+            numpy = _load_numpy()
+            a, c = cls.block_tables(k)
+            states = (a[1:k + 1] * numpy.uint64(seed) + c[1:k + 1]) & numpy.uint64(cls.MOD - 1)
+            cls.seed = int(states[-1]) if k > 0 else seed
+            return (states >> numpy.uint64(16)).astype(numpy.uint32)
+
+        A, C, MOD = cls.A, cls.C, cls.MOD
+        block = array("L", bytes(array("L").itemsize * k))
+        for i in range(k):
+            seed = (A * seed + C) % MOD
+            block[i] = seed >> 16
+        cls.seed = seed
+        return block
@@ -0,0 +1,179 @@
+"""
+Renderers of the game screen printed by Battle every round at verbosity SCREEN.
+
+FrameRenderer prints every frame in full, followed by its footer lines (the teams), exactly as print_game_screen does.
+DiffRenderer keeps the previous frame on a terminal and only rewrites the cells which changed, with ANSI cursor
+positioning: the frame and footer stay at the top of the terminal and the battle log scrolls in the rows below them.
+terminal_renderer picks DiffRenderer when the output is a terminal and FrameRenderer otherwise (files, pipes, logs).
+"""
+
+import re
+import shutil
+import sys
+
+from print_screen import enable_ansi
+
+CLEAR = "\x1b[0m"
+SAVE_CURSOR = "\x1b7"
+RESTORE_CURSOR = "\x1b8"
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_LINE = "\x1b[K"
+RESET_SCROLL_REGION = "\x1b[r"
+
+COLOR_CODE = re.compile("\x1b\\[[0-9;]*m")
+
+# changed cells closer than this are rewritten with the unchanged cells between them, which is shorter than moving the cursor
+GAP = 6
+
+
+def move_to(row: int, column: int) -> str:
+    """ ANSI code moving the cursor to row and column, counted from 0. O(1) """
+    return f"\x1b[{row + 1};{column + 1}H"
+
+
+def color_after(state: str, text: str) -> str:
+    """
+    Colour codes in effect after text is printed with the codes of state in effect, since the last reset.
+    :complexity: Best O(L), where L is the length of text
+                Worst O(L), where L is the length of text
+    """
+    if "\x1b" not in text:
+        return state
+    for code in COLOR_CODE.findall(text):
+        state = "" if code == CLEAR else state + code
+    return state
+
+
+class FrameRenderer:
+    """
+    Renderer printing every frame in full.
+
+    Attributes:
+        stream (TextIO | None): stream written to, or None for sys.stdout at the time of writing
+        bytes_written (int): number of bytes (UTF-8) written since the renderer was created
+        ansi (bool): whether the terminal was set up for ANSI codes (see print_screen.enable_ansi) by a write
+
+    :complexity: draw is O(H*W), where H and W are the height and width of the frame, other functions are O(1)
+    """
+
+    def __init__(self, stream=None) -> None:
+        self.stream = stream
+        self.bytes_written = 0
+        self.ansi = False
+
+    def write(self, text: str) -> None:
+        """ Write text to the stream and count its bytes """
+        if not self.ansi:
+            enable_ansi(self.stream)
+            self.ansi = True
+        (sys.stdout if self.stream is None else self.stream).write(text)
+        self.bytes_written += len(text.encode("utf-8"))
+
+    def draw(self, window: list[list[str]], footer: list[str]) -> None:
+        """
+        Print a frame, one list of cells per row (see print_screen.render_game_window), then the lines of footer.
+        """
+        self.write("\n".join(map("".join, window)) + "\n" + "".join(line + "\n" for line in footer))
+
+    def close(self) -> None:
+        """ End the frames of a battle, the next frame is printed from scratch """
+        pass
+
+
+class DiffRenderer(FrameRenderer):
+    """
+    Renderer rewriting only the cells of the frame and the footer lines which changed since the previous frame.
+
+    The first frame clears the terminal, is printed at the top of it, and the rows below the footer become the scrolling
+    region where the rest of the output goes. A terminal too short for the frame, the footer and a few rows of log gets
+    full frames instead, as does a frame whose rows do not line up with the previous one.
+
+    Attributes:
+        height (int | None): number of rows of the terminal, or None to ask the terminal when the first frame is drawn
+        previous (list[list[str]] | None): frame on the terminal, None before the first frame of a battle
+        footer (list[str]): footer lines on the terminal
+
+    :complexity: draw is O(H*W), where H and W are the height and width of the frame, other functions are O(1)
+    """
+
+    LOG_ROWS = 3    # minimum number of rows left for the log below the footer
+
+    def __init__(self, stream=None, height: int | None = None) -> None:
+        super().__init__(stream)
+        self.height = height
+        self.previous = None
+        self.footer = []
+        self.rows = 0
+
+    def draw(self, window: list[list[str]], footer: list[str]) -> None:
+        """
+        Rewrite the cells of window and the lines of footer which changed since the previous frame.
+        """
+        rows = len(window) + len(footer)
+        if self.previous is None or self.rows != rows or any(len(new) != len(old) for new, old in zip(window, self.previous)):
+            self.close()
+            height = shutil.get_terminal_size().lines if self.height is None else self.height
+            if height < rows + self.LOG_ROWS:
+                super().draw(window, footer)
+                return
+            # clear the terminal, keep the rows below the frame and its footer scrolling, and print the whole frame there
+            self.write(CLEAR_SCREEN + f"\x1b[{rows + 1};{height}r" + move_to(0, 0)
+                       + "\n".join(map("".join, window)) + "\n" + "".join(line + CLEAR_LINE + "\n" for line in footer)
+                       + move_to(rows, 0))
+            self.rows = rows
+            self.previous = [row[:] for row in window]
+            self.footer = list(footer)
+            return
+
+        changes = []
+        # colour codes in effect on the way through the new and the previous frame, carried over from row to row:
+        # a cell is rewritten when it changed, or when it is printed in another colour than before
+        state = old_state = ""
+        for r, (new, old) in enumerate(zip(window, self.previous)):
+            if new == old and state == old_state:
+                state = old_state = color_after(state, "".join(new))
+                continue
+            # the colours only change at cells with colour codes, so only those and the changed cells are looked at
+            events = sorted({c for c, (a, b) in enumerate(zip(new, old)) if a != b or "\x1b" in a or "\x1b" in b})
+            runs = []       # [first column, last column, colour codes at the first column] of the cells to rewrite
+            previous = 0
+            for c in events + [len(new)]:
+                if state != old_state and previous < c:
+                    runs.append([previous, c - 1, state])     # unchanged cells printed in another colour than before
+                if c == len(new):
+                    break
+                if new[c] != old[c] or state != old_state:
+                    runs.append([c, c, state])
+                state = color_after(state, new[c])
+                old_state = color_after(old_state, old[c])
+                previous = c + 1
+            merged = []
+            for run in runs:
+                # rewrite the unchanged cells between runs closer than GAP rather than moving the cursor
+                if merged and run[0] - merged[-1][1] - 1 <= GAP:
+                    merged[-1][1] = run[1]
+                else:
+                    merged.append(run)
+            for first, last, codes in merged:
+                changes.append(move_to(r, first) + CLEAR + codes + "".join(new[first:last + 1]))
+        for r, (new, old) in enumerate(zip(footer, self.footer)):
+            if new != old:
+                changes.append(move_to(len(window) + r, 0) + CLEAR + new + CLEAR_LINE)
+        if changes:
+            self.write(SAVE_CURSOR + "".join(changes) + CLEAR + RESTORE_CURSOR)
+        self.previous = [row[:] for row in window]
+        self.footer = list(footer)
+
+    def close(self) -> None:
+        """ Give the whole terminal back to the output and forget the frame, the next frame is printed from scratch """
+        if self.previous is not None:
+            self.write(RESET_SCROLL_REGION + move_to((shutil.get_terminal_size().lines if self.height is None else self.height) - 1, 0) + "\n")
+            self.previous = None
+            self.footer = []
+            self.rows = 0
+
+
+def terminal_renderer(stream=None) -> FrameRenderer:
+    """ DiffRenderer when stream (default sys.stdout) is a terminal, FrameRenderer otherwise. O(1) """
+    isatty = getattr(sys.stdout if stream is None else stream, "isatty", None)
+    return DiffRenderer(stream) if isatty is not None and isatty() else FrameRenderer(stream)
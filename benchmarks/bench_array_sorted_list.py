@@ -0,0 +1,88 @@
+"""
+Benchmark of ArraySortedList: building a sorted list of n items one add at a time and with ArraySortedList.from_items,
+membership tests and deletions, against the same list moving items one index at a time and scanning for membership
+(the element by element methods ArraySortedList had before, reproduced in LoopSortedList). Times are the best of a few runs.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_array_sorted_list.py [n ...]
+"""
+
+import sys
+import time
+
+from array_sorted_list import ArraySortedList
+from referential_array import BACKEND
+from sorted_list import ListItem
+
+
+class LoopSortedList(ArraySortedList):
+    """ ArraySortedList moving items one index at a time, with a hand-written binary search and a linear membership scan """
+
+    def __contains__(self, item: ListItem):
+        for i in range(len(self)):
+            if self.array[i] == item:
+                return True
+        return False
+
+    def _shuffle_right(self, index: int) -> None:
+        for i in range(len(self), index, -1):
+            self.array[i] = self.array[i - 1]
+
+    def _shuffle_left(self, index: int) -> None:
+        for i in range(index, len(self)):
+            self.array[i] = self.array[i + 1]
+
+    def _index_to_add(self, item: ListItem) -> int:
+        low, high = 0, len(self) - 1
+        while low <= high:
+            mid = (low + high) // 2
+            if self[mid].key < item.key:
+                low = mid + 1
+            elif self[mid].key > item.key:
+                high = mid - 1
+            else:
+                return mid
+        return low
+
+
+def best_of(setup, run, repeat: int = 3) -> float:
+    """ Least time in milliseconds of run(setup()) over repeat runs """
+    times = []
+    for _ in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        run(argument)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def filled(cls, items):
+    """ List of class cls with items added one at a time """
+    sorted_list = cls(1)
+    for item in items:
+        sorted_list.add(item)
+    return sorted_list
+
+
+def main(*sizes: int) -> None:
+    print(f"ArrayR backend: {BACKEND}")
+    print(f"{'n':>7}{'operation':>28}{'loop ms':>12}{'block ms':>12}{'speed-up':>10}")
+    for n in sizes or (1000, 5000):
+        items = [ListItem(x, (x * 7919) % n) for x in range(n)]
+        probes = items[::max(1, n // 200)]      # membership of 200 items, so the linear scan stays affordable
+        rows = {
+            "add x n": (best_of(lambda: items, lambda i: filled(LoopSortedList, i)),
+                        best_of(lambda: items, lambda i: filled(ArraySortedList, i))),
+            "add x n / from_items": (best_of(lambda: items, lambda i: filled(LoopSortedList, i)),
+                                     best_of(lambda: items, ArraySortedList.from_items)),
+            f"in x{len(probes)}": (best_of(lambda: filled(LoopSortedList, items), lambda l: [p in l for p in probes]),
+                                   best_of(lambda: ArraySortedList.from_items(items), lambda l: [p in l for p in probes])),
+            "delete_at_index(0) x n/2": (best_of(lambda: filled(LoopSortedList, items), lambda l: [l.delete_at_index(0) for _ in range(n // 2)]),
+                                         best_of(lambda: ArraySortedList.from_items(items), lambda l: [l.delete_at_index(0) for _ in range(n // 2)])),
+        }
+        for name, (loop, block) in rows.items():
+            print(f"{n:>7}{name:>28}{loop:>12.1f}{block:>12.1f}{loop / block:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,38 @@
+"""
+Benchmark of the vectorised battle engine (simulation.simulate_batch) against the object engine, for ALWAYS_ATTACK teams.
+Requires numpy.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_batch_engine.py [battles]
+"""
+
+import sys
+import time
+
+from battle import Battle
+from poke_team import PokeTeam, Criterion
+from random_gen import RandomGen
+from simulation import simulate_batch
+
+SPEC_A = ([1, 1, 1, 1, 1], 2, PokeTeam.AI.ALWAYS_ATTACK, Criterion.HP)
+SPEC_B = ([2, 0, 2, 0, 2], 0, PokeTeam.AI.ALWAYS_ATTACK, None)
+
+
+def object_engine(n: int) -> None:
+    """ The same battles as simulate_batch(SPEC_A, SPEC_B, n, seed=7), one Battle at a time. """
+    team_a, team_b = PokeTeam("A", *SPEC_A), PokeTeam("B", *SPEC_B)
+    for seed in RandomGen(7).random_block(n):
+        Battle(rng=RandomGen(seed)).battle(team_a, team_b)
+        team_a.regenerate_team()
+        team_b.regenerate_team()
+
+
+def main(n: int) -> None:
+    for name, fn in [("object engine", lambda: object_engine(n)), ("simulate_batch", lambda: simulate_batch(SPEC_A, SPEC_B, n, seed=7))]:
+        start = time.perf_counter()
+        fn()
+        print(f"{name:<16}{n / (time.perf_counter() - start):>12.1f} battles/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,62 @@
+"""
+Benchmark of Battle.battle throughput (battles per second) at each verbosity level.
+
+Output of the LOG and SCREEN levels is sent to os.devnull, so the numbers measure the cost of
+formatting and rendering rather than the speed of the terminal.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_battle.py [battles]
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+from battle import Battle
+from poke_team import PokeTeam, Criterion
+from random_gen import RandomGen
+
+LEVELS = [("QUIET", Battle.QUIET), ("LOG", Battle.LOG), ("SCREEN", Battle.SCREEN)]
+
+
+def make_teams(n: int) -> list:
+    """ Generate n pairs of random teams, seeded so every verbosity level battles the same teams. """
+    RandomGen.set_seed(20221018)
+    pairs = []
+    for i in range(n):
+        team1 = PokeTeam.random_team(f"A{i}", RandomGen.randint(0, 2), ai_mode=PokeTeam.AI.RANDOM, criterion=Criterion.HP)
+        team2 = PokeTeam.random_team(f"B{i}", RandomGen.randint(0, 2), ai_mode=PokeTeam.AI.RANDOM, criterion=Criterion.SPD)
+        pairs.append((team1, team2))
+    return pairs
+
+
+def run(verbosity: int, pairs: list) -> float:
+    """ Battle every pair of teams once and return the number of battles per second. """
+    b = Battle(verbosity=verbosity)
+    RandomGen.set_seed(1337)
+    start = time.perf_counter()
+    for team1, team2 in pairs:
+        b.battle(team1, team2)
+        team1.regenerate_team()
+        team2.regenerate_team()
+    return len(pairs) / (time.perf_counter() - start)
+
+
+def main(n: int) -> None:
+    # sprites are loaded relative to the repository root
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    pairs = make_teams(n)
+    results = []
+    for name, verbosity in LEVELS:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            results.append((name, verbosity, run(verbosity, pairs)))
+
+    print(f"{'verbosity':<12}{'battles/s':>12}{'relative':>10}")
+    quiet = results[0][2]
+    for name, verbosity, rate in results:
+        print(f"{name + ' (' + str(verbosity) + ')':<12}{rate:>12.1f}{rate / quiet:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,41 @@
+"""
+Benchmark of the leaderboard (1000 battles) without a battle cache, with an empty cache, with the cache it filled,
+and with a new cache read back from the file the first run wrote.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_battle_cache.py
+"""
+
+import os
+import tempfile
+import time
+
+from battle_cache import BattleCache
+from leaderboard import leaderboard
+from poke_team import PokeTeam, Criterion
+
+
+def timed(run) -> float:
+    """ Time of run() in seconds """
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    team = PokeTeam("Leader", [1, 1, 1, 1, 2], 2, PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE, criterion=Criterion.DEF)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "battles.jsonl")
+        cache = BattleCache(path=path)
+        rows = [
+            ("no cache", timed(lambda: leaderboard(team))),
+            ("empty cache", timed(lambda: leaderboard(team, cache=cache))),
+            ("filled cache", timed(lambda: leaderboard(team, cache=cache))),
+            ("cache from file", timed(lambda: leaderboard(team, cache=BattleCache(path=path)))),
+        ]
+    for name, seconds in rows:
+        print(f"{name:<18}{seconds:>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
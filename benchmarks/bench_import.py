@@ -0,0 +1,43 @@
+"""
+Benchmark of the time to import the game modules in a new interpreter, as a short-lived worker process does,
+and of which rendering, test and optional (numpy) modules the import loads (none of them are needed to play battles).
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_import.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+MODULES = ["battle", "poke_team", "tournament", "tower"]
+WATCHED = ["print_screen", "screen_renderer", "unittest", "shutil", "numpy"]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+print(" ".join(name for name in {watched} if name in sys.modules))
+"""
+
+
+def import_time(module: str, runs: int) -> tuple:
+    """ Median time in milliseconds to import module in a new interpreter, and the watched modules it loads """
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", PROBE.format(module=module, watched=WATCHED)],
+                             capture_output=True, text=True, check=True).stdout.split("\n")
+        times.append(float(out[0]) * 1000)
+    return statistics.median(times), out[1] or "-"
+
+
+def main(runs: int = 20) -> None:
+    print(f"{'module':<12}{'import ms':>10}  loads")
+    for module in MODULES:
+        ms, loaded = import_time(module, runs)
+        print(f"{module:<12}{ms:>10.1f}  {loaded}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,25 @@
+"""
+Benchmark of the leaderboard (1000 battles) with 1 to P worker processes.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_leaderboard.py [max processes]
+"""
+
+import os
+import sys
+import time
+
+from leaderboard import leaderboard
+from poke_team import PokeTeam, Criterion
+
+
+def main(max_processes: int) -> None:
+    team = PokeTeam("Leader", [1, 1, 1, 1, 2], 2, PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE, criterion=Criterion.DEF)
+    for processes in range(1, max_processes + 1):
+        start = time.perf_counter()
+        leaderboard(team, processes=processes)
+        print(f"{processes:>3} processes{time.perf_counter() - start:>10.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count())
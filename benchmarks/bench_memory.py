@@ -0,0 +1,46 @@
+"""
+Benchmark of the memory held by live pokemon, measured with tracemalloc.
+
+Builds a pool of random teams and reports the bytes allocated per live pokemon, for the pokemon objects alone
+(the same pokemon built into a flat list) and for the whole pool (pokemon, team containers and teams).
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_memory.py [teams]
+"""
+
+import sys
+import tracemalloc
+
+from poke_team import PokeTeam, Criterion
+from pokemon import TEAM_POKEMON
+from random_gen import RandomGen
+
+
+def measure(build) -> tuple:
+    """ (bytes still allocated, object built) after calling build """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, built
+
+
+def main(n: int) -> None:
+    RandomGen.set_seed(7)
+    pool_bytes, pool = measure(lambda: [PokeTeam.random_team(f"Team {x}", x % 3, criterion=Criterion.HP) for x in range(n)])
+    counts = [0] * len(TEAM_POKEMON)
+    for team in pool:
+        for i, count in enumerate(team.team_numbers):
+            counts[i] += count
+    live = sum(counts)
+    del pool
+
+    pokemon_bytes, pokemon = measure(lambda: [cls(x) for cls, count in zip(TEAM_POKEMON, counts) for x in range(count)])
+    print(f"{n} teams, {live} live pokemon")
+    print(f"{'pokemon only':<16}{pokemon_bytes / live:>10.1f} bytes/pokemon")
+    print(f"{'team pool':<16}{pool_bytes / live:>10.1f} bytes/pokemon")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,38 @@
+"""
+Benchmark of building game screens, in frames per second, with the sprite caches of print_screen warm and with them
+cleared before every frame (every frame reads both sprite files, as before the caches).
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_print_screen.py
+"""
+
+import itertools
+import time
+
+import print_screen
+from print_screen import render_game_screen
+
+POKEMON = ["Charmander", "Charizard", "Bulbasaur", "Venusaur", "Squirtle", "Blastoise", "Gastly", "Haunter", "Gengar", "Eevee"]
+STATUSES = ["burn", "sleep", "paralysis", "poison", "confuse", "free"]
+
+
+def frames_per_second(frames: int, cold: bool) -> float:
+    """ Frames built per second, over every pair of pokemon """
+    pairs = itertools.cycle(itertools.product(POKEMON, POKEMON))
+    start = time.perf_counter()
+    for x in range(frames):
+        if cold:
+            print_screen.SPRITES.clear()
+            print_screen.OVERLAYS.clear()
+        team1, team2 = next(pairs)
+        render_game_screen(team1, team2, x % 20 + 1, 20, x % 60 + 1, 60, 3, 5, STATUSES[x % 6], STATUSES[x // 6 % 6], x % 7, x % 5)
+    return frames / (time.perf_counter() - start)
+
+
+def main(frames: int = 5000) -> None:
+    for name, cold in (("cold caches", True), ("warm caches", False)):
+        print(f"{name:<14}{frames_per_second(frames, cold):>12.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
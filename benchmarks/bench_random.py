@@ -0,0 +1,33 @@
+"""
+Benchmark of drawing k random numbers one at a time against RandomGen.random_block (array and numpy buffers).
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_random.py [k]
+"""
+
+import sys
+import time
+
+from random_gen import RandomGen
+
+try:
+    import numpy
+except ImportError:     # numpy is optional, the numpy block is only timed when it is installed
+    numpy = None
+
+
+def main(k: int) -> None:
+    rng = RandomGen(1)
+    runs = [("random() x k", lambda: [rng.random() for _ in range(k)]),
+            ("random_block(k)", lambda: rng.random_block(k))]
+    if numpy is not None:
+        rng.random_block(k, as_numpy=True)     # build the coefficient tables outside of the timing
+        runs.append(("random_block(k, numpy)", lambda: rng.random_block(k, as_numpy=True)))
+    for name, fn in runs:
+        start = time.perf_counter()
+        fn()
+        print(f"{name:<24}{k / (time.perf_counter() - start) / 1e6:>10.2f} M numbers/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
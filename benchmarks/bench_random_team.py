@@ -0,0 +1,34 @@
+"""
+Benchmark of PokeTeam.random_team throughput: random teams built per second for every battle mode
+(and every criterion in battle mode 2), from the same seed.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_random_team.py [teams]
+"""
+
+import sys
+import time
+
+from poke_team import PokeTeam, Criterion
+from random_gen import RandomGen
+
+
+def throughput(n: int, battle_mode: int, criterion: Criterion | None) -> float:
+    """ Random teams built per second """
+    RandomGen.set_seed(11)
+    start = time.perf_counter()
+    for x in range(n):
+        PokeTeam.random_team("T", battle_mode, criterion=criterion)
+    return n / (time.perf_counter() - start)
+
+
+def main(n: int) -> None:
+    print(f"{'mode':<6}{'criterion':<12}{'teams/s':>12}")
+    for battle_mode in range(3):
+        for criterion in (Criterion if battle_mode == 2 else (None,)):
+            name = criterion.name if criterion else "-"
+            print(f"{battle_mode:<6}{name:<12}{throughput(n, battle_mode, criterion):>12.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
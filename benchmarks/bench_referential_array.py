@@ -0,0 +1,82 @@
+"""
+Benchmark of every ADT of DataStructures, and of the leaderboard built on them, with each backend of ArrayR
+(ARRAYR_BACKEND=ctypes and ARRAYR_BACKEND=list). Each backend runs in its own interpreter, since the backend is
+chosen when referential_array is imported. Times are the best of a few runs.
+LinkedList and BSet do not use ArrayR and are timed for comparison.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_referential_array.py [n]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+BACKENDS = ["ctypes", "list"]
+
+
+def best_of(setup, run, repeat: int = 5) -> float:
+    """ Least time in milliseconds of run(setup()) over repeat runs, each on new structures """
+    times = []
+    for _ in range(repeat):
+        structures = setup()
+        start = time.perf_counter()
+        run(*structures)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def measure(n: int) -> dict:
+    """ Milliseconds of n operations of each kind on every ADT, with the backend of this interpreter """
+    from array_sorted_list import ArraySortedList
+    from bset import BSet
+    from deque_adt import CircularDeque
+    from leaderboard import leaderboard
+    from linked_list import LinkedList
+    from poke_team import PokeTeam, Criterion
+    from queue_adt import CircularQueue
+    from sorted_list import ListItem
+    from stack_adt import ArrayStack
+
+    keys = [(x * 7919) % n for x in range(n)]
+    small = min(n, 2000)    # ArraySortedList.add and LinkedList are O(n) an operation
+    team = PokeTeam("Leader", [1, 1, 1, 1, 2], 2, PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE, criterion=Criterion.DEF)
+
+    def filled_sorted_list():
+        sorted_list = ArraySortedList(small)
+        for x in keys[:small]:
+            sorted_list.add(ListItem(x, x))
+        return (sorted_list,)
+
+    return {
+        "ArrayStack push + pop": best_of(lambda: (ArrayStack(n),), lambda s: [s.push(x) for x in keys] + [s.pop() for _ in keys]),
+        "CircularQueue append + serve": best_of(lambda: (CircularQueue(n),), lambda q: [q.append(x) for x in keys] + [q.serve() for _ in keys]),
+        "CircularDeque push_front + pop_back": best_of(lambda: (CircularDeque(n),),
+                                                       lambda d: [d.push_front(x) for x in keys] + [d.pop_back() for _ in keys]),
+        f"ArraySortedList add x{small}": best_of(lambda: (ArraySortedList(small),), lambda l: [l.add(ListItem(x, x)) for x in keys[:small]]),
+        f"ArraySortedList [i] x{n}": best_of(filled_sorted_list, lambda l: [l[i % small] for i in range(n)]),
+        f"LinkedList append + [i] x{small}": best_of(lambda: (LinkedList(),), lambda l: [l.append(x) for x in keys[:small]] + [l[i] for i in range(small)]),
+        "BSet add + in": best_of(lambda: (BSet(),), lambda b: [b.add(x % 64 + 1) for x in keys] + [x % 64 + 1 in b for x in keys]),
+        "leaderboard (1000 battles)": best_of(lambda: (), lambda: leaderboard(team), repeat=3),
+    }
+
+
+def main(n: int = 20000) -> None:
+    results = {}
+    for backend in BACKENDS:
+        env = dict(os.environ, ARRAYR_BACKEND=backend)
+        out = subprocess.run([sys.executable, __file__, "--measure", str(n)], env=env, capture_output=True, text=True, check=True).stdout
+        results[backend] = json.loads(out)
+    print(f"{'n = ' + str(n):<42}" + "".join(f"{backend + ' ms':>12}" for backend in BACKENDS) + f"{'speed-up':>10}")
+    for name in results[BACKENDS[0]]:
+        times = [results[backend][name] for backend in BACKENDS]
+        print(f"{name:<42}" + "".join(f"{t:>12.1f}" for t in times) + f"{times[0] / times[1]:>9.2f}x")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        print(json.dumps(measure(int(sys.argv[2]))))
+    else:
+        main(*map(int, sys.argv[1:]))
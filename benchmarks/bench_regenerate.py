@@ -0,0 +1,53 @@
+"""
+Benchmark of PokeTeam.regenerate_team, which restores a team from its template, against rebuilding the roster
+from scratch (creating every pokemon and container again), for every team size and battle mode.
+Every regeneration follows a drained team, as after a battle.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_regenerate.py [repeats]
+"""
+
+import sys
+import time
+
+from poke_team import PokeTeam, Criterion, BattleMode0
+
+
+def team_numbers(size: int) -> list[int]:
+    """ team_numbers of size pokemon, spread over the species """
+    return [size // 5 + (1 if i < size % 5 else 0) for i in range(5)]
+
+
+def rebuild(team: PokeTeam) -> None:
+    """ Regeneration from scratch: new pokemon, ListItems and containers """
+    if team.battle_mode == 2:
+        team.pokeTeamMembers = team.bm_2_team(team.team_numbers)
+    else:
+        team.pokeTeamMembers = BattleMode0(team.bm_0_or_1_team(team.team_numbers)).pokeTeamMembers
+    team.heal_times = 0
+
+
+def per_call(team: PokeTeam, regenerate, repeats: int) -> float:
+    """ Mean time in microseconds of regenerate on a drained team """
+    total = 0.0
+    for _ in range(repeats):
+        while not team.is_empty():
+            team.retrieve_pokemon()
+        start = time.perf_counter()
+        regenerate(team)
+        total += time.perf_counter() - start
+    return 1e6 * total / repeats
+
+
+def main(repeats: int) -> None:
+    print(f"{'mode':<6}{'size':>6}{'template (us)':>16}{'rebuild (us)':>16}{'speedup':>10}")
+    for battle_mode in range(3):
+        for size in range(1, PokeTeam.MAX_TEAM_SIZE + 1):
+            team = PokeTeam("A", team_numbers(size), battle_mode, PokeTeam.AI.ALWAYS_ATTACK, criterion=Criterion.HP)
+            template = per_call(team, PokeTeam.regenerate_team, repeats)
+            scratch = per_call(team, rebuild, repeats)
+            print(f"{battle_mode:<6}{size:>6}{template:>16.2f}{scratch:>16.2f}{scratch / template:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,61 @@
+"""
+Benchmark of battle recordings: bytes per battle against the full game screens printed at verbosity SCREEN,
+and time to seek to a round (Replay.turn) by keyframe interval, against decoding every round from the start.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_replay.py [battles]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+from battle import Battle
+from poke_team import PokeTeam, Criterion
+from random_gen import RandomGen
+from replay import BattleRecorder, Replay
+from screen_renderer import FrameRenderer
+
+
+def record(battles: int, keyframe_interval: int, verbosity: int = Battle.QUIET) -> tuple:
+    """ Recordings of the same seeded battles, and the bytes of their game screens when verbosity is SCREEN """
+    RandomGen.set_seed(20221018)
+    recorder = BattleRecorder(keyframe_interval)
+    renderer = FrameRenderer(io.StringIO())
+    b = Battle(verbosity=verbosity, renderer=renderer, recorder=recorder)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(battles):
+            team1 = PokeTeam.random_team(f"A{i}", RandomGen.randint(0, 2), ai_mode=PokeTeam.AI.RANDOM, criterion=Criterion.HP)
+            team2 = PokeTeam.random_team(f"B{i}", RandomGen.randint(0, 2), ai_mode=PokeTeam.AI.RANDOM, criterion=Criterion.SPD)
+            b.battle(team1, team2)
+    return recorder.replays, renderer.bytes_written
+
+
+def seek_time(replays: list) -> float:
+    """ Mean time in microseconds of Replay.turn, over every round of every recording """
+    replays = [Replay(data) for data in replays]
+    rounds = sum(map(len, replays))
+    start = time.perf_counter()
+    for replay in replays:
+        for index in range(len(replay)):
+            replay.turn(index)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main(battles: int = 500) -> None:
+    replays, screen_bytes = record(battles, 16, Battle.SCREEN)
+    rounds = sum(len(Replay(data)) for data in replays)
+    print(f"{battles} battles, {rounds / battles:.1f} rounds a battle")
+    print(f"recordings    {sum(map(len, replays)) / battles:>10.0f} bytes/battle  (largest {max(map(len, replays))})")
+    print(f"game screens  {screen_bytes / battles:>10.0f} bytes/battle")
+    print(f"{'keyframes every':<18}{'bytes/battle':>13}{'seek us':>10}")
+    for keyframe_interval in (1, 4, 16, 10 ** 6):
+        replays, _ = record(battles, keyframe_interval)
+        name = "never" if keyframe_interval == 10 ** 6 else f"{keyframe_interval} rounds"
+        print(f"{name:<18}{sum(map(len, replays)) / battles:>13.0f}{seek_time(replays):>10.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Benchmark of the SQLite result store: batched inserts of random battle records, then the indexed head_to_head and
+battles_with_seed queries against a full scan of the table.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_result_store.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from poke_team import PokeTeam, Criterion
+from random_gen import RandomGen
+from result_store import ResultStore
+
+
+def main(n: int) -> None:
+    RandomGen.set_seed(5)
+    specs = [PokeTeam.random_spec(RandomGen.randint(0, 2), ai_mode=PokeTeam.AI.RANDOM, criterion=Criterion.SPD) for _ in range(200)]
+    with tempfile.TemporaryDirectory() as directory:
+        with ResultStore(os.path.join(directory, "battles.db")) as store:
+            start = time.perf_counter()
+            for seed in range(n):
+                store.record(specs[seed % 200], specs[(seed * 7) % 200], seed, RandomGen.randint(0, 2), RandomGen.randint(1, 30))
+            store.flush()
+            insert = time.perf_counter() - start
+
+            start = time.perf_counter()
+            result = store.head_to_head(specs[3], specs[21])
+            matchup = time.perf_counter() - start
+            start = time.perf_counter()
+            store.battles_with_seed(n // 2)
+            by_seed = time.perf_counter() - start
+            start = time.perf_counter()
+            store.connection.execute("SELECT COUNT(*) FROM battles NOT INDEXED WHERE seed = ?", (n // 2,)).fetchone()
+            scan = time.perf_counter() - start
+
+    print(f"{n} rows inserted in {insert:.3f} s ({n / insert:.0f} rows/s)")
+    print(f"{'head_to_head':<20}{1e3 * matchup:>10.3f} ms ({result.battles} battles)")
+    print(f"{'battles_with_seed':<20}{1e3 * by_seed:>10.3f} ms")
+    print(f"{'full scan by seed':<20}{1e3 * scan:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,44 @@
+"""
+Benchmark of the bytes written per battle at verbosity SCREEN by the full frame renderer and by the diff renderer
+(as on a terminal of 60 rows), for the game screens and the team lines under them. The battle log is not counted.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_screen_renderer.py [battles]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+from battle import Battle
+from poke_team import PokeTeam, Criterion
+from random_gen import RandomGen
+from screen_renderer import DiffRenderer, FrameRenderer
+
+
+def run(renderer, battles: int) -> tuple:
+    """ Bytes written by renderer, rounds played and seconds taken over the same seeded battles """
+    RandomGen.set_seed(20221018)
+    b = Battle(verbosity=Battle.SCREEN, renderer=renderer)
+    rounds = 0
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(battles):
+            team1 = PokeTeam.random_team(f"A{i}", RandomGen.randint(0, 2), ai_mode=PokeTeam.AI.RANDOM, criterion=Criterion.HP)
+            team2 = PokeTeam.random_team(f"B{i}", RandomGen.randint(0, 2), ai_mode=PokeTeam.AI.RANDOM, criterion=Criterion.SPD)
+            b.battle(team1, team2)
+            rounds += b.rounds
+    return renderer.bytes_written, rounds, time.perf_counter() - start
+
+
+def main(battles: int = 200) -> None:
+    print(f"{'renderer':<10}{'bytes/battle':>14}{'bytes/round':>13}{'battles/s':>11}")
+    for name, renderer in (("full", FrameRenderer(io.StringIO())), ("diff", DiffRenderer(io.StringIO(), height=60))):
+        written, rounds, seconds = run(renderer, battles)
+        print(f"{name:<10}{written / battles:>14.0f}{written / rounds:>13.0f}{battles / seconds:>11.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,35 @@
+"""
+Benchmark of simulate_many against the per-object loop of leaderboard.py (a new PokeTeam and Battle per battle).
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_simulation.py [battles]
+"""
+
+import sys
+import time
+
+from battle import Battle
+from poke_team import PokeTeam, Criterion
+from random_gen import RandomGen
+from simulation import simulate_many
+
+SPEC_A = ([1, 1, 1, 1, 1], 2, PokeTeam.AI.RANDOM, Criterion.HP)
+SPEC_B = ([2, 0, 2, 0, 2], 0, PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE, None)
+
+
+def object_loop(n: int) -> None:
+    """ Build both teams and a battle for every battle, as the leaderboard loop does for its opponents. """
+    RandomGen.set_seed(7)
+    for i in range(n):
+        Battle().battle(PokeTeam(f"A{i}", *SPEC_A), PokeTeam(f"B{i}", *SPEC_B))
+
+
+def main(n: int) -> None:
+    for name, fn in [("object loop", lambda: object_loop(n)), ("simulate_many", lambda: simulate_many(SPEC_A, SPEC_B, n, seed=7))]:
+        start = time.perf_counter()
+        fn()
+        print(f"{name:<16}{n / (time.perf_counter() - start):>12.1f} battles/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
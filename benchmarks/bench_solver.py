@@ -0,0 +1,40 @@
+"""
+Benchmark of the exact solver of ALWAYS_ATTACK matchups against estimating the same odds with simulate_many,
+for random pairs of teams.
+
+Usage (from the repository root):
+    PYTHONPATH=Utils:DataStructures:GameClasses python benchmarks/bench_solver.py [matchups] [battles]
+"""
+
+import sys
+import time
+
+from poke_team import PokeTeam, Criterion
+from random_gen import RandomGen
+from simulation import simulate_many
+from solver import MatchupSolver
+
+
+def main(matchups: int, battles: int) -> None:
+    RandomGen.set_seed(3)
+    specs = [PokeTeam.random_spec(RandomGen.randint(0, 2), ai_mode=PokeTeam.AI.ALWAYS_ATTACK, criterion=Criterion.HP)
+             for _ in range(2 * matchups)]
+    pairs = list(zip(specs[::2], specs[1::2]))
+
+    solver = MatchupSolver()
+    start = time.perf_counter()
+    exact = [solver.solve(a, b) for a, b in pairs]
+    solve_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    estimates = [simulate_many(a, b, battles, seed=i) for i, (a, b) in enumerate(pairs)]
+    simulate_time = time.perf_counter() - start
+
+    error = max(abs(odds.wins - res.wins / res.battles) for odds, res in zip(exact, estimates))
+    print(f"{matchups} matchups, {len(solver.memo)} battle states solved")
+    print(f"{'exact solver':<28}{solve_time:>10.3f} s")
+    print(f"{f'simulate_many ({battles} battles)':<28}{simulate_time:>10.3f} s   max win rate error {error:.4f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20, int(sys.argv[2]) if len(sys.argv) > 2 else 2000)
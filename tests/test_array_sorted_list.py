@@ -0,0 +1,57 @@
+"""
+This file includes test cases for the ArraySortedList in array_sorted_list.py.
+"""
+from array_sorted_list import ArraySortedList
+from sorted_list import ListItem
+from tests.base_test import BaseTest
+
+
+class TestArraySortedList(BaseTest):
+
+    KEYS = [5, 1, 3, 3, 9, 0, 3, 7, 1]
+
+    def values(self, sorted_list: ArraySortedList) -> list:
+        """ Values of sorted_list in order """
+        return [sorted_list[i].value for i in range(len(sorted_list))]
+
+    def test_add(self):
+        """Test that added items are sorted, equal keys in the order they were added, resizing as needed"""
+        items = [ListItem(i, k) for i, k in enumerate(self.KEYS)]
+        sorted_list = ArraySortedList(1)
+        for item in items:
+            sorted_list.add(item)
+        self.assertEqual(len(sorted_list), len(items))
+        self.assertEqual(self.values(sorted_list), [5, 1, 8, 2, 3, 6, 0, 7, 4])
+
+    def test_from_items(self):
+        """Test that the bulk-loaded list is the list built by add, and that it can grow"""
+        items = [ListItem(i, k) for i, k in enumerate(self.KEYS)]
+        added = ArraySortedList(1)
+        for item in items:
+            added.add(item)
+        loaded = ArraySortedList.from_items(items)
+        self.assertEqual(self.values(loaded), self.values(added))
+        loaded.add(ListItem("new", 2))
+        self.assertEqual(self.values(loaded), [5, 1, 8, "new", 2, 3, 6, 0, 7, 4])
+        self.assertTrue(ArraySortedList.from_items([]).is_empty())
+
+    def test_search(self):
+        """Test membership and index among items of the same key, and of missing items"""
+        items = [ListItem(i, k) for i, k in enumerate(self.KEYS)]
+        sorted_list = ArraySortedList.from_items(items)
+        for item in items:
+            self.assertIn(item, sorted_list)
+            self.assertIs(sorted_list[sorted_list.index(item)], item)
+        self.assertNotIn(ListItem(2, 3), sorted_list)
+        self.assertNotIn(ListItem(2, 4), sorted_list)
+        self.assertRaises(ValueError, lambda: sorted_list.index(ListItem(2, 10)))
+
+    def test_delete(self):
+        """Test that deleting and removing items moves the rest left"""
+        items = [ListItem(i, k) for i, k in enumerate(self.KEYS)]
+        sorted_list = ArraySortedList.from_items(items)
+        self.assertIs(sorted_list.delete_at_index(0), items[5])
+        sorted_list.remove(items[3])
+        self.assertEqual(self.values(sorted_list), [1, 8, 2, 6, 0, 7, 4])
+        self.assertIs(sorted_list.delete_at_index(6), items[4])
+        self.assertRaises(IndexError, lambda: sorted_list.delete_at_index(6))
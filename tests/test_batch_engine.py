@@ -0,0 +1,61 @@
+"""
+This file includes test cases validating the struct-of-arrays battle engine against the object battle engine.
+"""
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from random_gen import RandomGen
+from battle import Battle
+from poke_team import Criterion, PokeTeam
+from tests.base_test import BaseTest
+
+if numpy is not None:
+    from batch_engine import BatchBattle, roster
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestBatchEngine(BaseTest):
+
+    def random_teams(self, n):
+        """Generate n pairs of random ALWAYS_ATTACK teams of every battle mode"""
+        pairs = []
+        for i in range(n):
+            pair = []
+            for name in ("A", "B"):
+                criterion = Criterion(RandomGen.randint(1, len(Criterion)))
+                pair.append(PokeTeam.random_team(f"{name}{i}", RandomGen.randint(0, 2), ai_mode=PokeTeam.AI.ALWAYS_ATTACK, criterion=criterion))
+            pairs.append(pair)
+        return pairs
+
+    def test_matches_object_engine(self):
+        """Test that every lane gives the same result, in the same number of rounds, as Battle with the same seed"""
+        RandomGen.set_seed(20221018)
+        pairs = self.random_teams(400)
+        seeds = list(RandomGen.random_block(len(pairs)))
+        engine = BatchBattle([roster(t1) for t1, _ in pairs], [roster(t2) for _, t2 in pairs], seeds)
+        results = engine.run()
+
+        for (team1, team2), seed, res, rounds in zip(pairs, seeds, results, engine.rounds):
+            b = Battle(rng=RandomGen(seed))
+            self.assertEqual(b.battle(team1, team2), res)
+            self.assertEqual(b.rounds, rounds)
+        # every outcome is covered by the validation
+        self.assertEqual(set(results.tolist()), {0, 1, 2})
+
+    def test_single_pokemon(self):
+        """Test a battle of single pokemon, which evolve and level up"""
+        for numbers1, numbers2 in [([0, 0, 0, 1, 0], [1, 0, 0, 0, 0]), ([0, 1, 0, 0, 0], [0, 0, 1, 0, 0]), ([0, 0, 0, 0, 1], [0, 0, 0, 0, 1])]:
+            for seed in range(20):
+                team1 = PokeTeam("A", numbers1, 0, PokeTeam.AI.ALWAYS_ATTACK)
+                team2 = PokeTeam("B", numbers2, 0, PokeTeam.AI.ALWAYS_ATTACK)
+                engine = BatchBattle([roster(team1)], [roster(team2)], [seed])
+                self.assertEqual(Battle(rng=RandomGen(seed)).battle(team1, team2), engine.run()[0])
+
+    def test_invalid(self):
+        """Test that rosters and seeds of different lengths raise ValueError"""
+        self.assertRaises(ValueError, lambda: BatchBattle([[0]], [[0], [1]], [1]))
+        self.assertRaises(ValueError, lambda: BatchBattle([[]], [[0]], [1]))
@@ -1,6 +1,9 @@
 """
 This file includes test cases added for testing methods in the battle class alongside the provided tests in the original template.
 """
+import contextlib
+import io
+
 from random_gen import RandomGen
 from battle import Battle
 from poke_team import Action, Criterion, PokeTeam
@@ -108,4 +111,33 @@ class TestBattleBattle(BaseTest):
         b = Battle(verbosity=0)
         res = b.battle(team1, team2)                                # team 1 battle with team 2 
         self.assertEqual(res, 0)
-        
+
+class TestBattleVerbosity(BaseTest):
+    """Test cases for the output produced at each verbosity level"""
+
+    def battle_output(self, verbosity):
+        """Battle two fixed teams at the given verbosity and return the result and everything printed"""
+        RandomGen.set_seed(1337)
+        team1 = PokeTeam("Ash", [1, 1, 1, 0, 0], 0, PokeTeam.AI.ALWAYS_ATTACK)
+        team2 = PokeTeam("Gary", [0, 0, 0, 0, 3], 0, PokeTeam.AI.ALWAYS_ATTACK)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            res = Battle(verbosity=verbosity).battle(team1, team2)
+        return res, out.getvalue()
+
+    def test_quiet(self):
+        """Test that verbosity 0 prints nothing"""
+        res, out = self.battle_output(Battle.QUIET)
+        self.assertEqual(res, 1)
+        self.assertEqual(out, "")
+
+    def test_log(self):
+        """Test that verbosity 1 prints the battle log but not the game screen, with the same result"""
+        res, out = self.battle_output(Battle.LOG)
+        self.assertEqual(res, 1)
+        self.assertIn("TEAM 1 WINS!", out)
+        self.assertNotIn("HP |", out)
+
+    def test_invalid_verbosity(self):
+        """Test that invalid verbosity raises ValueError"""
+        self.assertRaises(ValueError, lambda: Battle(verbosity=-1))
@@ -0,0 +1,90 @@
+"""
+This file includes test cases for the opt-in cache of battle results.
+"""
+import os
+import tempfile
+
+from battle import Battle
+from battle_cache import BattleCache, CachedBattle
+from poke_team import Criterion, PokeTeam, TeamSpec
+from random_gen import RandomGen
+from tests.base_test import BaseTest
+
+
+class TestBattleCache(BaseTest):
+
+    SPEC_A = TeamSpec.of([1, 1, 1, 0, 0], 0, PokeTeam.AI.RANDOM)
+    SPEC_B = TeamSpec.of([0, 1, 1, 1, 1], 2, PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE, Criterion.HP)
+
+    def play(self, battle: Battle, n: int) -> list:
+        """ Results and rounds of n battles between fresh teams of SPEC_A and SPEC_B, then the next draw of the stream """
+        RandomGen.set_seed(77)
+        team1 = PokeTeam.from_spec("A", self.SPEC_A)
+        team2 = PokeTeam.from_spec("B", self.SPEC_B)
+        outcomes = []
+        for _ in range(n):
+            outcomes.append((battle.battle(team1, team2, regenerate=True), battle.rounds, str(team1), str(team2), team1.fresh, team2.fresh))
+        return outcomes + [RandomGen.random()]
+
+    def test_hits(self):
+        """Test that cached battles give the same results, hand back the teams as the battles do and leave the random stream where they do"""
+        expected = self.play(Battle(), 20)
+        cache = BattleCache()
+        self.assertEqual(self.play(Battle(cache=cache), 20), expected)
+        self.assertEqual((cache.hits, cache.misses), (0, 20))
+        self.assertEqual(self.play(Battle(cache=cache), 20), expected)
+        self.assertEqual((cache.hits, cache.misses), (20, 20))
+
+    def test_not_cached(self):
+        """Test that battles between teams which are not fresh or not regenerated after, or with the USER_INPUT AI, skip the cache"""
+        cache = BattleCache()
+        b = Battle(cache=cache)
+        team1 = PokeTeam.from_spec("A", self.SPEC_A)
+        team1.special()
+        b.battle(team1, PokeTeam.from_spec("B", self.SPEC_B), regenerate=True)
+        b.battle(PokeTeam.from_spec("A", self.SPEC_A), PokeTeam.from_spec("B", self.SPEC_B))
+        team3 = PokeTeam("C", [1, 0, 0, 0, 0], 0, PokeTeam.AI.USER_INPUT)
+        self.assertIsNone(b.cache_key(team3, PokeTeam.from_spec("B", self.SPEC_B)))
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_lru(self):
+        """Test that the least recently used entry is evicted beyond capacity"""
+        cache = BattleCache(capacity=2)
+        cache.put("a", CachedBattle(1, 3, 10))
+        cache.put("b", CachedBattle(2, 4, 11))
+        cache.get("a")
+        cache.put("c", CachedBattle(0, 5, 12))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), CachedBattle(1, 3, 10))
+        self.assertEqual(len(cache), 2)
+        self.assertRaises(ValueError, lambda: BattleCache(capacity=0))
+
+    def test_file(self):
+        """Test that entries are read back from the file, skipping a line cut short"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "battles.jsonl")
+            expected = self.play(Battle(cache=BattleCache(path=path)), 5)
+            with open(path, "a") as file:
+                file.write('[[1, 1')
+            cache = BattleCache(path=path)
+            self.assertEqual(len(cache), 5)
+            self.assertEqual(self.play(Battle(cache=cache), 5), expected)
+            self.assertEqual(cache.hits, 5)
+
+    def test_teams_after_battle(self):
+        """Test that a battle found in the cache leaves its teams as the battle played leaves them, and other battles leave theirs played"""
+        cache = BattleCache()
+        b = Battle(cache=cache)
+        for _ in range(2):
+            RandomGen.set_seed(5)
+            team1, team2 = PokeTeam.from_spec("A", self.SPEC_A), PokeTeam.from_spec("B", self.SPEC_B)
+            b.battle(team1, team2, regenerate=True)
+            self.assertEqual((str(team1), str(team2)), (str(PokeTeam.from_spec("A", self.SPEC_A)), str(PokeTeam.from_spec("B", self.SPEC_B))))
+            self.assertTrue(team1.fresh and team2.fresh)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        RandomGen.set_seed(5)
+        team1, team2 = PokeTeam.from_spec("A", self.SPEC_A), PokeTeam.from_spec("B", self.SPEC_B)
+        b.battle(team1, team2)
+        self.assertFalse(team1.fresh or team2.fresh)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
@@ -0,0 +1,83 @@
+"""
+This file includes test cases for the battle event stream and its sinks.
+"""
+import contextlib
+import io
+
+from random_gen import RandomGen
+from battle import Battle
+from battle_events import EventLog, ConsoleLog, PokeState, BattleStart, BattleEnd, Choices, Attack, Faint, LevelUp
+from poke_team import PokeTeam
+from pokemon import Charmander
+from tests.base_test import BaseTest
+
+
+class TestBattleEvents(BaseTest):
+    """Test cases for events emitted by Battle"""
+
+    def battle_events(self, *sinks):
+        """Battle two fixed teams with the given sinks subscribed and return the result"""
+        RandomGen.set_seed(1337)
+        team1 = PokeTeam("Ash", [1, 1, 1, 0, 0], 0, PokeTeam.AI.ALWAYS_ATTACK)
+        team2 = PokeTeam("Gary", [0, 0, 0, 0, 3], 0, PokeTeam.AI.ALWAYS_ATTACK)
+        b = Battle(verbosity=0)
+        for sink in sinks:
+            b.subscribe(sink)
+        return b.battle(team1, team2), b
+
+    def test_event_log(self):
+        """Test that an EventLog receives the whole battle from BattleStart to BattleEnd"""
+        log = EventLog()
+        res, b = self.battle_events(log)
+        self.assertEqual(res, 1)
+        self.assertEqual(log[0], BattleStart("Ash", "Gary"))
+        self.assertEqual(log[-1], BattleEnd(1, b.rounds))
+        choices = [e for e in log if isinstance(e, Choices)]
+        self.assertEqual([e.round for e in choices], list(range(1, b.rounds + 1)))
+        self.assertTrue(any(isinstance(e, Attack) for e in log))
+        self.assertEqual(sum(isinstance(e, Faint) for e in log), 4)
+        for e in log:
+            if isinstance(e, LevelUp):
+                self.assertEqual(e.new.level, e.old.level + 1)
+
+    def test_no_sink(self):
+        """Test that the result is the same whether or not events are emitted"""
+        res, b = self.battle_events()
+        self.assertIsNone(b.sink)
+        log = EventLog()
+        self.assertEqual(self.battle_events(log)[0], res)
+
+    def test_several_sinks(self):
+        """Test that every subscribed sink gets every event, and unsubscribed sinks get none"""
+        log1, log2 = EventLog(), EventLog()
+        self.battle_events(log1, log2)
+        self.assertEqual(log1, log2)
+        b = Battle()
+        b.subscribe(log1)
+        b.unsubscribe(log1)
+        self.assertIsNone(b.sink)
+
+    def test_console_log(self):
+        """Test that ConsoleLog formats events like the original battle log"""
+        lines = []
+        sink = ConsoleLog(lines.append)
+        poke = Charmander()
+        sink(Faint(poke.get_poke_name()))
+        sink(LevelUp(PokeState.of(poke), PokeState(poke.poke_name, 2, 9)))
+        sink(BattleStart("Ash", "Gary"))
+        self.assertEqual(lines, ["Charmander is fainted!", "LV. 1 Charmander: 9 HP levels up to LV. 2 Charmander: 9 HP !"])
+
+    def test_console_log_battle(self):
+        """Test that a ConsoleLog sink prints the same log as verbosity 1"""
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.battle_events(ConsoleLog())
+        log1 = out.getvalue()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            RandomGen.set_seed(1337)
+            team1 = PokeTeam("Ash", [1, 1, 1, 0, 0], 0, PokeTeam.AI.ALWAYS_ATTACK)
+            team2 = PokeTeam("Gary", [0, 0, 0, 0, 3], 0, PokeTeam.AI.ALWAYS_ATTACK)
+            Battle(verbosity=Battle.LOG).battle(team1, team2)
+        self.assertEqual(log1, out.getvalue())
+        self.assertTrue(log1.endswith("TEAM 1 WINS!\n"))
@@ -0,0 +1,53 @@
+"""
+This file includes test cases for the CircularDeque in deque_adt.py.
+"""
+from deque_adt import CircularDeque
+from tests.base_test import BaseTest
+
+
+class TestCircularDeque(BaseTest):
+
+    def items(self, deque: CircularDeque) -> list:
+        """ Elements of deque from front to rear, leaving it unchanged """
+        items = []
+        for _ in range(len(deque)):
+            item = deque.serve()
+            items.append(item)
+            deque.append(item)
+        return items
+
+    def test_both_ends(self):
+        """Test adding and removing elements at both ends, wrapping around the array"""
+        d = CircularDeque(4)
+        d.append(1)
+        d.push_front(0)
+        d.append(2)
+        d.push_front(-1)
+        self.assertTrue(d.is_full())
+        self.assertRaises(Exception, lambda: d.push_front(5))
+        self.assertEqual((d.peek_front(), d.peek_back()), (-1, 2))
+        self.assertEqual(self.items(d), [-1, 0, 1, 2])
+        self.assertEqual(d.pop_back(), 2)
+        self.assertEqual(d.serve(), -1)
+        self.assertEqual(d.pop_back(), 1)
+        self.assertEqual(d.pop_back(), 0)
+        self.assertTrue(d.is_empty())
+        self.assertRaises(Exception, d.pop_back)
+        self.assertRaises(Exception, d.peek_front)
+
+    def test_rotate(self):
+        """Test rotating full and partly filled deques in both directions"""
+        for capacity in (5, 8):
+            d = CircularDeque(capacity)
+            for i in range(5):
+                d.append(i)
+            d.rotate(2)
+            self.assertEqual(self.items(d), [2, 3, 4, 0, 1])
+            d.rotate(-1)
+            self.assertEqual(self.items(d), [1, 2, 3, 4, 0])
+            d.rotate(9)
+            self.assertEqual(self.items(d), [0, 1, 2, 3, 4])
+            self.assertEqual((d.peek_front(), d.peek_back()), (0, 4))
+        empty = CircularDeque(3)
+        empty.rotate(2)
+        self.assertTrue(empty.is_empty())
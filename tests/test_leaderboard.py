@@ -0,0 +1,45 @@
+"""
+This file includes test cases for the leaderboard and the merging of its parallel chunks.
+"""
+from random_gen import RandomGen
+from leaderboard import leaderboard, summarise, merge
+from poke_team import Criterion, PokeTeam
+from tests.base_test import BaseTest
+
+
+class TestLeaderboard(BaseTest):
+
+    def serial_stats(self, results):
+        """Win, loss, draw counts and longest streak computed battle by battle as the original leaderboard did"""
+        won = loss = draw = streak = max_streak = 0
+        for res in results:
+            if res == 0:
+                draw += 1
+            elif res == 1:
+                won += 1
+                streak += 1
+                max_streak = max(max_streak, streak)
+            else:
+                loss += 1
+                streak = 0
+        return (won, loss, draw, max_streak)
+
+    def test_merge(self):
+        """Test that merging the summaries of any split of the results gives the same statistics"""
+        RandomGen.set_seed(99)
+        for _ in range(200):
+            results = [RandomGen.randint(0, 2) if RandomGen.random_chance(0.5) else 1 for _ in range(RandomGen.randint(0, 30))]
+            cuts = sorted(RandomGen.randint(0, len(results)) for _ in range(RandomGen.randint(0, 4)))
+            chunks = [results[i:j] for i, j in zip([0] + cuts, cuts + [len(results)])]
+            self.assertEqual(merge([summarise(chunk) for chunk in chunks]), self.serial_stats(results))
+
+    def test_processes(self):
+        """Test that the leaderboard gives the same results serially and in parallel"""
+        team = PokeTeam("Leader", [1, 1, 1, 1, 2], 2, PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE, criterion=Criterion.DEF)
+        serial = leaderboard(team)
+        self.assertEqual(len(serial), 4)
+        self.assertEqual(leaderboard(team, processes=3), serial)
+
+    def test_invalid_processes(self):
+        """Test that invalid number of processes raises ValueError"""
+        self.assertRaises(ValueError, lambda: leaderboard(processes=0))
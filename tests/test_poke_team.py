@@ -5,8 +5,11 @@ Methods to be tested: __init__, random_team, return_pokemon, retrieve_pokemon, s
 """
 __author__ = "Scaffold by Jackson Goerner, Code by Khor Jia Wynn"
 
+from unittest import mock
+
+import poke_team
 from battle import Battle
-from poke_team import Action, BM2SortedList, Criterion, PokeTeam
+from poke_team import Action, BM2SortedList, Criterion, PokeTeam, TeamPool, TeamSpec
 from queue_adt import CircularQueue
 from random_gen import RandomGen
 from pokemon import Bulbasaur, Charmander, Gastly, Squirtle, Eevee
@@ -179,7 +182,14 @@ class TestRandomTeam(BaseTest):
         expected_classes = [Bulbasaur, Squirtle, Eevee, Eevee, Eevee, Gastly]
         self.assertEqual(len(pokemon), len(expected_classes))
         for p, e in zip(pokemon, expected_classes):
-            self.assertIsInstance(p, e)   
+            self.assertIsInstance(p, e)
+
+    def test_initial_criterion(self):
+        """Test that the criterion values from the registry are those of the new pokemon"""
+        for criterion in Criterion:
+            t = PokeTeam("Jen", [1, 1, 1, 1, 1], 2, PokeTeam.AI.ALWAYS_ATTACK, criterion=criterion)
+            for item in t.pokeTeamMembers:
+                self.assertEqual(item.key, t.get_criterion(item.value))   
 
 class TestRetrievePokemon(BaseTest):
     """Test retrieving from empty team, bm1 and bm2"""
@@ -222,7 +232,7 @@ class TestReturnPokemon(BaseTest):
         t = PokeTeam.random_team("Jane", 1, 6, PokeTeam.AI.RANDOM)
         p = t.retrieve_pokemon()
         before = str(t)
-        p.is_fainted = True
+        p.lose_hp(p.get_hp())
         after = str(t)
         self.assertEqual(before, after)
 
@@ -250,6 +260,16 @@ class TestReturnPokemon(BaseTest):
         after = "Jane (2): [LV. 1 Eevee: 10 HP, LV. 1 Charmander: 9 HP, LV. 1 Bulbasaur: 9 HP, LV. 1 Gastly: 6 HP]"
         self.assertEqual(str(t), after)
 
+    def test_return_bm0(self):
+        """Test damaged pokemon returned to the front of the team in battle mode 0, and special after returning"""
+        t = PokeTeam("Jane", [1, 1, 1, 1, 1], 0, PokeTeam.AI.ALWAYS_ATTACK)
+        p = t.retrieve_pokemon()
+        p.lose_hp(4)
+        t.return_pokemon(p)
+        self.assertEqual(str(t), "Jane (0): [LV. 1 Charmander: 5 HP, LV. 1 Bulbasaur: 13 HP, LV. 1 Squirtle: 11 HP, LV. 1 Gastly: 6 HP, LV. 1 Eevee: 10 HP]")
+        t.special()
+        self.assertEqual(str(t), "Jane (0): [LV. 1 Eevee: 10 HP, LV. 1 Bulbasaur: 13 HP, LV. 1 Squirtle: 11 HP, LV. 1 Gastly: 6 HP, LV. 1 Charmander: 5 HP]")
+
 class TestSpecial(BaseTest):
     """Test the 3 special modes"""
 
@@ -318,6 +338,38 @@ class TestSpecial(BaseTest):
         after = str(t)
         self.assertEqual(after, "Jane (2): [LV. 1 Gastly: 6 HP, LV. 1 Eevee: 9 HP, LV. 1 Bulbasaur: 9 HP, LV. 1 Charmander: 9 HP]")
 
+    def test_special_2_ties(self):
+        """Test that pokemon of the same species with the same criterion keep the places the sorted team has always given them"""
+        t = PokeTeam("Jane", [3, 0, 0, 0, 1], 2, PokeTeam.AI.ALWAYS_ATTACK, criterion=Criterion.LV)
+        self.assertEqual([(item.value.get_poke_name(), item.value.instance) for item in t.pokeTeamMembers],
+                         [("Charmander", 2), ("Charmander", 1), ("Charmander", 0), ("Eevee", 0)])
+        p = t.retrieve_pokemon()
+        p.lose_hp(1)
+        t.return_pokemon(p)
+        self.assertEqual(str(t), "Jane (2): [LV. 1 Charmander: 9 HP, LV. 1 Charmander: 8 HP, LV. 1 Charmander: 9 HP, LV. 1 Eevee: 10 HP]")
+        self.assertEqual([item.value.instance for item in t.pokeTeamMembers], [1, 2, 0, 0])
+        t.special()
+        self.assertEqual(str(t), "Jane (2): [LV. 1 Eevee: 10 HP, LV. 1 Charmander: 9 HP, LV. 1 Charmander: 8 HP, LV. 1 Charmander: 9 HP]")
+        self.assertEqual([item.value.instance for item in t.pokeTeamMembers], [0, 0, 2, 1])
+        self.assertEqual(t.retrieve_pokemon().get_poke_name(), "Eevee")
+
+    def test_add_by_pokedex(self):
+        """Test that adding to a team with its ties broken gives the team of adding it and breaking the ties again"""
+        pokemon = [Charmander(), Bulbasaur(), Eevee(), Charmander(), Squirtle(), Gastly()]
+        keys = [9, 9, 10, 9, 6, 9]
+        for order in range(2):
+            for n in range(len(pokemon)):
+                by_pokedex = BM2SortedList(1, order)
+                broken = BM2SortedList(1, order)
+                for poke, key in zip(pokemon[:n + 1], keys):
+                    by_pokedex.add_by_pokedex(ListItem(poke, key))
+                    broken.add(ListItem(poke, key))
+                    broken.break_ties()
+                self.assertEqual([item.value for item in by_pokedex], [item.value for item in broken])
+                self.assertEqual(by_pokedex.serve().value, broken[0].value)
+                self.assertIn(broken[0], broken)
+                self.assertEqual(broken.index(broken[len(broken) - 1]), len(broken) - 1)
+
 class TestRegenerate(BaseTest):
     """Test regeneration for different team states"""
 
@@ -359,6 +411,96 @@ class TestRegenerate(BaseTest):
         self.assertEqual(before, after)
 
 
+    def test_template(self):
+        """Test that regenerating restores the pokemon created with the team in place, in their initial order"""
+        for battle_mode in range(3):
+            t = PokeTeam("John", [2, 0, 1, 0, 1], battle_mode, PokeTeam.AI.ALWAYS_ATTACK, criterion=Criterion.HP)
+            before = str(t)
+            roster = set(map(id, t.roster))
+            p = t.retrieve_pokemon()
+            p.lose_hp(3)
+            p.level_up()
+            p.status = "burn"
+            t.return_pokemon(p)
+            t.special()
+            t.regenerate_team()
+            self.assertEqual(str(t), before)
+            self.assertEqual(set(id(t.retrieve_pokemon()) for _ in range(4)), roster)
+            self.assertEqual((p.get_level(), p.get_hp(), p.status), (1, p.SPECIES.hp, "free"))
+
+
+class TestTeamSpec(BaseTest):
+    """Tests for interned team specs and teams materialised from them"""
+
+    def test_interned(self):
+        """Test that equal specs are the same object, and that the criterion is dropped outside battle mode 2"""
+        spec = TeamSpec.of([1, 0, 2, 0, 1], 2, PokeTeam.AI.RANDOM, Criterion.HP)
+        self.assertIs(TeamSpec.of((1, 0, 2, 0, 1), 2, PokeTeam.AI.RANDOM, Criterion.HP), spec)
+        self.assertIs(TeamSpec.of([1, 0, 2, 0, 1], 0, None, Criterion.HP), TeamSpec.of([1, 0, 2, 0, 1], 0))
+        t = PokeTeam("Jen", [1, 0, 2, 0, 1], 2, PokeTeam.AI.RANDOM, criterion=Criterion.HP)
+        self.assertIs(t.spec(), spec)
+
+    def test_random_spec(self):
+        """Test that random_spec draws the same team as random_team"""
+        for battle_mode in range(3):
+            RandomGen.set_seed(123456789)
+            t = PokeTeam.random_team("Jen", battle_mode, criterion=Criterion.HP)
+            RandomGen.set_seed(123456789)
+            spec = PokeTeam.random_spec(battle_mode, criterion=Criterion.HP)
+            self.assertIs(spec, t.spec())
+            self.assertEqual(str(PokeTeam.from_spec("Jen", spec)), str(t))
+
+    def test_release(self):
+        """Test that a released team is reused by from_spec with the same pool, in the state of a new team"""
+        spec = TeamSpec.of([2, 1, 0, 1, 1], 2, PokeTeam.AI.ALWAYS_ATTACK, Criterion.SPD)
+        pool = TeamPool()
+        t = PokeTeam.from_spec("A", spec, pool)
+        before = str(t)
+        p = t.retrieve_pokemon()
+        p.lose_hp(2)
+        t.return_pokemon(p)
+        t.special()
+        t.release(pool)
+        self.assertIsNot(PokeTeam.from_spec("A", spec), t)
+        self.assertIsNot(PokeTeam.from_spec("A", spec, TeamPool()), t)
+        reused = PokeTeam.from_spec("A", spec, pool)
+        self.assertIs(reused, t)
+        self.assertEqual(str(reused), before)
+        self.assertIsNot(PokeTeam.from_spec("B", spec, pool), t)
+
+    def test_release_twice(self):
+        """Test that a team cannot be released twice, so from_spec never hands it out to two callers"""
+        spec = TeamSpec.of([1, 0, 2, 0, 1], 0, PokeTeam.AI.RANDOM)
+        pool = TeamPool()
+        t = PokeTeam.from_spec("A", spec, pool)
+        t.release(pool)
+        self.assertRaises(ValueError, t.release, pool)
+        self.assertEqual(len(pool), 1)
+        self.assertIs(PokeTeam.from_spec("A", spec, pool), t)
+        self.assertIsNot(PokeTeam.from_spec("B", spec, pool), t)
+        t.release(pool)
+        self.assertRaises(ValueError, PokeTeam.from_spec("C", spec).release, None)
+
+    def test_release_bounded(self):
+        """Test that a pool keeps at most max_teams teams of a spec of at most max_specs specs, and that specs beyond MAX_INTERNED_SPECS are not interned"""
+        spec = TeamSpec.of([0, 3, 0, 1, 0], 1, PokeTeam.AI.ALWAYS_ATTACK)
+        pool = TeamPool(max_specs=1, max_teams=2)
+        for t in [PokeTeam.from_spec(str(x), spec, pool) for x in range(5)]:
+            t.release(pool)
+        self.assertEqual(len(pool), 2)
+        other = TeamSpec.of([0, 0, 0, 5, 1], 1, PokeTeam.AI.RANDOM)
+        PokeTeam.from_spec("A", other, pool).release(pool)
+        self.assertEqual(len(pool), 2)
+        self.assertIsNone(pool.take(other))
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+        self.assertRaises(ValueError, TeamPool, max_teams=0)
+        with mock.patch.object(poke_team, "MAX_INTERNED_SPECS", len(poke_team.INTERNED_SPECS)):
+            new = TeamSpec.of([0, 0, 0, 4, 2], 1, PokeTeam.AI.RANDOM)
+            self.assertEqual(TeamSpec.of([0, 0, 0, 4, 2], 1, PokeTeam.AI.RANDOM), new)
+            self.assertNotIn(new, poke_team.INTERNED_SPECS)
+
+
 class TestString(BaseTest):
     """Tests the 3 battle modes"""
 
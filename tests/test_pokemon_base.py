@@ -6,8 +6,8 @@
 """
 
 from random_gen import RandomGen
-from pokemon_base import PokemonBase, PokeType
-from pokemon import Eevee, Gastly, Haunter
+from pokemon_base import PokemonBase, PokeType, TYPE_ID, TYPE_EFFECTIVENESS, TYPE_EFFECTIVENESS_FLAT, effectiveness, Status, STATUS_NAME, STATUS_EFFECTS
+from pokemon import Charmander, Charizard, Eevee, Gastly, Haunter
 from tests.base_test import BaseTest
 
 class TestPokemonBase(BaseTest):
@@ -50,3 +50,63 @@ class TestPokemonBase(BaseTest):
         self.assertEqual(g.should_evolve(), True)
         new_g = g.get_evolved_version()
         self.assertIsInstance(new_g, Haunter)
+
+class TestTypeEffectiveness(BaseTest):
+    """Test cases for the precomputed type effectiveness table"""
+    def test_table(self):
+        """Test that effectiveness, the flat table and type_multiplier agree"""
+        self.assertEqual(sorted(TYPE_ID.values()), list(range(len(PokeType))))
+        self.assertEqual(effectiveness(PokeType.FIRE, PokeType.GRASS), 2)
+        self.assertEqual(effectiveness(PokeType.GHOST, PokeType.NORMAL), 0)
+        self.assertEqual(effectiveness(PokeType.NORMAL, PokeType.WATER), 1.25)
+        for attacker in PokeType:
+            for defender in PokeType:
+                i, j = TYPE_ID[attacker], TYPE_ID[defender]
+                self.assertEqual(TYPE_EFFECTIVENESS_FLAT[i * len(PokeType) + j], TYPE_EFFECTIVENESS[i][j])
+
+    def test_type_id(self):
+        """Test that the type id is cached on the pokemon and follows changes of its type"""
+        c = Charmander()
+        e = Eevee()
+        self.assertEqual(c.type_id, TYPE_ID[PokeType.FIRE])
+        self.assertEqual(c.type_multiplier(e), effectiveness(PokeType.FIRE, PokeType.NORMAL))
+        c.poke_type = PokeType.GHOST
+        self.assertEqual(c.type_id, TYPE_ID[PokeType.GHOST])
+        self.assertEqual(c.type_multiplier(e), 0)
+
+class TestStatus(BaseTest):
+    """Class containing test cases for the status codes of pokemon"""
+    def test_of(self):
+        """Test case for getting status codes by code, by name and from None"""
+        for code, name in enumerate(STATUS_NAME):
+            self.assertEqual(Status.of(name), code)
+            self.assertEqual(Status.of(code), code)
+            self.assertIs(Status.of(name), Status(code))
+        self.assertEqual(Status.of(None), Status.FREE)
+        self.assertEqual(len(STATUS_EFFECTS), len(Status))
+        self.assertRaises(ValueError, lambda: Status.of("frozen"))
+        self.assertRaises(ValueError, lambda: Status.of([]))
+
+    def test_status_property(self):
+        """Test case for setting the status of a pokemon by name and by code"""
+        e = Eevee()
+        self.assertEqual(e.status, "free")
+        e.status = "sleep"
+        self.assertEqual(e.status_code, Status.SLEEP)
+        e.status_code = Status.POISON
+        self.assertEqual(e.status, "poison")
+        e.heal()
+        self.assertEqual(e.status, "free")
+        self.assertEqual(Charizard().status, "free")     # no status given
+        self.assertRaises(ValueError, lambda: setattr(e, "status", "frozen"))
+
+    def test_effects(self):
+        """Test case for the effects of burn and poison on the attacker"""
+        c, e = Charmander(), Eevee()
+        c.status_code = Status.BURN
+        c.attack(e)
+        self.assertEqual(c.get_hp(), 8)                  # burn costs 1 hp
+        self.assertEqual(e.get_hp(), 10)                 # halved damage int(7 * 0.5 * 1.25) is below the defence of e
+        c.status = "poison"
+        c.attack(e)
+        self.assertEqual(c.get_hp(), 5)                  # poison costs 3 hp
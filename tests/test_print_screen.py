@@ -0,0 +1,51 @@
+"""
+This file includes test cases for the rendering of the game screen.
+"""
+import builtins
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+import print_screen
+from print_screen import CLEAR, POKEMON_COLORS, load_sprite, render_game_screen, template_window
+from tests.base_test import BaseTest
+
+
+class TestPrintScreen(BaseTest):
+
+    ARGS = ("Gengar", "Eevee", 10, 20, 20, 60, 3, 5, "sleep", "burn", 1, 1)
+
+    def test_frame(self):
+        """Test that a frame has the size of the template and holds both sprites in their colours"""
+        lines = render_game_screen(*self.ARGS).split("\n")
+        self.assertEqual(len(lines), len(template_window()))
+        self.assertIn("GENGAR", lines[21])
+        self.assertIn("EEVEE", lines[6])
+        sprite = load_sprite("eevee", False)
+        self.assertIn(POKEMON_COLORS["eevee"] + sprite[-1][0], lines[16])
+        self.assertTrue(all(line.count(POKEMON_COLORS["gengar"]) <= line.count(CLEAR) for line in lines))
+
+    def test_no_file_read_after_warm_up(self):
+        """Test that the sprites are read once, whatever the working directory, and frames are unchanged afterwards"""
+        print_screen.SPRITES.clear()
+        print_screen.OVERLAYS.clear()
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                expected = render_game_screen(*self.ARGS)
+            finally:
+                os.chdir(cwd)
+        with mock.patch.object(builtins, "open", side_effect=AssertionError("sprite read again")):
+            self.assertEqual(render_game_screen(*self.ARGS), expected)
+        self.assertEqual(set(print_screen.SPRITES), {("gengar", True), ("eevee", False)})
+
+    def test_lazy_import(self):
+        """Test that importing the game modules neither loads the screen nor runs a command"""
+        probe = "import sys, os; os.system = None; import battle, tournament, tower; " \
+                "print(sorted(m for m in ('print_screen', 'screen_renderer', 'unittest') if m in sys.modules))"
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True, env=env).stdout
+        self.assertEqual(out.strip(), "[]")
@@ -0,0 +1,113 @@
+"""
+This file includes test cases for the default and per-instance streams of RandomGen.
+"""
+import os
+import pickle
+import subprocess
+import sys
+from unittest import mock
+
+from random_gen import RandomGen
+from battle import Battle
+from poke_team import Criterion, PokeTeam
+from tests.base_test import BaseTest
+
+
+class TestRandomGen(BaseTest):
+
+    def test_instance_matches_default_stream(self):
+        """Test that an instance gives the same outputs as the default stream with the same seed, without touching it"""
+        RandomGen.set_seed(123)
+        expected = [RandomGen.random() for _ in range(20)]
+        RandomGen.set_seed(5)
+        rng = RandomGen(123)
+        self.assertEqual([rng.random() for _ in range(20)], expected)
+        self.assertEqual(RandomGen.seed, 5)
+        self.assertEqual(rng.randint(3, 3), 3)
+        self.assertIsInstance(rng.random_chance(0.5), bool)
+
+    def test_jump(self):
+        """Test that jump(n) is the same as n calls to random, on instances and on the default stream"""
+        for n in [0, 1, 2, 7, 100, 1023]:
+            rng = RandomGen(42)
+            for _ in range(n):
+                rng.random()
+            RandomGen.set_seed(42)
+            RandomGen.jump(n)
+            self.assertEqual(RandomGen.seed % RandomGen.MOD, rng.seed % RandomGen.MOD)
+            jumped = RandomGen(42)
+            jumped.jump(n)
+            self.assertEqual(jumped.random(), rng.random())
+        # a full period comes back to the start
+        rng = RandomGen(42)
+        rng.jump(RandomGen.MOD)
+        self.assertEqual(rng.seed, 42)
+
+    def test_spawn(self):
+        """Test that spawned streams start stride outputs apart and leave the parent stream unchanged"""
+        rng = RandomGen(7)
+        streams = rng.spawn(3, stride=10)
+        self.assertEqual(rng.seed, 7)
+        outputs = [rng.random() for _ in range(40)]
+        for i, stream in enumerate(streams):
+            self.assertEqual([stream.random() for _ in range(10)], outputs[10 * (i + 1):10 * (i + 2)])
+        self.assertEqual(rng.substream(0).seed, rng.seed)
+
+    def test_pickle(self):
+        """Test that a stream handed to another process through pickle carries on from its seed, on its own stream"""
+        rng = RandomGen(9)
+        rng.random()
+        copy = pickle.loads(pickle.dumps(rng))
+        RandomGen.set_seed(5)
+        self.assertEqual([copy.random() for _ in range(5)], [rng.random() for _ in range(5)])
+        self.assertEqual(RandomGen.seed, 5)
+
+    def test_battle_stream(self):
+        """Test that a battle with its own stream does not use the default stream and is reproducible"""
+        results = []
+        for _ in range(2):
+            RandomGen.set_seed(1)
+            team1 = PokeTeam.random_team("A", 2, ai_mode=PokeTeam.AI.RANDOM, rng=RandomGen(11), criterion=Criterion.HP)
+            team2 = PokeTeam.random_team("B", 0, ai_mode=PokeTeam.AI.RANDOM, rng=RandomGen(12))
+            results.append(Battle(rng=RandomGen(99)).battle(team1, team2))
+            self.assertEqual(RandomGen.seed, 1)
+        self.assertEqual(results[0], results[1])
+        self.assertRaises(ValueError, lambda: Battle(rng=123))
+
+    def test_random_block(self):
+        """Test that random_block returns the same outputs as sequential calls and advances the stream the same way"""
+        for k in [0, 1, 5, 64]:
+            rng = RandomGen(2 ** 60 + 9)
+            expected = [rng.random() for _ in range(k)]
+            block_rng = RandomGen(2 ** 60 + 9)
+            block = block_rng.random_block(k)
+            self.assertEqual(list(block), expected)
+            self.assertEqual(block_rng.random(), rng.random())
+        RandomGen.set_seed(3)
+        block = RandomGen.random_block(10)
+        RandomGen.set_seed(3)
+        self.assertEqual(list(block), [RandomGen.random() for _ in range(10)])
+
+    def test_random_block_numpy(self):
+        """Test that the numpy block is the same as the array block"""
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        for k in [0, 1, 3, 1000, 5]:
+            rng = RandomGen(77)
+            expected = rng.random_block(k)
+            block_rng = RandomGen(77)
+            block = block_rng.random_block(k, as_numpy=True)
+            self.assertEqual(block.dtype, numpy.uint32)
+            self.assertEqual(block.tolist(), list(expected))
+            self.assertEqual(block_rng.seed, rng.seed)
+
+    def test_numpy_not_imported(self):
+        """Test that importing the game modules does not load numpy, and that the numpy block says when it is missing"""
+        probe = "import sys; import battle, poke_team, tournament, tower; print('numpy' in sys.modules)"
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True, env=env).stdout
+        self.assertEqual(out.strip(), "False")
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            self.assertRaisesRegex(ImportError, "require numpy", lambda: RandomGen(1).random_block(3, as_numpy=True))
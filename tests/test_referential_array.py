@@ -0,0 +1,55 @@
+"""
+This file includes test cases for the backends of ArrayR and the ADTs built on them.
+"""
+from unittest import mock
+
+import array_sorted_list
+import queue_adt
+import stack_adt
+from array_sorted_list import ArraySortedList
+from deque_adt import CircularDeque
+from queue_adt import CircularQueue
+from referential_array import BACKENDS
+from sorted_list import ListItem
+from stack_adt import ArrayStack
+from tests.base_test import BaseTest
+
+
+class TestReferentialArray(BaseTest):
+
+    def test_interface(self):
+        """Test that every backend holds None at first, keeps what is set and checks the length and indices"""
+        for name, backend in BACKENDS.items():
+            with self.subTest(backend=name):
+                a = backend(3)
+                self.assertEqual((len(a), a[0], a[2]), (3, None, None))
+                a[1] = "x"
+                self.assertEqual(a[1], "x")
+                self.assertRaises(IndexError, lambda: a[3])
+                self.assertRaises(ValueError, lambda: backend(0))
+
+    def run_adts(self) -> list:
+        """ Contents of every ADT built on ArrayR after the same operations """
+        stack, queue, deque = ArrayStack(6), CircularQueue(6), CircularDeque(3)
+        sorted_list = ArraySortedList(1)
+        out = []
+        for x in [5, 3, 9, 1, 7, 3]:
+            stack.push(x)
+            queue.append(x)
+            deque.push_front(x) if x % 2 else deque.append(x)
+            if deque.is_full():
+                out.append(deque.pop_back())
+            sorted_list.add(ListItem(x, x))
+        out += [stack.pop() for _ in range(len(stack))] + [queue.serve() for _ in range(len(queue))]
+        out += [sorted_list.delete_at_index(1).value] + [sorted_list[i].value for i in range(len(sorted_list))]
+        return out
+
+    def test_adts(self):
+        """Test that the ADTs behave the same on every backend"""
+        results = []
+        for backend in BACKENDS.values():
+            with mock.patch.object(stack_adt, "ArrayR", backend), mock.patch.object(queue_adt, "ArrayR", backend), \
+                 mock.patch.object(array_sorted_list, "ArrayR", backend):
+                results.append(self.run_adts())
+                self.assertIsInstance(ArrayStack(1).array, backend)
+        self.assertEqual(results[0], results[1])
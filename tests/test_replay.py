@@ -0,0 +1,89 @@
+"""
+This file includes test cases for the recordings of battles and their playback.
+"""
+import contextlib
+import io
+import json
+
+from battle import Battle
+from poke_team import Criterion, PokeTeam
+from random_gen import RandomGen
+from replay import BattleRecorder, Replay, read_varint, write_varint
+from tests.base_test import BaseTest
+
+
+class Screens:
+    """ Renderer keeping every game screen drawn """
+
+    def __init__(self) -> None:
+        self.screens = []
+
+    def draw(self, window, footer) -> None:
+        self.screens.append("\n".join(map("".join, window)))
+
+    def close(self) -> None:
+        pass
+
+
+class TestReplay(BaseTest):
+
+    def record(self, keyframe_interval: int, battles: int = 10) -> tuple:
+        """ Recorder and screens of seeded battles played at verbosity SCREEN """
+        RandomGen.set_seed(2022)
+        recorder = BattleRecorder(keyframe_interval)
+        screens = Screens()
+        b = Battle(verbosity=Battle.SCREEN, renderer=screens, recorder=recorder)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(battles):
+                team1 = PokeTeam.random_team("Ash", 2, ai_mode=PokeTeam.AI.RANDOM, criterion=Criterion.HP)
+                team2 = PokeTeam.random_team("Gary", 1, ai_mode=PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE)
+                b.battle(team1, team2)
+        return recorder, screens.screens
+
+    def test_frames(self):
+        """Test that the frames of the recordings are the screens printed by the battles, from any round"""
+        for keyframe_interval in (1, 4, 100):
+            recorder, screens = self.record(keyframe_interval)
+            replays = [Replay(data) for data in recorder.replays]
+            self.assertEqual(sum(map(len, replays)), len(screens))
+            frames = [replay.frame(index) for replay in replays for index in reversed(range(len(replay)))]
+            start = 0
+            for replay in replays:
+                self.assertEqual(frames[start:start + len(replay)][::-1], screens[start:start + len(replay)])
+                self.assertEqual(list(replay), [replay.turn(index) for index in range(len(replay))])
+                start += len(replay)
+
+    def test_recording(self):
+        """Test the header and size of a recording"""
+        recorder, _ = self.record(16, battles=1)
+        replay = Replay(recorder.replays[0])
+        self.assertEqual((replay.team1, replay.team2, replay.keyframe_interval), ("Ash", "Gary", 16))
+        self.assertIn(replay.result, (0, 1, 2))
+        self.assertLess(len(recorder.replays[0]), 20 * len(replay))
+        self.assertRaises(IndexError, lambda: replay.turn(len(replay)))
+        self.assertRaises(ValueError, lambda: Replay(b"nope"))
+        self.assertRaises(ValueError, lambda: BattleRecorder(0))
+
+    def test_asciicast(self):
+        """Test that the asciicast export has a header and a frame a round, then the result"""
+        recorder, _ = self.record(16, battles=1)
+        replay = Replay(recorder.replays[0])
+        stream = io.StringIO()
+        replay.to_asciicast(stream, delay=0.5)
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(lines[0]["version"], 2)
+        self.assertEqual(len(lines), len(replay) + 2)
+        self.assertEqual([line[0] for line in lines[1:]], [0.5 * index for index in range(len(replay) + 1)])
+        self.assertTrue(lines[1][2].startswith("\x1b[2J\x1b[H"))
+
+    def test_varint(self):
+        """Test that varints read back what was written"""
+        out = bytearray()
+        values = [0, 1, -1, 63, 64, -64, -65, 300, 2 ** 40]
+        for value in values:
+            write_varint(out, value)
+        pos, read = 0, []
+        for _ in values:
+            value, pos = read_varint(out, pos)
+            read.append(value)
+        self.assertEqual((read, pos), (values, len(out)))
@@ -0,0 +1,70 @@
+"""
+This file includes test cases for the SQLite store of battle results.
+"""
+import os
+import tempfile
+
+from battle import Battle
+from poke_team import Criterion, PokeTeam, TeamSpec
+from random_gen import RandomGen
+from result_store import ResultStore
+from tournament import Tournament
+from tests.base_test import BaseTest
+
+
+class TestResultStore(BaseTest):
+
+    SPEC_A = TeamSpec.of([1, 1, 1, 0, 0], 0, PokeTeam.AI.RANDOM)
+    SPEC_B = TeamSpec.of([0, 1, 1, 1, 1], 2, PokeTeam.AI.SWAP_ON_SUPER_EFFECTIVE, Criterion.HP)
+
+    def test_record_battles(self):
+        """Test that battles are recorded with their seed and counted from either side"""
+        store = ResultStore(batch_size=7)
+        b = Battle(store=store, metadata={"job": "test"})
+        RandomGen.set_seed(31)
+        seeds, results, rounds = [], [0, 0, 0], {}
+        for x in range(20):
+            team1, team2 = PokeTeam.from_spec("A", self.SPEC_A), PokeTeam.from_spec("B", self.SPEC_B)
+            if x % 2:
+                team1, team2 = team2, team1
+            seeds.append(RandomGen.seed)
+            res = b.battle(team1, team2)
+            results[0 if res == 0 else (1 if (res == 1) == (x % 2 == 0) else 2)] += 1
+            rounds[b.rounds] = rounds.get(b.rounds, 0) + 1
+        self.assertEqual(len(store), 20)
+
+        head_to_head = store.head_to_head(self.SPEC_A, self.SPEC_B)
+        self.assertEqual((head_to_head.draws, head_to_head.wins, head_to_head.losses), tuple(results))
+        self.assertEqual(head_to_head.rounds, dict(sorted(rounds.items())))
+        reverse = store.head_to_head(self.SPEC_B, self.SPEC_A)
+        self.assertEqual((reverse.wins, reverse.losses), (head_to_head.losses, head_to_head.wins))
+
+        stored = store.battles_with_seed(seeds[3])
+        self.assertEqual(len(stored), 1)
+        self.assertEqual((stored[0].team1, stored[0].team2), (self.SPEC_B, self.SPEC_A))
+        self.assertEqual(stored[0].metadata, {"team1": "B", "team2": "A", "job": "test"})
+        store.close()
+
+    def test_batches(self):
+        """Test that rows are inserted once a batch is full, and that queries see the pending rows"""
+        store = ResultStore(batch_size=3)
+        for seed in range(4):
+            store.record(self.SPEC_A, self.SPEC_B, seed, 1, 5)
+        self.assertEqual(len(store.pending), 1)
+        self.assertEqual(store.head_to_head(self.SPEC_A, self.SPEC_B).wins, 4)
+        self.assertEqual(store.pending, [])
+        self.assertRaises(ValueError, lambda: ResultStore(batch_size=0))
+
+    def test_file(self):
+        """Test that battles of a tournament survive in the database file"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "battles.db")
+            with ResultStore(path) as store:
+                t = Tournament(Battle(store=store))
+                t.set_battle_mode(0)
+                t.start_tournament("Roark Gardenia + Maylene Crasher_Wake + Fantina Byron + + + Candice Volkner + +")
+                played = 0
+                while t.advance_tournament() is not None:
+                    played += 1
+            with ResultStore(path) as store:
+                self.assertEqual(len(store), played)
@@ -0,0 +1,99 @@
+"""
+This file includes test cases for the full frame and diff renderers of the game screen.
+"""
+import contextlib
+import io
+import re
+
+from battle import Battle
+from poke_team import Criterion, PokeTeam
+from print_screen import render_game_window
+from random_gen import RandomGen
+from screen_renderer import DiffRenderer, FrameRenderer, terminal_renderer
+from tests.base_test import BaseTest
+
+TOKEN = re.compile("\x1b\\[([0-9;]*)([A-Za-z])|\x1b([78])|(\n)|(.)", re.S)
+
+
+def terminal(text: str, height: int) -> dict:
+    """ Cells (row, column) -> (colour codes, character) of a terminal of height rows after printing text """
+    cells, row, column, state, saved, top = {}, 0, 0, "", None, 0
+    for params, command, escape, newline, char in TOKEN.findall(text):
+        if char:
+            cells[row, column] = (state, char)
+            column += 1
+        elif newline:
+            row, column = (row + 1, 0) if row + 1 < height else (row, 0)
+            if row == height - 1 and top:
+                cells = {(r - 1 if r > top else r, c): v for (r, c), v in cells.items() if r != top}
+        elif escape:
+            if escape == "7":
+                saved = (row, column, state)
+            else:
+                row, column, state = saved
+        elif command == "m":
+            state = "" if params == "0" else state + f"\x1b[{params}m"
+        elif command == "H":
+            row, column = (int(x) - 1 for x in params.split(";"))
+        elif command == "J":
+            cells = {}
+        elif command == "K":
+            cells = {k: v for k, v in cells.items() if k[0] != row or k[1] < column}
+        elif command == "r":
+            top = int(params.split(";")[0]) - 1 if params else 0
+            row, column = 0, 0
+    return cells
+
+
+class TestScreenRenderer(BaseTest):
+
+    def frames(self, n: int) -> list:
+        """ n windows and footers of a battle between a pokemon losing hp and a new pokemon coming in """
+        frames = []
+        for x in range(n):
+            name = "Charmander" if x < n // 2 else "Eevee"
+            frames.append((render_game_window(name, "Gengar", 20 - x, 20, 60 - 7 * x, 60, 3, 5, "free" if x % 3 else "burn",
+                                              "confuse", 3, 6 - x // 2), [f"Team A: {x}", "Team B"]))
+        return frames
+
+    def test_diff_matches_full_frames(self):
+        """Test that the terminal shows every frame drawn by the diff renderer as if it was printed in full"""
+        height = 60
+        diff = DiffRenderer(io.StringIO(), height=height)
+        for x, (window, footer) in enumerate(self.frames(8)):
+            full = FrameRenderer(io.StringIO())
+            full.draw(window, footer)
+            expected = terminal(full.stream.getvalue(), height)
+            diff.draw(window, footer)
+            shown = terminal(diff.stream.getvalue(), height)
+            rows = len(window) + len(footer)
+            # a blank cell without colour looks like a cell never printed
+            self.assertEqual({k: v for k, v in shown.items() if k[0] < rows and v != ("", " ")},
+                             {k: v for k, v in expected.items() if v != ("", " ")})
+            if x:
+                self.assertLess(diff.bytes_written - written, full.bytes_written / 2)
+            written = diff.bytes_written
+
+    def test_fall_back(self):
+        """Test that a short terminal and a stream which is not a terminal get full frames"""
+        window, footer = self.frames(1)[0]
+        short = DiffRenderer(io.StringIO(), height=20)
+        short.draw(window, footer)
+        full = FrameRenderer(io.StringIO())
+        full.draw(window, footer)
+        self.assertEqual(short.stream.getvalue(), full.stream.getvalue())
+        self.assertIs(type(terminal_renderer(io.StringIO())), FrameRenderer)
+
+    def test_battle(self):
+        """Test that a battle draws with the renderer it is given, and gives the terminal back when it ends"""
+        stream = io.StringIO()
+        renderer = DiffRenderer(stream, height=60)
+        RandomGen.set_seed(4)
+        team1 = PokeTeam.random_team("A", 2, ai_mode=PokeTeam.AI.RANDOM, criterion=Criterion.HP)
+        team2 = PokeTeam.random_team("B", 1, ai_mode=PokeTeam.AI.RANDOM)
+        b = Battle(verbosity=Battle.SCREEN, renderer=renderer)
+        with contextlib.redirect_stdout(io.StringIO()):
+            b.battle(team1, team2)
+        self.assertTrue(stream.getvalue().startswith("\x1b[2J"))
+        self.assertTrue(stream.getvalue().endswith("\x1b[r\x1b[60;1H\n"))
+        self.assertIsNone(renderer.previous)
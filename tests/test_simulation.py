@@ -0,0 +1,63 @@
+"""
+This file includes test cases for the batch simulation API.
+"""
+from random_gen import RandomGen
+from battle import Battle
+from poke_team import Criterion, PokeTeam
+from simulation import simulate_many, simulate_batch, SimulationResult
+from tests.base_test import BaseTest
+
+
+class TestSimulation(BaseTest):
+
+    SPEC_A = ([1, 1, 1, 0, 0], 0, PokeTeam.AI.ALWAYS_ATTACK, None)
+    SPEC_B = ([0, 1, 1, 1, 1], 2, PokeTeam.AI.RANDOM, Criterion.HP)
+
+    def test_matches_battle_loop(self):
+        """Test that simulate_many gives the same results as battling and regenerating PokeTeams in a loop"""
+        RandomGen.set_seed(2022)
+        team1 = PokeTeam("A", *self.SPEC_A)
+        team2 = PokeTeam("B", *self.SPEC_B)
+        b = Battle()
+        results = [0, 0, 0]
+        rounds = {}
+        for _ in range(50):
+            results[b.battle(team1, team2)] += 1
+            rounds[b.rounds] = rounds.get(b.rounds, 0) + 1
+            team1.regenerate_team()
+            team2.regenerate_team()
+
+        res = simulate_many(self.SPEC_A, self.SPEC_B, 50, seed=2022)
+        self.assertEqual(res, SimulationResult(results[1], results[0], results[2], rounds))
+        self.assertEqual(res.battles, 50)
+        self.assertEqual(sum(res.rounds.values()), 50)
+
+    def test_seed(self):
+        """Test that the same seed gives the same results"""
+        self.assertEqual(simulate_many(self.SPEC_A, self.SPEC_B, 20, seed=1),
+                         simulate_many(self.SPEC_A, self.SPEC_B, 20, seed=1))
+        self.assertEqual(simulate_many(self.SPEC_A, self.SPEC_B, 0, seed=1), SimulationResult(0, 0, 0, {}))
+
+    def test_invalid(self):
+        """Test that invalid arguments raise ValueError"""
+        self.assertRaises(ValueError, lambda: simulate_many(self.SPEC_A, self.SPEC_B, -1))
+        self.assertRaises(ValueError, lambda: simulate_many(self.SPEC_A, ([1, 1, 1, 0, 0], 0), 1))
+        self.assertRaises(ValueError, lambda: simulate_many(self.SPEC_A, ([1, 1, 1, 0, 0], 2, None, None), 1))
+
+    def test_batch(self):
+        """Test that simulate_batch gives the same results as battles seeded with the same per-battle seeds"""
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        spec_a = ([1, 1, 1, 0, 0], 0, PokeTeam.AI.ALWAYS_ATTACK, None)
+        spec_b = ([0, 1, 1, 1, 1], 2, PokeTeam.AI.ALWAYS_ATTACK, Criterion.LV)
+        res = simulate_batch(spec_a, spec_b, 100, seed=3)
+        results = [0, 0, 0]
+        rounds = {}
+        for seed in RandomGen(3).random_block(100):
+            b = Battle(rng=RandomGen(seed))
+            results[b.battle(PokeTeam("A", *spec_a), PokeTeam("B", *spec_b))] += 1
+            rounds[b.rounds] = rounds.get(b.rounds, 0) + 1
+        self.assertEqual(res, SimulationResult(results[1], results[0], results[2], dict(sorted(rounds.items()))))
+        self.assertRaises(ValueError, lambda: simulate_batch(self.SPEC_A, self.SPEC_B, 10))
@@ -0,0 +1,50 @@
+"""
+This file includes test cases for the exact solver of ALWAYS_ATTACK matchups.
+"""
+from battle import Battle
+from poke_team import Criterion, PokeTeam
+from simulation import simulate_many
+from solver import MatchupSolver, solve_matchup
+from tests.base_test import BaseTest
+
+
+class TestSolver(BaseTest):
+
+    SPEC_A = ((0, 0, 0, 3, 3), 1, PokeTeam.AI.ALWAYS_ATTACK, None)
+    SPEC_B = ((3, 3, 0, 0, 0), 2, PokeTeam.AI.ALWAYS_ATTACK, Criterion.HP)
+
+    def test_deterministic(self):
+        """Test a matchup which no roll can change against the battle itself"""
+        spec_a = ((1, 1, 1, 1, 1), 0, PokeTeam.AI.ALWAYS_ATTACK, None)
+        spec_b = ((0, 2, 0, 2, 2), 1, PokeTeam.AI.ALWAYS_ATTACK, None)
+        b = Battle()
+        result = b.battle(PokeTeam("A", list(spec_a[0]), *spec_a[1:]), PokeTeam("B", list(spec_b[0]), *spec_b[1:]))
+        odds = solve_matchup(spec_a, spec_b)
+        self.assertEqual(result, 1)
+        self.assertEqual((odds.wins, odds.draws, odds.losses, odds.rounds), (1.0, 0.0, 0.0, b.rounds))
+
+    def test_against_simulation(self):
+        """Test that the exact odds agree with the results of many simulated battles"""
+        odds = solve_matchup(self.SPEC_A, self.SPEC_B)
+        self.assertAlmostEqual(odds.wins + odds.draws + odds.losses, 1.0)
+        res = simulate_many(self.SPEC_A, self.SPEC_B, 4000, seed=5)
+        self.assertAlmostEqual(res.wins / res.battles, odds.wins, delta=0.02)
+        self.assertAlmostEqual(res.losses / res.battles, odds.losses, delta=0.02)
+        mean_rounds = sum(r * count for r, count in res.rounds.items()) / res.battles
+        self.assertAlmostEqual(mean_rounds, odds.rounds, delta=0.2)
+
+    def test_memo(self):
+        """Test that a solver reuses the states it has solved"""
+        solver = MatchupSolver()
+        odds = solver.solve(self.SPEC_A, self.SPEC_B)
+        states = len(solver.memo)
+        self.assertEqual(solver.solve(self.SPEC_A, self.SPEC_B), odds)
+        self.assertEqual(len(solver.memo), states)
+
+    def test_invalid_specs(self):
+        """Test that teams with another AI or no pokemon raise ValueError"""
+        spec_random = ((1, 1, 1, 1, 1), 0, PokeTeam.AI.RANDOM, None)
+        spec_empty = ((0, 0, 0, 0, 0), 0, PokeTeam.AI.ALWAYS_ATTACK, None)
+        self.assertRaises(ValueError, lambda: solve_matchup(self.SPEC_A, spec_random))
+        self.assertRaises(ValueError, lambda: solve_matchup(spec_empty, self.SPEC_A))
+        self.assertRaises(ValueError, lambda: solve_matchup(self.SPEC_A, ([1, 1, 1, 1, 1], 0)))
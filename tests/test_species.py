@@ -0,0 +1,52 @@
+"""
+This file includes test cases for the species registry and the pokemon created from it.
+"""
+from species import SPECIES, SPECIES_TABLE, TEAM_SPECIES, stats_at
+from pokemon import POKEMON_CLASSES, TEAM_POKEMON, Charmander, Charizard, Gastly, Haunter
+from poke_team import PokeTeam
+from tests.base_test import BaseTest
+
+
+class TestSpecies(BaseTest):
+
+    def test_registry(self):
+        """Test that every species has a class, a unique pokedex number and a registered evolution"""
+        self.assertEqual(sorted(s.pokedex for s in SPECIES_TABLE), list(range(1, len(SPECIES_TABLE) + 1)))
+        for species in SPECIES_TABLE:
+            poke = POKEMON_CLASSES[species.name]()
+            self.assertEqual((poke.get_poke_name(), poke.pokedex, poke.get_level(), poke.get_hp()),
+                             (species.name, species.pokedex, species.level, species.hp))
+            self.assertEqual(poke.can_evolve(), species.evolves_to is not None)
+            if species.can_evolve():
+                self.assertIn(species.evolves_to, SPECIES)
+                self.assertEqual(poke.get_evolved_version().get_poke_name(), species.evolves_to)
+            else:
+                self.assertRaises(Exception, poke.get_evolved_version)
+        self.assertEqual([cls.SPECIES for cls in TEAM_POKEMON], list(TEAM_SPECIES))
+
+    def test_stats_at(self):
+        """Test that the precomputed stats of every level are those of a pokemon levelled up to it"""
+        for species in SPECIES_TABLE:
+            poke = POKEMON_CLASSES[species.name]()
+            for level in range(species.level, species.level + 10):
+                self.assertEqual(stats_at(species, level), (poke.hp, poke.attack_stat, poke.speed_stat, poke.defence))
+                poke.level_up()
+        self.assertRaises(ValueError, lambda: stats_at(SPECIES["Charizard"], 1))
+
+    def test_evolution(self):
+        """Test that evolution keeps the status, hp lost and instance"""
+        c = Charmander(4)
+        c.lose_hp(3)
+        c.status = "burn"
+        evolved = c.get_evolved_version()
+        self.assertIsInstance(evolved, Charizard)
+        self.assertEqual((evolved.status, evolved.hp - evolved.get_hp(), evolved.instance), ("burn", 3, 4))
+        self.assertIsInstance(Gastly().get_evolved_version(), Haunter)
+
+    def test_team_lookup(self):
+        """Test that teams are made of the species of the registry in team_numbers order"""
+        team = PokeTeam("Ash", [1, 1, 1, 1, 1], 1, PokeTeam.AI.ALWAYS_ATTACK)
+        names = []
+        while not team.is_empty():
+            names.append(team.retrieve_pokemon().get_poke_name())
+        self.assertEqual(names, [s.name for s in TEAM_SPECIES])